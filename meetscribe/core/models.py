@@ -7,7 +7,7 @@ These models unify data flow across all pipeline stages.
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -89,6 +89,12 @@ class Decision:
     responsible: Optional[str] = None
     deadline: Optional[str] = None
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Decision":
+        """Create from an LLM response dictionary."""
+        get = data.get
+        return cls(get("description", ""), get("responsible"), get("deadline"))
+
 
 @dataclass
 class ActionItem:
@@ -99,6 +105,12 @@ class ActionItem:
     deadline: Optional[str] = None
     priority: Optional[str] = None
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ActionItem":
+        """Create from an LLM response dictionary."""
+        get = data.get
+        return cls(get("description", ""), get("assignee"), get("deadline"), get("priority"))
+
 
 @dataclass
 class Minutes:
@@ -118,6 +130,29 @@ class Minutes:
     metadata: Dict[str, Any] = field(default_factory=dict)
     generated_at: datetime = field(default_factory=datetime.now)
 
+    @property
+    def generated_at_text(self) -> str:
+        """generated_at formatted as YYYY-MM-DD HH:MM:SS."""
+        return self._generated_at_strings()[1]
+
+    @property
+    def generated_at_iso(self) -> str:
+        """generated_at in ISO 8601 format."""
+        return self._generated_at_strings()[2]
+
+    def _generated_at_strings(self) -> Tuple[datetime, str, str]:
+        """Format generated_at once, recomputing only if it is reassigned."""
+        cached = self.__dict__.get("_generated_at_cache")
+        if cached is None or cached[0] is not self.generated_at:
+            generated_at = self.generated_at
+            cached = (
+                generated_at,
+                generated_at.strftime("%Y-%m-%d %H:%M:%S"),
+                generated_at.isoformat(),
+            )
+            self.__dict__["_generated_at_cache"] = cached
+        return cached
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -140,5 +175,5 @@ class Minutes:
             "participants": self.participants,
             "url": self.url,
             "metadata": self.metadata,
-            "generated_at": self.generated_at.isoformat(),
+            "generated_at": self.generated_at_iso,
         }
@@ -4,9 +4,10 @@ Base provider interfaces for all pipeline layers.
 These abstract classes define the contract for each pipeline stage.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from .models import Minutes, Transcript
 
@@ -134,6 +135,21 @@ class LLMProvider(ABC):
         """
         raise NotImplementedError
 
+    def generate_minutes_batch(self, transcripts: List[Transcript]) -> List[Minutes]:
+        """
+        Generate meeting minutes for several transcripts.
+
+        Providers that can overlap or combine requests override this;
+        the default processes transcripts one at a time.
+
+        Args:
+            transcripts: Transcript objects
+
+        Returns:
+            Minutes objects, in the same order as transcripts
+        """
+        return [self.generate_minutes(transcript) for transcript in transcripts]
+
     def validate_config(self) -> bool:
         """
         Validate LLM configuration.
@@ -180,6 +196,22 @@ class OutputRenderer(ABC):
         """
         raise NotImplementedError
 
+    async def render_async(self, minutes: Minutes, meeting_id: str) -> str:
+        """
+        Render minutes without blocking the event loop.
+
+        The default runs render() in a worker thread, so renderers that spend
+        their time waiting on the network can run concurrently.
+
+        Args:
+            minutes: Minutes object
+            meeting_id: Meeting identifier
+
+        Returns:
+            Path to output file or URL
+        """
+        return await asyncio.to_thread(self.render, minutes, meeting_id)
+
     def validate_config(self) -> bool:
         """
         Validate renderer configuration.
@@ -0,0 +1,216 @@
+"""
+Response cache for LLM providers.
+
+Stores parsed LLM responses on disk keyed by a hash of the request, so
+deterministic requests (temperature 0) can skip the API round-trip.
+Near-duplicate transcripts (e.g. recurring meetings) can optionally be
+matched by shingle similarity.
+"""
+
+import hashlib
+import heapq
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..utils.files import atomic_write
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """
+    Content-addressed file cache for LLM responses.
+
+    Each entry is a JSON file named after the SHA-256 of the request parts.
+    """
+
+    DEFAULT_CACHE_DIR = Path.home() / ".meetscribe" / "cache" / "llm"
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: ~/.meetscribe/cache/llm)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else self.DEFAULT_CACHE_DIR
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a cache key from request parts.
+
+        Args:
+            *parts: Values that fully determine the response (model, prompt, ...)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\x1f")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached response, or None on miss
+        """
+        entry = self.cache_dir / f"{key}.json"
+        try:
+            with open(entry, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {entry}: {e}")
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from make_key()
+            value: Parsed response to store
+        """
+        try:
+            atomic_write(self.cache_dir / f"{key}.json", json.dumps(value, ensure_ascii=False))
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {key}: {e}")
+
+
+class SimilarityCache:
+    """
+    Near-duplicate lookup for LLM responses.
+
+    Transcripts are reduced to bottom-k MinHash sketches of word shingles.
+    A lookup returns the stored response of the most similar earlier
+    transcript when the estimated Jaccard similarity reaches the threshold.
+    """
+
+    SHINGLE_SIZE = 5
+    SKETCH_SIZE = 128
+    INDEX_FILENAME = "similarity_index.json"
+
+    def __init__(self, cache_dir: Optional[Path] = None, threshold: float = 0.9):
+        """
+        Initialize similarity cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: ~/.meetscribe/cache/llm)
+            threshold: Minimum estimated Jaccard similarity for a hit (0-1)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else LLMCache.DEFAULT_CACHE_DIR
+        self.threshold = threshold
+        self.index_path = self.cache_dir / self.INDEX_FILENAME
+        self._responses = LLMCache(self.cache_dir)
+        self._index: Optional[List[Dict[str, Any]]] = None
+
+    @classmethod
+    def sketch(cls, text: str) -> List[int]:
+        """
+        Compute the bottom-k MinHash sketch of a text.
+
+        Args:
+            text: Transcript text
+
+        Returns:
+            Sorted list of the smallest shingle hashes
+        """
+        words = text.lower().split()
+        size = cls.SHINGLE_SIZE
+        shingles = {" ".join(words[i : i + size]) for i in range(max(len(words) - size + 1, 1))}
+        hashes = {
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+            for s in shingles
+        }
+        return heapq.nsmallest(cls.SKETCH_SIZE, hashes)
+
+    @classmethod
+    def similarity(cls, a: List[int], b: List[int]) -> float:
+        """
+        Estimate Jaccard similarity from two sketches.
+
+        Args:
+            a: Sketch from sketch()
+            b: Sketch from sketch()
+
+        Returns:
+            Estimated similarity (0-1)
+        """
+        if not a or not b:
+            return 0.0
+
+        set_a, set_b = set(a), set(b)
+        union = heapq.nsmallest(cls.SKETCH_SIZE, set_a | set_b)
+        shared = set_a & set_b
+        return sum(1 for h in union if h in shared) / len(union)
+
+    def get(self, scope: str, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the response of the most similar cached transcript.
+
+        Args:
+            scope: Key of the settings the response depends on (model, prompt, ...)
+            text: Transcript text
+
+        Returns:
+            Cached response, or None if nothing is similar enough
+        """
+        sketch = self.sketch(text)
+        best_key, best_score = None, self.threshold
+        for entry in self._load_index():
+            if entry["scope"] != scope:
+                continue
+            score = self.similarity(sketch, entry["sketch"])
+            if score >= best_score:
+                best_key, best_score = entry["key"], score
+
+        if best_key is None:
+            return None
+
+        logger.debug(f"Similarity cache hit ({best_score:.2f})")
+        return self._responses.get(best_key)
+
+    def set(self, scope: str, text: str, value: Dict[str, Any]):
+        """
+        Store a response for later near-duplicate lookups.
+
+        Args:
+            scope: Key of the settings the response depends on
+            text: Transcript text
+            value: Parsed response to store
+        """
+        key = LLMCache.make_key(scope, text)
+        self._responses.set(key, value)
+
+        index = self._load_index()
+        if any(entry["key"] == key for entry in index):
+            return
+        index.append({"scope": scope, "key": key, "sketch": self.sketch(text)})
+        try:
+            atomic_write(self.index_path, json.dumps(index))
+        except OSError as e:
+            logger.warning(f"Failed to write similarity index: {e}")
+
+    def _load_index(self) -> List[Dict[str, Any]]:
+        """Load the sketch index from disk once."""
+        if self._index is None:
+            try:
+                with open(self.index_path, encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except FileNotFoundError:
+                self._index = []
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable similarity index: {e}")
+                self._index = []
+        return self._index
@@ -11,6 +11,7 @@ from typing import Any, Dict
 
 from ..core.models import ActionItem, Decision, Minutes, Transcript
 from ..core.providers import LLMProvider
+from .parsing import extract_json_object
 
 logger = logging.getLogger(__name__)
 
@@ -156,15 +157,10 @@ Be thorough but concise. Extract all actionable items and decisions."""
 
     def _extract_json_from_text(self, text: str) -> Dict[str, Any]:
         """Extract JSON from text response."""
-        import re
-
         # Try to find JSON block
-        json_match = re.search(r"\{[\s\S]*\}", text)
-        if json_match:
-            try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
-                pass
+        result = extract_json_object(text)
+        if result is not None:
+            return result
 
         # Fallback: create structured response from text
         return {
@@ -232,23 +228,8 @@ Be thorough but concise. Extract all actionable items and decisions."""
         return Minutes(
             meeting_id=transcript.meeting_info.meeting_id,
             summary=result.get("summary", ""),
-            decisions=[
-                Decision(
-                    description=d.get("description", ""),
-                    responsible=d.get("responsible"),
-                    deadline=d.get("deadline"),
-                )
-                for d in result.get("decisions", [])
-            ],
-            action_items=[
-                ActionItem(
-                    description=a.get("description", ""),
-                    assignee=a.get("assignee"),
-                    deadline=a.get("deadline"),
-                    priority=a.get("priority"),
-                )
-                for a in result.get("action_items", [])
-            ],
+            decisions=[Decision.from_dict(d) for d in result.get("decisions", [])],
+            action_items=[ActionItem.from_dict(a) for a in result.get("action_items", [])],
             key_points=result.get("key_points", []),
             participants=result.get("participants", transcript.meeting_info.participants),
             metadata={
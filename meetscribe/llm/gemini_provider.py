@@ -7,14 +7,66 @@ Uses Google's Gemini models for meeting minutes generation.
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from ..core.models import ActionItem, Decision, Minutes, Transcript
 from ..core.providers import LLMProvider
+from ..utils.retry import retry_with_backoff
+from .cache import LLMCache, SimilarityCache
+from .parsing import extract_json_object
 
 logger = logging.getLogger(__name__)
 
+# Audio MIME types accepted by the Gemini File API
+_MIME_TYPES = {
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+    ".m4a": "audio/mp4",
+    ".flac": "audio/flac",
+    ".ogg": "audio/ogg",
+    ".webm": "audio/webm",
+}
+
+
+def _token_bound(text: str) -> int:
+    """
+    Upper bound on the token count of text, without calling the API.
+
+    The tokenizer falls back to single bytes, so a token never covers less
+    than one UTF-8 byte, even where a character takes several tokens (CJK).
+    """
+    return len(text.encode("utf-8"))
+
+
+def _get_model(api_key: str, model_name: str):
+    """
+    Configure the genai module with api_key and create a GenerativeModel.
+
+    genai.configure sets process-wide state and models pick up the default
+    client lazily, so models are not shared between API keys.
+    """
+    import google.generativeai as genai
+
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+
+def _make_generation_config(genai: Any, **kwargs: Any) -> Any:
+    """
+    Build a generation config as a ready protobuf message.
+
+    The SDK converts GenerationConfig objects to protobuf on every request;
+    passing the message itself skips that step. SDK versions without
+    ``genai.protos`` fall back to GenerationConfig.
+    """
+    protos = getattr(genai, "protos", None)
+    if protos is not None:
+        return protos.GenerationConfig(**kwargs)
+    return genai.GenerationConfig(**kwargs)
+
 
 class GeminiProvider(LLMProvider):
     """
@@ -42,6 +94,15 @@ Your response must be a valid JSON object with this structure:
 
 Be thorough and accurate. Focus on extracting actionable insights."""
 
+    # Prompt for condensing transcript chunks that exceed the context budget
+    CONDENSE_PROMPT = """Condense the following part of a meeting transcript. Keep every decision, action item, deadline, owner, and key discussion point, and keep speaker names. Drop small talk and repetition. Respond with plain text only.
+
+Transcript part:
+"""
+
+    # Instructions appended to the system prompt when several meetings share a request
+    BATCH_INSTRUCTIONS = """You will receive {count} separate meeting transcripts, each introduced by a "--- MEETING n ---" marker. Analyze each meeting independently and respond with a JSON object of the form {{"minutes": [...]}} containing exactly {count} objects in the structure above, in the same order as the meetings."""
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize Gemini provider.
@@ -53,6 +114,19 @@ Be thorough and accurate. Focus on extracting actionable insights."""
             max_output_tokens: Maximum response tokens
             system_prompt: Custom system prompt
             process_audio_directly: Process audio file directly (default: False)
+            stream: Stream the response as it is generated (default: True)
+            cache: Cache responses on disk when temperature is 0 (default: True)
+            cache_dir: Response cache directory (default: ~/.meetscribe/cache/llm)
+            similarity_cache: Reuse responses of near-duplicate transcripts (default: False)
+            similarity_threshold: Minimum similarity for a near-duplicate hit (default: 0.9)
+            max_retries: Retries for rate-limited or unavailable calls (default: 5)
+            max_input_tokens: Prompt token budget before the transcript is condensed
+                (default: 800000 for pro models, 120000 otherwise; 0 disables)
+            condense_model: Model used to condense over-budget transcripts
+                (default: gemini-1.5-flash)
+            condense_concurrency: Parallel condense requests (default: 4)
+            batch_size: Maximum transcripts packed into one request by
+                generate_minutes_batch (default: 4)
         """
         super().__init__(config)
 
@@ -62,9 +136,40 @@ Be thorough and accurate. Focus on extracting actionable insights."""
         self.max_output_tokens = config.get("max_output_tokens", 8192)
         self.system_prompt = config.get("system_prompt", self.DEFAULT_SYSTEM_PROMPT)
         self.process_audio_directly = config.get("process_audio_directly", False)
+        self.stream = config.get("stream", True)
+        self.max_retries = config.get("max_retries", 5)
+        self.max_input_tokens = config.get(
+            "max_input_tokens", 800_000 if "pro" in self.model else 120_000
+        )
+        self.condense_model = config.get("condense_model", "gemini-1.5-flash")
+        self.condense_concurrency = config.get("condense_concurrency", 4)
+        self.batch_size = config.get("batch_size", 4)
+
+        # Only deterministic responses are safe to replay
+        self.cache = None
+        if config.get("cache", True) and self.temperature == 0:
+            self.cache = LLMCache(config.get("cache_dir"))
+
+        self.similarity_cache = None
+        if config.get("similarity_cache", False):
+            self.similarity_cache = SimilarityCache(
+                config.get("cache_dir"), config.get("similarity_threshold", 0.9)
+            )
+            self._similarity_scope = LLMCache.make_key(
+                self.model, self.temperature, self.max_output_tokens, self.system_prompt
+            )
+
+        # Prompt parts that do not change between calls
+        self._prompt_prefix = f"{self.system_prompt}\n\nMeeting Transcript:\n"
+        self._audio_prompt = (
+            "Analyze this meeting audio recording and generate structured meeting minutes.\n\n"
+            f"{self.system_prompt}\n\n"
+            "Please listen to the audio carefully and extract all key information."
+        )
 
         # Initialize client
         self.client = None
+        self._gen_config = None
         self._init_client()
 
     def _init_client(self):
@@ -76,8 +181,13 @@ Be thorough and accurate. Focus on extracting actionable insights."""
         try:
             import google.generativeai as genai
 
-            genai.configure(api_key=self.api_key)
-            self.client = genai.GenerativeModel(self.model)
+            self.client = _get_model(self.api_key, self.model)
+            self._gen_config = _make_generation_config(
+                genai,
+                temperature=self.temperature,
+                max_output_tokens=self.max_output_tokens,
+                response_mime_type="application/json",
+            )
             logger.info(f"Gemini client initialized with model: {self.model}")
         except ImportError:
             logger.error("google-generativeai not installed. Run: pip install google-generativeai")
@@ -120,36 +230,250 @@ Be thorough and accurate. Focus on extracting actionable insights."""
         )
         return minutes
 
+    def generate_minutes_batch(self, transcripts: List[Transcript]) -> List[Minutes]:
+        """
+        Generate meeting minutes for several transcripts.
+
+        Text transcripts are greedily packed, up to batch_size per request and
+        within the input token budget, into a single request that returns one
+        minutes object per meeting. Batches that fail to parse fall back to
+        one request per transcript.
+
+        Args:
+            transcripts: Transcript objects
+
+        Returns:
+            Minutes objects, in the same order as transcripts
+        """
+        if not self.client or self.batch_size <= 1:
+            return super().generate_minutes_batch(transcripts)
+
+        results: List[Optional[Minutes]] = [None] * len(transcripts)
+        batch: List[int] = []
+        batch_tokens = 0
+        # Sections are measured as assembled, numbered as the largest batch would be
+        budget = 0
+        if self.max_input_tokens:
+            budget = self.max_input_tokens - _token_bound(self._packed_header(self.batch_size))
+
+        def flush():
+            packed = self._generate_packed([transcripts[i] for i in batch])
+            for index, minutes in zip(batch, packed):
+                results[index] = minutes
+
+        for index, transcript in enumerate(transcripts):
+            text = transcript.get_full_text()
+            packable = text and not (
+                self.process_audio_directly
+                and transcript.audio_path
+                and transcript.audio_path.exists()
+            )
+            if not packable:
+                results[index] = self.generate_minutes(transcript)
+                continue
+            tokens = _token_bound(
+                self._packed_section(self.batch_size, text, transcript.meeting_info.participants)
+            )
+            if budget and tokens > budget:
+                results[index] = self.generate_minutes(transcript)
+                continue
+
+            batch_full = len(batch) >= self.batch_size or (
+                budget and batch_tokens + tokens > budget
+            )
+            if batch and batch_full:
+                flush()
+                batch, batch_tokens = [], 0
+            batch.append(index)
+            batch_tokens += tokens
+
+        if batch:
+            flush()
+
+        return results
+
+    def _generate_packed(self, transcripts: List[Transcript]) -> List[Minutes]:
+        """
+        Generate minutes for several transcripts with one request.
+
+        Args:
+            transcripts: Transcripts that fit together in one prompt
+
+        Returns:
+            Minutes objects, in the same order as transcripts
+        """
+        if len(transcripts) == 1:
+            return [self.generate_minutes(transcripts[0])]
+
+        logger.info(f"Generating minutes for {len(transcripts)} meetings in one Gemini request")
+
+        parts = [self._packed_header(len(transcripts))]
+        for number, transcript in enumerate(transcripts, 1):
+            parts.append(
+                self._packed_section(
+                    number, transcript.get_full_text(), transcript.meeting_info.participants
+                )
+            )
+
+        try:
+            content = self._call_with_retry("".join(parts))
+            try:
+                response = json.loads(content)
+            except json.JSONDecodeError:
+                response = extract_json_object(content)
+            items = response.get("minutes") if isinstance(response, dict) else None
+            if (
+                not isinstance(items, list)
+                or len(items) != len(transcripts)
+                or not all(isinstance(item, dict) for item in items)
+            ):
+                raise ValueError("batched response does not match the number of meetings")
+        except Exception as e:
+            logger.warning(f"Batched generation failed ({e}); processing meetings individually")
+            return [self.generate_minutes(transcript) for transcript in transcripts]
+
+        return [self._parse_result(item, t) for item, t in zip(items, transcripts)]
+
+    def _packed_header(self, count: int) -> str:
+        """Build the instructions that open a packed prompt for count meetings."""
+        return f"{self.system_prompt}\n\n{self.BATCH_INSTRUCTIONS.format(count=count)}"
+
+    @staticmethod
+    def _packed_section(number: int, text: str, participants: List[str]) -> str:
+        """Build one meeting's section of a packed prompt."""
+        section = f"\n\n--- MEETING {number} ---\n{text}"
+        if participants:
+            section += "\n\nKnown participants: " + ", ".join(participants)
+        return section
+
     def _generate_with_api(self, text: str, transcript: Transcript) -> Dict[str, Any]:
         """Generate using text API."""
-        import google.generativeai as genai
-
         logger.info(f"Calling Gemini API ({self.model})")
 
         # Build prompt
-        prompt = f"{self.system_prompt}\n\nMeeting Transcript:\n{text}"
-
-        if transcript.meeting_info.participants:
-            prompt += f"\n\nKnown participants: {', '.join(transcript.meeting_info.participants)}"
-
-        # Configure generation
-        gen_config = genai.GenerationConfig(
-            temperature=self.temperature,
-            max_output_tokens=self.max_output_tokens,
-            response_mime_type="application/json",
-        )
+        participants = transcript.meeting_info.participants
+        prompt = self._build_prompt(text, participants)
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = LLMCache.make_key(
+                self.model, self.temperature, self.max_output_tokens, prompt
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("Using cached Gemini response")
+                return cached
+
+        if self.similarity_cache is not None:
+            cached = self.similarity_cache.get(self._similarity_scope, text)
+            if cached is not None:
+                logger.info("Using cached Gemini response for a near-duplicate transcript")
+                return cached
+
+        # Condense transcripts that do not fit the context budget
+        condensed = self._fit_to_context(text, prompt)
+        if condensed is not None:
+            prompt = self._build_prompt(condensed, participants)
 
         # Generate
-        response = self.client.generate_content(prompt, generation_config=gen_config)
-
-        # Parse response
-        content = response.text
+        content = self._call_with_retry(prompt)
 
         try:
-            return json.loads(content)
+            result = json.loads(content)
         except json.JSONDecodeError:
             logger.warning("Response is not valid JSON, attempting to parse")
-            return self._extract_json_from_text(content)
+            result = self._extract_json_from_text(content)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+        if self.similarity_cache is not None:
+            self.similarity_cache.set(self._similarity_scope, text, result)
+        return result
+
+    def _build_prompt(self, text: str, participants: List[str]) -> str:
+        """Build the text prompt from the precomputed prefix."""
+        if participants:
+            return "".join(
+                (self._prompt_prefix, text, "\n\nKnown participants: ", ", ".join(participants))
+            )
+        return self._prompt_prefix + text
+
+    def _fit_to_context(self, text: str, prompt: str) -> Optional[str]:
+        """
+        Condense the transcript if the prompt exceeds the token budget.
+
+        Chunks are condensed in parallel with a cheaper model (map step);
+        the condensed parts are then structured by the main model (reduce step).
+
+        Args:
+            text: Transcript text
+            prompt: Full prompt built from text
+
+        Returns:
+            Condensed transcript, or None if the prompt already fits
+        """
+        # Prompts that fit even at one token per byte skip the count
+        if not self.max_input_tokens or _token_bound(prompt) <= self.max_input_tokens:
+            return None
+
+        total_tokens = self.client.count_tokens(prompt).total_tokens
+        if total_tokens <= self.max_input_tokens:
+            return None
+
+        import google.generativeai as genai
+
+        # Size chunks to about half the budget, using the observed chars-per-token ratio
+        chunk_chars = max(int(self.max_input_tokens * len(prompt) / total_tokens) // 2, 1)
+        chunks = self._split_transcript(text, chunk_chars)
+        logger.info(
+            f"Prompt has {total_tokens} tokens (budget {self.max_input_tokens}); "
+            f"condensing {len(chunks)} chunks with {self.condense_model}"
+        )
+
+        model = _get_model(self.api_key, self.condense_model)
+        config = _make_generation_config(genai, temperature=0)
+
+        def condense(chunk: str) -> str:
+            return retry_with_backoff(
+                lambda: model.generate_content(
+                    self.CONDENSE_PROMPT + chunk, generation_config=config
+                ).text,
+                max_attempts=self.max_retries + 1,
+                get_retry_after=self._get_retry_after,
+            )
+
+        with ThreadPoolExecutor(max_workers=min(self.condense_concurrency, len(chunks))) as pool:
+            return "\n".join(pool.map(condense, chunks))
+
+    @staticmethod
+    def _split_transcript(text: str, max_chars: int) -> List[str]:
+        """
+        Split a transcript into chunks at line (speaker turn) boundaries.
+
+        Args:
+            text: Transcript text
+            max_chars: Maximum characters per chunk
+
+        Returns:
+            List of chunks; single lines longer than max_chars are hard-split
+        """
+        chunks: List[str] = []
+        current: List[str] = []
+        size = 0
+
+        for line in text.splitlines():
+            while len(line) > max_chars:
+                chunks.append(line[:max_chars])
+                line = line[max_chars:]
+            if current and size + len(line) + 1 > max_chars:
+                chunks.append("\n".join(current))
+                current, size = [], 0
+            current.append(line)
+            size += len(line) + 1
+
+        if current:
+            chunks.append("\n".join(current))
+        return chunks
 
     def _generate_from_audio(self, transcript: Transcript) -> Dict[str, Any]:
         """Generate directly from audio file."""
@@ -159,65 +483,90 @@ Be thorough and accurate. Focus on extracting actionable insights."""
 
         audio_path = transcript.audio_path
 
-        # Upload audio file
+        # Upload audio file (the File API uses the module-wide key)
+        genai.configure(api_key=self.api_key)
         audio_file = genai.upload_file(
             path=str(audio_path), mime_type=self._get_mime_type(audio_path)
         )
 
-        # Build prompt
-        prompt = f"""Analyze this meeting audio recording and generate structured meeting minutes.
+        # Generate (the stream is drained before the uploaded file is removed)
+        content = self._call_with_retry([self._audio_prompt, audio_file])
 
-{self.system_prompt}
+        # Clean up uploaded file off the critical path
+        threading.Thread(
+            target=self._delete_uploaded_file, args=(audio_file.name,), name="gemini-file-cleanup"
+        ).start()
 
-Please listen to the audio carefully and extract all key information."""
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError:
+            return self._extract_json_from_text(content)
 
-        # Configure generation
-        gen_config = genai.GenerationConfig(
-            temperature=self.temperature,
-            max_output_tokens=self.max_output_tokens,
-            response_mime_type="application/json",
-        )
+    def _call_with_retry(self, contents: Any) -> str:
+        """
+        Call generate_content, retrying rate-limit and server errors.
 
-        # Generate
-        response = self.client.generate_content([prompt, audio_file], generation_config=gen_config)
+        Args:
+            contents: Prompt or list of prompt parts
 
-        # Clean up uploaded file
-        try:
-            genai.delete_file(audio_file.name)
-        except Exception:
-            pass
+        Returns:
+            Full response text
+        """
+
+        def call() -> str:
+            response = self.client.generate_content(
+                contents, generation_config=self._gen_config, stream=self.stream
+            )
+            return self._read_response_text(response)
 
-        # Parse response
-        content = response.text
+        return retry_with_backoff(
+            call, max_attempts=self.max_retries + 1, get_retry_after=self._get_retry_after
+        )
 
+    @staticmethod
+    def _get_retry_after(error: Exception) -> Optional[float]:
+        """Read the server-suggested retry delay from a quota error, if any."""
+        retry_delay = getattr(error, "retry_delay", None)
+        if retry_delay is None:
+            return None
+        if hasattr(retry_delay, "total_seconds"):
+            return retry_delay.total_seconds()
+        return float(getattr(retry_delay, "seconds", retry_delay))
+
+    def _delete_uploaded_file(self, name: str):
+        """Delete a file uploaded to the Gemini File API, ignoring failures."""
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            return self._extract_json_from_text(content)
+            import google.generativeai as genai
+
+            genai.delete_file(name)
+        except Exception as e:
+            logger.debug(f"Failed to delete uploaded file {name}: {e}")
+
+    def _read_response_text(self, response: Any) -> str:
+        """
+        Collect response text, consuming streamed chunks as they arrive.
+
+        Args:
+            response: Gemini response (streamed or complete)
+
+        Returns:
+            Full response text
+        """
+        if not self.stream:
+            return response.text
+
+        return "".join(chunk.text for chunk in response)
 
     def _get_mime_type(self, audio_path: Path) -> str:
         """Get MIME type for audio file."""
-        mime_types = {
-            ".mp3": "audio/mpeg",
-            ".wav": "audio/wav",
-            ".m4a": "audio/mp4",
-            ".flac": "audio/flac",
-            ".ogg": "audio/ogg",
-            ".webm": "audio/webm",
-        }
-        return mime_types.get(audio_path.suffix.lower(), "audio/mpeg")
+        return _MIME_TYPES.get(audio_path.suffix.lower(), "audio/mpeg")
 
     def _extract_json_from_text(self, text: str) -> Dict[str, Any]:
         """Extract JSON from text response."""
-        import re
-
         # Try to find JSON block
-        json_match = re.search(r"\{[\s\S]*\}", text)
-        if json_match:
-            try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
-                pass
+        result = extract_json_object(text)
+        if result is not None:
+            return result
 
         # Fallback
         return {
@@ -285,23 +634,8 @@ Please listen to the audio carefully and extract all key information."""
         return Minutes(
             meeting_id=transcript.meeting_info.meeting_id,
             summary=result.get("summary", ""),
-            decisions=[
-                Decision(
-                    description=d.get("description", ""),
-                    responsible=d.get("responsible"),
-                    deadline=d.get("deadline"),
-                )
-                for d in result.get("decisions", [])
-            ],
-            action_items=[
-                ActionItem(
-                    description=a.get("description", ""),
-                    assignee=a.get("assignee"),
-                    deadline=a.get("deadline"),
-                    priority=a.get("priority"),
-                )
-                for a in result.get("action_items", [])
-            ],
+            decisions=[Decision.from_dict(d) for d in result.get("decisions", [])],
+            action_items=[ActionItem.from_dict(a) for a in result.get("action_items", [])],
             key_points=result.get("key_points", []),
             participants=result.get("participants", transcript.meeting_info.participants),
             metadata={
@@ -6,9 +6,11 @@ Creates a new NotebookLM notebook with audio/transcript and generates meeting mi
 
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from ..core.models import ActionItem, Decision, Minutes, Transcript
 from ..core.providers import LLMProvider
@@ -32,6 +34,8 @@ class NotebookLMProvider(LLMProvider):
             project_id: Google Cloud project ID (optional)
             service_account_path: Path to service account JSON (optional)
             notebook_title_prefix: Prefix for notebook titles (default: "Meeting")
+            max_concurrency: Notebooks processed in parallel by
+                generate_minutes_batch (default: 4)
         """
         super().__init__(config)
 
@@ -41,6 +45,7 @@ class NotebookLMProvider(LLMProvider):
         self.service_account_path = config.get("service_account_path")
 
         self.notebook_title_prefix = config.get("notebook_title_prefix", "Meeting")
+        self.max_concurrency = config.get("max_concurrency", 4)
 
         # Initialize client
         self.client = None
@@ -100,23 +105,8 @@ class NotebookLMProvider(LLMProvider):
         minutes = Minutes(
             meeting_id=meeting_id,
             summary=analysis.get("summary", "Meeting summary pending..."),
-            decisions=[
-                Decision(
-                    description=d["description"],
-                    responsible=d.get("responsible"),
-                    deadline=d.get("deadline"),
-                )
-                for d in analysis.get("decisions", [])
-            ],
-            action_items=[
-                ActionItem(
-                    description=a["description"],
-                    assignee=a.get("assignee"),
-                    deadline=a.get("deadline"),
-                    priority=a.get("priority"),
-                )
-                for a in analysis.get("action_items", [])
-            ],
+            decisions=[Decision.from_dict(d) for d in analysis.get("decisions", [])],
+            action_items=[ActionItem.from_dict(a) for a in analysis.get("action_items", [])],
             key_points=analysis.get("key_points", []),
             participants=transcript.meeting_info.participants,
             url=notebook_url,
@@ -131,6 +121,27 @@ class NotebookLMProvider(LLMProvider):
         logger.info(f"Minutes generated successfully: {notebook_url}")
         return minutes
 
+    def generate_minutes_batch(self, transcripts: List[Transcript]) -> List[Minutes]:
+        """
+        Generate meeting minutes for several transcripts concurrently.
+
+        Each notebook's create → upload → analyze chain is sequential, but
+        chains for different meetings run in parallel so their network
+        round-trips overlap.
+
+        Args:
+            transcripts: Transcript objects
+
+        Returns:
+            Minutes objects, in the same order as transcripts
+        """
+        if len(transcripts) <= 1 or self.max_concurrency <= 1:
+            return super().generate_minutes_batch(transcripts)
+
+        workers = min(self.max_concurrency, len(transcripts))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.generate_minutes, transcripts))
+
     def _create_notebook(self, title: str, transcript: Transcript) -> str:
         """
         Create a new NotebookLM notebook.
@@ -225,17 +236,21 @@ class MockNotebookLMClient:
 
     def __init__(self):
         self.notebook_counter = 0
+        self._lock = threading.Lock()
 
     def create_notebook(self, title: str) -> str:
         """Create a mock notebook."""
-        self.notebook_counter += 1
-        notebook_id = f"nb_{self.notebook_counter}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        with self._lock:
+            self.notebook_counter += 1
+            counter = self.notebook_counter
+        notebook_id = f"nb_{counter}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
         return f"https://notebooklm.google.com/notebook/{notebook_id}"
 
     def upload_audio(self, notebook_url: str, audio_path: Path):
         """Mock audio upload."""
         logger.info(f"[MOCK] Uploading audio: {audio_path.name} to {notebook_url}")
-        # In production, implement actual upload
+        # In production, stream iter_file_chunks(audio_path) as the request body
+        # instead of reading the whole file into memory
 
     def upload_text(self, notebook_url: str, text: str):
         """Mock text upload."""
@@ -0,0 +1,61 @@
+"""
+Response parsing helpers for LLM providers.
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract a JSON object embedded in free-form LLM output.
+
+    Tries the span from the first ``{`` to the last ``}`` first, then the
+    first balanced object found by a single linear scan that respects
+    string literals and escapes. Runs in O(n) with no regex backtracking.
+
+    Args:
+        text: LLM response text
+
+    Returns:
+        Parsed object, or None if no valid JSON object is found
+    """
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end <= start:
+        return None
+
+    try:
+        result = json.loads(text[start : end + 1])
+        if isinstance(result, dict):
+            return result
+    except json.JSONDecodeError:
+        pass
+
+    # Fall back to the first balanced object
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, end + 1):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                try:
+                    result = json.loads(text[start : i + 1])
+                except json.JSONDecodeError:
+                    return None
+                return result if isinstance(result, dict) else None
+
+    return None
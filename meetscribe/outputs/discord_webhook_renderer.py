@@ -4,17 +4,127 @@ Discord Webhook OUTPUT renderer for MeetScribe.
 Posts meeting minutes to Discord channels via webhooks.
 """
 
-import json
+import atexit
 import logging
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
 
 from ..core.models import Minutes
 from ..core.providers import OutputRenderer
+from ..utils.files import atomic_write
+from ..utils.serialization import dumps_json
 
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeout for webhook requests in seconds
+WEBHOOK_TIMEOUT = (3.05, 10)
+
+# Background sender shared by all renderers with background=True
+_send_pool: Optional[ThreadPoolExecutor] = None
+_send_pool_lock = threading.Lock()
+
+# Pooled HTTP sessions shared by all renderers, keyed by webhook host
+_sessions: Dict[str, Any] = {}
+_sessions_lock = threading.Lock()
+
+
+def _get_session(url: str):
+    """
+    Get a pooled requests session for a webhook URL.
+
+    Sessions are shared across renderer instances posting to the same host,
+    so keep-alive connections are reused instead of reconnecting per post.
+    Only responses that guarantee the message was not posted, rate limits
+    (429) and 503, are retried with backoff, honoring Retry-After. 502, 504
+    and read timeouts may follow a successful post, so they are not retried.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    host = urlsplit(url).netloc
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            retry = Retry(
+                total=3,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=(429, 503),
+                allowed_methods=frozenset({"POST"}),
+                respect_retry_after_header=True,
+            )
+            session = requests.Session()
+            session.mount(
+                "https://", HTTPAdapter(pool_connections=10, pool_maxsize=100, max_retries=retry)
+            )
+            _sessions[host] = session
+        return session
+
+
+def _get_send_pool() -> ThreadPoolExecutor:
+    """
+    Get the background thread pool for webhook sends.
+
+    Created on first use, sized by MEETSCRIBE_WEBHOOK_WORKERS (default 8),
+    and drained at interpreter exit so queued messages are not lost.
+    """
+    global _send_pool
+    with _send_pool_lock:
+        if _send_pool is None:
+            _send_pool = ThreadPoolExecutor(
+                max_workers=int(os.getenv("MEETSCRIBE_WEBHOOK_WORKERS", "8")),
+                thread_name_prefix="meetscribe-webhook",
+            )
+            atexit.register(_send_pool.shutdown, wait=True)
+        return _send_pool
+
+
+@lru_cache(maxsize=1)
+def _get_httpx_client():
+    """
+    Get the shared httpx client used when requests is not installed.
+
+    Connections are pooled across posts and, when the h2 package is
+    available, concurrent posts to the same host share one HTTP/2 connection.
+    """
+    import httpx
+
+    try:
+        import h2  # noqa: F401
+
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    connect_timeout, read_timeout = WEBHOOK_TIMEOUT
+    return httpx.Client(http2=http2, timeout=httpx.Timeout(read_timeout, connect=connect_timeout))
+
+
+@lru_cache(maxsize=1)
+def _http_backend() -> Optional[str]:
+    """Detect the installed HTTP library once ("requests", "httpx" or None)."""
+    try:
+        import requests
+
+        return "requests"
+    except ImportError:
+        try:
+            import httpx
+
+            return "httpx"
+        except ImportError:
+            logger.warning(
+                "No HTTP library available. Run: pip install requests\n" "Running in mock mode."
+            )
+            return None
+
 
 class DiscordWebhookRenderer(OutputRenderer):
     """
@@ -30,6 +140,16 @@ class DiscordWebhookRenderer(OutputRenderer):
     MAX_FIELD_VALUE_LENGTH = 1024
     MAX_FIELDS = 25
     MAX_EMBED_TOTAL = 6000
+    MAX_EMBEDS_PER_MESSAGE = 10
+
+    # Marker appended to truncated text
+    _ELLIPSIS = "…"
+
+    # Footer shared by all main embeds (never mutated)
+    _FOOTER = {"text": "Generated by MeetScribe"}
+
+    # Action item priority markers
+    _PRIORITY_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢"}
 
     def __init__(self, config: Dict[str, Any]):
         """
@@ -44,6 +164,8 @@ class DiscordWebhookRenderer(OutputRenderer):
             include_decisions: Include decisions in embed
             mention_roles: List of role IDs to mention
             mention_users: List of user IDs to mention
+            background: Send from a background thread pool; render() returns
+                immediately and flush_pending() waits for the results
             output_dir: Directory for local backup
         """
         super().__init__(config)
@@ -56,64 +178,147 @@ class DiscordWebhookRenderer(OutputRenderer):
         self.include_decisions = config.get("include_decisions", True)
         self.mention_roles = config.get("mention_roles", [])
         self.mention_users = config.get("mention_users", [])
+        self._mentions_prefix = (
+            " ".join(
+                [
+                    *(f"<@&{role_id}>" for role_id in self.mention_roles),
+                    *(f"<@{user_id}>" for user_id in self.mention_users),
+                ]
+            )
+            or None
+        )
+        self.background = config.get("background", False)
         self.output_dir = Path(config.get("output_dir", "./meetings"))
 
         # Check for requests library
-        self._http_available = self._check_http_library()
+        self._http_backend = _http_backend()
+        self._http_available = self._http_backend is not None
 
-    def _check_http_library(self) -> bool:
-        """Check if HTTP library is available."""
-        try:
-            import requests
+        # Embeds queued by render(defer=True), sent by flush()
+        self._pending_embeds: List[List[Dict[str, Any]]] = []
 
-            return True
-        except ImportError:
-            try:
-                import httpx
+        # Sends submitted to the background pool, collected by flush_pending()
+        self._pending_sends: List[Future] = []
 
-                return True
-            except ImportError:
-                logger.warning(
-                    "No HTTP library available. Run: pip install requests\n" "Running in mock mode."
-                )
-                return False
+        # Monotonic time until which the webhook bucket is exhausted
+        self._rate_limit_reset_at = 0.0
 
-    def render(self, minutes: Minutes, meeting_id: str) -> str:
+    def render(self, minutes: Minutes, meeting_id: str, defer: bool = False) -> str:
         """
         Render minutes to Discord webhook.
 
         Args:
             minutes: Minutes object
             meeting_id: Meeting identifier
+            defer: Queue the embeds and send them with the next flush()
 
         Returns:
             Message ID or local backup path
         """
         logger.info(f"Rendering Discord webhook output for {meeting_id}")
 
+        # Mock mode never sends, so skip building embeds
+        if not (self.webhook_url and self._http_available):
+            return self._save_mock_output(minutes, meeting_id)
+
         # Build webhook payload
         payload = self._build_payload(minutes, meeting_id)
 
+        if defer:
+            self._pending_embeds.append(payload["embeds"])
+            return "Message queued"
+
+        if self.background:
+            self._pending_sends.append(_get_send_pool().submit(self._send_webhook, payload))
+            return "Message queued"
+
         # Send to webhook
-        if self.webhook_url and self._http_available:
-            result = self._send_webhook(payload)
-        else:
-            result = self._save_mock_output(minutes, meeting_id, payload)
+        result = self._send_webhook(payload)
 
         logger.info(f"Discord webhook result: {result}")
         return result
 
-    def _build_payload(self, minutes: Minutes, meeting_id: str) -> Dict[str, Any]:
-        """Build Discord webhook payload."""
-        # Build mentions
-        mentions = []
-        for role_id in self.mention_roles:
-            mentions.append(f"<@&{role_id}>")
-        for user_id in self.mention_users:
-            mentions.append(f"<@{user_id}>")
+    def render_many(self, minutes_list: List[Minutes]) -> List[str]:
+        """
+        Render several meetings, packing their embeds into as few messages as possible.
+
+        Args:
+            minutes_list: Minutes objects
+
+        Returns:
+            One result per sent message (or per local backup in mock mode)
+        """
+        results = [self.render(minutes, minutes.meeting_id, defer=True) for minutes in minutes_list]
+        if not self._pending_embeds:
+            return results
+        return self.flush()
+
+    def flush(self) -> List[str]:
+        """
+        Send queued embeds.
+
+        Each meeting's embeds stay in one message; messages hold at most
+        MAX_EMBEDS_PER_MESSAGE embeds and MAX_EMBED_TOTAL characters.
+
+        Returns:
+            One result per sent message
+        """
+        pending, self._pending_embeds = self._pending_embeds, []
+
+        results = []
+        for embeds in self._pack_embeds(pending):
+            payload = self._wrap_embeds(embeds)
+            results.append(self._send_webhook(payload))
 
-        content = " ".join(mentions) if mentions else None
+        logger.info(f"Flushed {len(pending)} meetings in {len(results)} webhook messages")
+        return results
 
+    def flush_pending(self) -> List[str]:
+        """
+        Wait for messages sent in the background.
+
+        Returns:
+            One result per queued message, in submission order
+
+        Raises:
+            Exception: The first send error, after all sends have finished
+        """
+        pending, self._pending_sends = self._pending_sends, []
+        wait(pending)
+        return [future.result() for future in pending]
+
+    def _pack_embeds(self, groups: List[List[Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+        """Greedily pack per-meeting embed groups into message-sized chunks."""
+        messages: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        current_chars = 0
+
+        for group in groups:
+            group_chars = sum(self._embed_length(embed) for embed in group)
+            if current and (
+                len(current) + len(group) > self.MAX_EMBEDS_PER_MESSAGE
+                or current_chars + group_chars > self.MAX_EMBED_TOTAL
+            ):
+                messages.append(current)
+                current, current_chars = [], 0
+            current.extend(group)
+            current_chars += group_chars
+
+        if current:
+            messages.append(current)
+        return messages
+
+    @staticmethod
+    def _embed_length(embed: Dict[str, Any]) -> int:
+        """Count the characters Discord charges against the per-message embed limit."""
+        length = len(embed.get("title", "")) + len(embed.get("description", ""))
+        length += len(embed.get("footer", {}).get("text", ""))
+        for field in embed.get("fields", ()):
+            length += len(field["name"]) + len(field["value"])
+        return length
+
+    def _build_payload(self, minutes: Minutes, meeting_id: str) -> Dict[str, Any]:
+        """Build Discord webhook payload."""
         # Build main embed
         main_embed = self._build_main_embed(minutes, meeting_id)
 
@@ -130,14 +335,17 @@ class DiscordWebhookRenderer(OutputRenderer):
             if decisions_embed:
                 embeds.append(decisions_embed)
 
-        # Build payload
+        return self._wrap_embeds(embeds)
+
+    def _wrap_embeds(self, embeds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Wrap embeds in a webhook message payload."""
         payload = {
             "username": self.username,
             "embeds": embeds,
         }
 
-        if content:
-            payload["content"] = content
+        if self._mentions_prefix:
+            payload["content"] = self._mentions_prefix
 
         if self.avatar_url:
             payload["avatar_url"] = self.avatar_url
@@ -146,17 +354,12 @@ class DiscordWebhookRenderer(OutputRenderer):
 
     def _build_main_embed(self, minutes: Minutes, meeting_id: str) -> Dict[str, Any]:
         """Build main summary embed."""
-        # Truncate summary if needed
-        summary = minutes.summary
-        if len(summary) > self.MAX_DESCRIPTION_LENGTH:
-            summary = summary[: self.MAX_DESCRIPTION_LENGTH - 3] + "..."
-
         embed = {
             "title": self._truncate(f"Meeting Minutes: {meeting_id}", self.MAX_TITLE_LENGTH),
-            "description": summary,
+            "description": self._truncate(minutes.summary, self.MAX_DESCRIPTION_LENGTH),
             "color": self.color,
-            "timestamp": minutes.generated_at.isoformat(),
-            "footer": {"text": "Generated by MeetScribe"},
+            "timestamp": minutes.generated_at_iso,
+            "footer": self._FOOTER,
         }
 
         # Add fields
@@ -164,9 +367,16 @@ class DiscordWebhookRenderer(OutputRenderer):
 
         # Key points (if space allows)
         if minutes.key_points:
-            key_points_text = "\n".join(f"• {p}" for p in minutes.key_points[:5])
-            if len(minutes.key_points) > 5:
-                key_points_text += f"\n... and {len(minutes.key_points) - 5} more"
+            parts: List[str] = []
+            append = parts.append
+            for point in minutes.key_points[:5]:
+                append("• ")
+                append(point)
+                append("\n")
+            count = len(minutes.key_points)
+            if count > 5:
+                append(f"... and {count - 5} more\n")
+            key_points_text = "".join(parts)[:-1]
             fields.append(
                 {
                     "name": "Key Points",
@@ -178,8 +388,9 @@ class DiscordWebhookRenderer(OutputRenderer):
         # Participants
         if minutes.participants:
             participants_text = ", ".join(minutes.participants[:10])
-            if len(minutes.participants) > 10:
-                participants_text += f" +{len(minutes.participants) - 10} more"
+            count = len(minutes.participants)
+            if count > 10:
+                participants_text += f" +{count - 10} more"
             fields.append(
                 {
                     "name": "Participants",
@@ -216,26 +427,31 @@ class DiscordWebhookRenderer(OutputRenderer):
         if not minutes.action_items:
             return None
 
-        lines = []
+        parts: List[str] = []
+        append = parts.append
+        priority_emoji = self._PRIORITY_EMOJI
         for i, item in enumerate(minutes.action_items[:10], 1):
-            line = f"**{i}.** {item.description}"
+            append("**")
+            append(str(i))
+            append(".** ")
+            append(item.description)
             if item.assignee:
-                line += f" → {item.assignee}"
+                append(" → ")
+                append(item.assignee)
             if item.deadline:
-                line += f" (Due: {item.deadline})"
+                append(" (Due: ")
+                append(item.deadline)
+                append(")")
             if item.priority:
-                priority_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(
-                    item.priority.lower(), "⚪"
-                )
-                line += f" {priority_emoji}"
-            lines.append(line)
+                append(" ")
+                append(priority_emoji.get(item.priority.lower(), "⚪"))
+            append("\n")
 
-        if len(minutes.action_items) > 10:
-            lines.append(f"... and {len(minutes.action_items) - 10} more items")
+        count = len(minutes.action_items)
+        if count > 10:
+            append(f"... and {count - 10} more items\n")
 
-        description = "\n".join(lines)
-        if len(description) > self.MAX_DESCRIPTION_LENGTH:
-            description = description[: self.MAX_DESCRIPTION_LENGTH - 3] + "..."
+        description = self._truncate("".join(parts)[:-1], self.MAX_DESCRIPTION_LENGTH)
 
         return {
             "title": "📋 Action Items",
@@ -248,21 +464,27 @@ class DiscordWebhookRenderer(OutputRenderer):
         if not minutes.decisions:
             return None
 
-        lines = []
+        parts: List[str] = []
+        append = parts.append
         for i, decision in enumerate(minutes.decisions[:10], 1):
-            line = f"**{i}.** {decision.description}"
+            append("**")
+            append(str(i))
+            append(".** ")
+            append(decision.description)
             if decision.responsible:
-                line += f" → {decision.responsible}"
+                append(" → ")
+                append(decision.responsible)
             if decision.deadline:
-                line += f" (Deadline: {decision.deadline})"
-            lines.append(line)
+                append(" (Deadline: ")
+                append(decision.deadline)
+                append(")")
+            append("\n")
 
-        if len(minutes.decisions) > 10:
-            lines.append(f"... and {len(minutes.decisions) - 10} more decisions")
+        count = len(minutes.decisions)
+        if count > 10:
+            append(f"... and {count - 10} more decisions\n")
 
-        description = "\n".join(lines)
-        if len(description) > self.MAX_DESCRIPTION_LENGTH:
-            description = description[: self.MAX_DESCRIPTION_LENGTH - 3] + "..."
+        description = self._truncate("".join(parts)[:-1], self.MAX_DESCRIPTION_LENGTH)
 
         return {
             "title": "✅ Decisions",
@@ -271,19 +493,29 @@ class DiscordWebhookRenderer(OutputRenderer):
         }
 
     def _truncate(self, text: str, max_length: int) -> str:
-        """Truncate text to max length."""
+        """Truncate text to max length, ending with a single-character ellipsis."""
         if len(text) <= max_length:
             return text
-        return text[: max_length - 3] + "..."
+        return text[: max_length - 1] + self._ELLIPSIS
 
     def _send_webhook(self, payload: Dict[str, Any]) -> str:
         """Send payload to Discord webhook."""
         try:
-            import requests
-
-            response = requests.post(
-                self.webhook_url, json=payload, headers={"Content-Type": "application/json"}
-            )
+            # Wait out an exhausted rate-limit bucket instead of triggering 429s
+            wait = self._rate_limit_reset_at - time.monotonic()
+            if wait > 0:
+                logger.info(f"Webhook rate limit reached; waiting {wait:.2f}s")
+                time.sleep(wait)
+
+            body = dumps_json(payload)
+            headers = {"Content-Type": "application/json"}
+            if self._http_backend == "httpx":
+                response = _get_httpx_client().post(self.webhook_url, content=body, headers=headers)
+            else:
+                response = _get_session(self.webhook_url).post(
+                    self.webhook_url, data=body, headers=headers, timeout=WEBHOOK_TIMEOUT
+                )
+            self._update_rate_limit(response.headers)
             response.raise_for_status()
 
             # Discord returns empty body on success
@@ -297,34 +529,36 @@ class DiscordWebhookRenderer(OutputRenderer):
 
             return "Message sent"
 
-        except ImportError:
-            try:
-                import httpx
-
-                with httpx.Client() as client:
-                    response = client.post(
-                        self.webhook_url, json=payload, headers={"Content-Type": "application/json"}
-                    )
-                    response.raise_for_status()
-                    return "Message sent successfully"
-            except Exception as e:
-                logger.error(f"Failed to send webhook: {e}")
-                raise
-
         except Exception as e:
             logger.error(f"Failed to send webhook: {e}")
             raise
 
-    def _save_mock_output(self, minutes: Minutes, meeting_id: str, payload: Dict[str, Any]) -> str:
+    def _update_rate_limit(self, headers: Any):
+        """Record when the webhook bucket resets if the last request exhausted it."""
+        if headers.get("X-RateLimit-Remaining") == "0":
+            reset_after = float(headers.get("X-RateLimit-Reset-After", 0))
+            self._rate_limit_reset_at = time.monotonic() + reset_after
+
+    def _save_mock_output(
+        self, minutes: Minutes, meeting_id: str, payload: Optional[Dict[str, Any]] = None
+    ) -> str:
         """Save mock output when webhook not available."""
         logger.info(f"[MOCK] Saving Discord webhook payload for {meeting_id}")
 
+        if payload is None:
+            payload = {
+                "meeting_id": meeting_id,
+                "summary": minutes.summary,
+                "action_items": len(minutes.action_items),
+                "decisions": len(minutes.decisions),
+                "note": "Mock mode - no webhook message sent",
+            }
+
         meeting_dir = self.output_dir / meeting_id
         meeting_dir.mkdir(parents=True, exist_ok=True)
 
         output_path = meeting_dir / "discord_webhook_payload.json"
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False, default=str)
+        atomic_write(output_path, dumps_json(payload, indent=True))
 
         return str(output_path)
 
@@ -2,14 +2,50 @@
 Factory for OUTPUT layer renderers.
 """
 
+import asyncio
+import importlib
 import logging
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import Any, Dict, List, Optional, Type, Union
 
+from ..core.models import Minutes
 from ..core.providers import OutputRenderer
 
 logger = logging.getLogger(__name__)
 
 
+# Built-in renderers as (format aliases, "module:Class")
+_BUILTIN_RENDERERS = (
+    (("url",), "url_renderer:URLRenderer"),
+    (("markdown", "md"), "markdown_renderer:MarkdownRenderer"),
+    (("json",), "json_renderer:JSONRenderer"),
+    (("pdf",), "pdf_renderer:PDFRenderer"),
+    (("docs", "google-docs", "gdocs"), "google_docs_renderer:GoogleDocsRenderer"),
+    (
+        ("sheets", "google-sheets", "spreadsheet", "gsheets"),
+        "google_sheets_renderer:GoogleSheetsRenderer",
+    ),
+    (
+        ("webhook", "discord-webhook", "discord"),
+        "discord_webhook_renderer:DiscordWebhookRenderer",
+    ),
+)
+
+_RENDERER_PATHS = {alias: path for aliases, path in _BUILTIN_RENDERERS for alias in aliases}
+
+
+@cache
+def _resolve(fmt: str) -> Optional[Type[OutputRenderer]]:
+    """Import and return the built-in renderer class for a normalized format name."""
+    path = _RENDERER_PATHS.get(fmt)
+    if path is None:
+        return None
+    module_name, class_name = path.split(":")
+    module = importlib.import_module(f".{module_name}", __package__)
+    return getattr(module, class_name)
+
+
 def get_output_renderer(format_name: str, config: Dict[str, Any]) -> OutputRenderer:
     """
     Get OUTPUT renderer by name.
@@ -27,50 +63,24 @@ def get_output_renderer(format_name: str, config: Dict[str, Any]) -> OutputRende
     # Normalize format name
     fmt = format_name.lower().replace("_", "-").replace(" ", "-")
 
-    # Map format names to classes
-    if fmt == "url":
-        from .url_renderer import URLRenderer
-
-        return URLRenderer(config)
-    elif fmt in ("markdown", "md"):
-        from .markdown_renderer import MarkdownRenderer
-
-        return MarkdownRenderer(config)
-    elif fmt == "json":
-        from .json_renderer import JSONRenderer
+    renderer_class = _resolve(fmt)
+    if renderer_class is not None:
+        return renderer_class(config)
 
-        return JSONRenderer(config)
-    elif fmt == "pdf":
-        from .pdf_renderer import PDFRenderer
+    # Try plugin registry as fallback
+    try:
+        from ..core.plugin import PluginRegistry
 
-        return PDFRenderer(config)
-    elif fmt in ("docs", "google-docs", "gdocs"):
-        from .google_docs_renderer import GoogleDocsRenderer
-
-        return GoogleDocsRenderer(config)
-    elif fmt in ("sheets", "google-sheets", "spreadsheet", "gsheets"):
-        from .google_sheets_renderer import GoogleSheetsRenderer
-
-        return GoogleSheetsRenderer(config)
-    elif fmt in ("webhook", "discord-webhook", "discord"):
-        from .discord_webhook_renderer import DiscordWebhookRenderer
-
-        return DiscordWebhookRenderer(config)
-    else:
-        # Try plugin registry as fallback
-        try:
-            from ..core.plugin import PluginRegistry
+        registry = PluginRegistry()
+        plugin_class = registry.get_plugin_class(fmt)
 
-            registry = PluginRegistry()
-            plugin_class = registry.get_plugin_class(fmt)
+        if plugin_class is not None:
+            logger.debug(f"Loading output renderer from plugin: {fmt}")
+            return plugin_class(config)
+    except ImportError:
+        pass
 
-            if plugin_class is not None:
-                logger.debug(f"Loading output renderer from plugin: {fmt}")
-                return plugin_class(config)
-        except ImportError:
-            pass
-
-        raise ValueError(f"Unsupported output format: {format_name}")
+    raise ValueError(f"Unsupported output format: {format_name}")
 
 
 def get_multiple_renderers(formats: List[Dict[str, Any]]) -> List[OutputRenderer]:
@@ -91,3 +101,58 @@ def get_multiple_renderers(formats: List[Dict[str, Any]]) -> List[OutputRenderer
         renderer = get_output_renderer(format_name, fmt_config)
         renderers.append(renderer)
     return renderers
+
+
+async def render_all_async(
+    renderers: List[OutputRenderer], minutes: Minutes, meeting_id: str
+) -> List[Union[str, BaseException]]:
+    """
+    Render minutes with several renderers concurrently.
+
+    Total latency is that of the slowest renderer rather than the sum.
+    A failing renderer does not cancel the others.
+
+    Args:
+        renderers: OutputRenderer instances
+        minutes: Minutes object
+        meeting_id: Meeting identifier
+
+    Returns:
+        Result or raised exception for each renderer, in renderer order
+    """
+    return await asyncio.gather(
+        *(renderer.render_async(minutes, meeting_id) for renderer in renderers),
+        return_exceptions=True,
+    )
+
+
+def render_all(
+    renderers: List[OutputRenderer], minutes: Minutes, meeting_id: str
+) -> List[Union[str, BaseException]]:
+    """
+    Render minutes with several renderers concurrently from synchronous code.
+
+    Renderers run in a thread pool, so I/O-bound writes overlap with
+    CPU-bound work such as PDF layout. A failing renderer does not stop
+    the others.
+
+    Args:
+        renderers: OutputRenderer instances
+        minutes: Minutes object
+        meeting_id: Meeting identifier
+
+    Returns:
+        Result or raised exception for each renderer, in renderer order
+    """
+    if not renderers:
+        return []
+
+    def render(renderer: OutputRenderer) -> Union[str, BaseException]:
+        try:
+            return renderer.render(minutes, meeting_id)
+        except Exception as e:
+            logger.error(f"{type(renderer).__name__} failed: {e}")
+            return e
+
+    with ThreadPoolExecutor(max_workers=len(renderers)) as executor:
+        return list(executor.map(render, renderers))
@@ -0,0 +1,73 @@
+"""
+Google OAuth helpers for MeetScribe OUTPUT renderers.
+
+Keeps user OAuth credentials in memory so renderers do not re-read and
+re-write the token file on every instantiation.
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.files import atomic_write
+
+logger = logging.getLogger(__name__)
+
+# Loaded credentials and their last persisted JSON, keyed by (token path, scopes)
+_oauth_tokens: Dict[Tuple[str, Tuple[str, ...]], Tuple[Any, Optional[str]]] = {}
+_oauth_tokens_lock = threading.Lock()
+
+
+def load_oauth_credentials(
+    credentials_path: str, token_path: str, scopes: List[str]
+) -> Optional[Any]:
+    """
+    Load user OAuth credentials, reusing ones already loaded in this process.
+
+    The token file is read only on first use, refreshed credentials are
+    reused until they expire, and the file is rewritten only when the
+    token actually changed.
+
+    Args:
+        credentials_path: Path to OAuth client secrets JSON
+        token_path: Path to store OAuth token
+        scopes: API scopes required
+
+    Returns:
+        google.oauth2.credentials.Credentials, or None if none are available
+    """
+    key = (str(token_path), tuple(scopes))
+    with _oauth_tokens_lock:
+        creds, saved_json = _oauth_tokens.get(key, (None, None))
+    if creds is not None and creds.valid:
+        return creds
+
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
+    token_file = Path(token_path)
+    if creds is None and token_file.exists():
+        saved_json = token_file.read_text(encoding="utf-8")
+        creds = Credentials.from_authorized_user_file(str(token_file), scopes)
+
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        elif Path(credentials_path).exists():
+            flow = InstalledAppFlow.from_client_secrets_file(credentials_path, scopes)
+            creds = flow.run_local_server(port=0)
+
+    if creds is None:
+        return None
+
+    # Save token
+    token_json = creds.to_json()
+    if token_json != saved_json:
+        atomic_write(token_file, token_json)
+        logger.debug(f"Saved OAuth token to {token_file}")
+
+    with _oauth_tokens_lock:
+        _oauth_tokens[key] = (creds, token_json)
+    return creds
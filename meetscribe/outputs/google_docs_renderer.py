@@ -4,14 +4,19 @@ Google Docs OUTPUT renderer for MeetScribe.
 Creates Google Docs with formatted meeting minutes using Google Docs API.
 """
 
-import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..core.models import Minutes
 from ..core.providers import OutputRenderer
+from ..utils.files import atomic_write
+from ..utils.retry import get_status_code, retry_with_backoff
+from ..utils.serialization import dumps_json
+from .google_auth import load_oauth_credentials
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +45,8 @@ class GoogleDocsRenderer(OutputRenderer):
             folder_id: Google Drive folder ID for documents
             share_with: List of emails to share with
             document_title_template: Template for doc title
+            num_retries: Retries with backoff for rate-limited/5xx API calls; document
+                writes retry rate limits only (default: 3)
         """
         super().__init__(config)
 
@@ -56,6 +63,8 @@ class GoogleDocsRenderer(OutputRenderer):
             "document_title_template", "Meeting Minutes: {meeting_id}"
         )
 
+        self.num_retries = config.get("num_retries", 3)
+
         # Output dir for local backup
         self.output_dir = Path(config.get("output_dir", "./meetings"))
 
@@ -67,10 +76,9 @@ class GoogleDocsRenderer(OutputRenderer):
     def _init_services(self):
         """Initialize Google API services."""
         try:
-            from google.auth.transport.requests import Request
+            import httplib2
             from google.oauth2 import service_account
-            from google.oauth2.credentials import Credentials
-            from google_auth_oauthlib.flow import InstalledAppFlow
+            from google_auth_httplib2 import AuthorizedHttp
             from googleapiclient.discovery import build
 
             creds = None
@@ -84,30 +92,14 @@ class GoogleDocsRenderer(OutputRenderer):
 
             # Try OAuth credentials
             elif self.credentials_path:
-                token_path = Path(self.token_path)
-
-                if token_path.exists():
-                    creds = Credentials.from_authorized_user_file(str(token_path), self.SCOPES)
-
-                if not creds or not creds.valid:
-                    if creds and creds.expired and creds.refresh_token:
-                        creds.refresh(Request())
-                    elif Path(self.credentials_path).exists():
-                        flow = InstalledAppFlow.from_client_secrets_file(
-                            self.credentials_path, self.SCOPES
-                        )
-                        creds = flow.run_local_server(port=0)
-
-                    # Save token
-                    token_path.parent.mkdir(parents=True, exist_ok=True)
-                    with open(token_path, "w") as f:
-                        f.write(creds.to_json())
-
+                creds = load_oauth_credentials(self.credentials_path, self.token_path, self.SCOPES)
                 logger.info("Using OAuth credentials")
 
             if creds:
-                self.docs_service = build("docs", "v1", credentials=creds)
-                self.drive_service = build("drive", "v3", credentials=creds)
+                # Share one authorized connection between the Docs and Drive clients
+                http = AuthorizedHttp(creds, http=httplib2.Http())
+                self.docs_service = build("docs", "v1", http=http, cache_discovery=False)
+                self.drive_service = build("drive", "v3", http=http, cache_discovery=False)
                 logger.info("Google API services initialized")
             else:
                 logger.warning("No credentials found - running in mock mode")
@@ -147,7 +139,7 @@ class GoogleDocsRenderer(OutputRenderer):
         """Create actual Google Doc."""
         # Create document
         title = self.document_title_template.format(meeting_id=meeting_id)
-        doc = self.docs_service.documents().create(body={"title": title}).execute()
+        doc = self._execute_write(self.docs_service.documents().create(body={"title": title}))
         doc_id = doc["documentId"]
         doc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
 
@@ -156,59 +148,61 @@ class GoogleDocsRenderer(OutputRenderer):
 
         # Update document
         if requests:
-            self.docs_service.documents().batchUpdate(
-                documentId=doc_id, body={"requests": requests}
-            ).execute()
+            self._execute_write(
+                self.docs_service.documents().batchUpdate(
+                    documentId=doc_id, body={"requests": requests}
+                )
+            )
 
-        # Move to folder if specified
-        if self.folder_id:
-            self._move_to_folder(doc_id, self.folder_id)
+        # Save local backup in the background while the Drive calls run
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            backup = executor.submit(self._save_local_backup, minutes, meeting_id, doc_url)
 
-        # Share with users
-        for email in self.share_with:
-            self._share_document(doc_id, email)
+            # Move to folder if specified
+            if self.folder_id:
+                self._move_to_folder(doc_id, self.folder_id)
 
-        # Save local backup
-        self._save_local_backup(minutes, meeting_id, doc_url)
+            # Share with users
+            if self.share_with:
+                self._share_document_batch(doc_id, self.share_with)
 
+        backup.result()
         return doc_url
 
     def _build_document_requests(self, minutes: Minutes, meeting_id: str) -> List[Dict]:
-        """Build Google Docs API requests."""
-        requests = []
+        """
+        Build Google Docs API requests.
+
+        All text is inserted with a single insertText request, followed by one
+        updateParagraphStyle request per run of paragraphs sharing a style.
+        """
+        buffer = StringIO()
+        spans: List[List] = []  # [start, end, namedStyleType]
         index = 1  # Document starts at index 1
 
-        # Helper to add text
-        def add_text(text: str, style: Optional[Dict] = None) -> int:
+        # Helper to add text; adjacent spans of the same style are merged
+        def add_text(text: str, style: str = "NORMAL_TEXT"):
             nonlocal index
-            requests.append({"insertText": {"location": {"index": index}, "text": text}})
+            buffer.write(text)
             start = index
             index += len(text)
 
-            if style:
-                requests.append(
-                    {
-                        "updateParagraphStyle": {
-                            "range": {"startIndex": start, "endIndex": index},
-                            "paragraphStyle": style,
-                            "fields": ",".join(style.keys()),
-                        }
-                    }
-                )
-
-            return index
+            if spans and spans[-1][2] == style and spans[-1][1] == start:
+                spans[-1][1] = index
+            else:
+                spans.append([start, index, style])
 
         def add_heading(text: str, level: int = 1):
-            add_text(text + "\n", {"namedStyleType": f"HEADING_{level}"})
+            add_text(text + "\n", f"HEADING_{level}")
 
         def add_body(text: str):
-            add_text(text + "\n", {"namedStyleType": "NORMAL_TEXT"})
+            add_text(text + "\n")
 
         # Title
         add_heading(f"Meeting Minutes: {meeting_id}", 1)
 
         # Metadata
-        add_body(f"Generated: {minutes.generated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        add_body(f"Generated: {minutes.generated_at_text}")
         add_text("\n")
 
         # Summary
@@ -261,13 +255,43 @@ class GoogleDocsRenderer(OutputRenderer):
         if minutes.url:
             add_body(f"NotebookLM: {minutes.url}")
 
+        requests = [{"insertText": {"location": {"index": 1}, "text": buffer.getvalue()}}]
+        for start, end, style in spans:
+            requests.append(
+                {
+                    "updateParagraphStyle": {
+                        "range": {"startIndex": start, "endIndex": end},
+                        "paragraphStyle": {"namedStyleType": style},
+                        "fields": "namedStyleType",
+                    }
+                }
+            )
+
         return requests
 
+    def _execute_write(self, request: Any) -> Any:
+        """
+        Execute a non-idempotent request, retrying only rate-limit (429) errors.
+
+        googleapiclient's num_retries also retries 5xx errors, which may come
+        after the write was applied; a retried create leaves a duplicate
+        document and a retried insertText duplicates the body.
+        """
+        return retry_with_backoff(
+            request.execute,
+            should_retry=lambda e: get_status_code(e) == 429,
+            max_attempts=self.num_retries + 1,
+        )
+
     def _move_to_folder(self, doc_id: str, folder_id: str):
         """Move document to specified folder."""
         try:
             # Get current parents
-            file = self.drive_service.files().get(fileId=doc_id, fields="parents").execute()
+            file = (
+                self.drive_service.files()
+                .get(fileId=doc_id, fields="parents")
+                .execute(num_retries=self.num_retries)
+            )
             previous_parents = ",".join(file.get("parents", []))
 
             # Move to new folder
@@ -276,24 +300,36 @@ class GoogleDocsRenderer(OutputRenderer):
                 addParents=folder_id,
                 removeParents=previous_parents,
                 fields="id, parents",
-            ).execute()
+            ).execute(num_retries=self.num_retries)
 
             logger.info(f"Moved document to folder: {folder_id}")
         except Exception as e:
             logger.warning(f"Could not move document to folder: {e}")
 
-    def _share_document(self, doc_id: str, email: str):
-        """Share document with user."""
-        try:
-            self.drive_service.permissions().create(
-                fileId=doc_id,
-                body={"type": "user", "role": "writer", "emailAddress": email},
-                sendNotificationEmail=True,
-            ).execute()
+    def _share_document_batch(self, doc_id: str, emails: List[str]):
+        """Share document with several users in one batch request."""
 
-            logger.info(f"Shared document with: {email}")
+        def callback(request_id: str, response: Any, exception: Optional[Exception]):
+            email = emails[int(request_id)]
+            if exception is not None:
+                logger.warning(f"Could not share document with {email}: {exception}")
+            else:
+                logger.info(f"Shared document with: {email}")
+
+        try:
+            batch = self.drive_service.new_batch_http_request(callback=callback)
+            for i, email in enumerate(emails):
+                batch.add(
+                    self.drive_service.permissions().create(
+                        fileId=doc_id,
+                        body={"type": "user", "role": "writer", "emailAddress": email},
+                        sendNotificationEmail=True,
+                    ),
+                    request_id=str(i),
+                )
+            batch.execute()
         except Exception as e:
-            logger.warning(f"Could not share document with {email}: {e}")
+            logger.warning(f"Could not share document: {e}")
 
     def _save_local_backup(self, minutes: Minutes, meeting_id: str, doc_url: str):
         """Save local backup of document info."""
@@ -303,13 +339,12 @@ class GoogleDocsRenderer(OutputRenderer):
         backup_data = {
             "meeting_id": meeting_id,
             "google_doc_url": doc_url,
-            "generated_at": minutes.generated_at.isoformat(),
+            "generated_at": minutes.generated_at_iso,
             "summary": minutes.summary,
         }
 
         backup_path = meeting_dir / "google_doc_info.json"
-        with open(backup_path, "w", encoding="utf-8") as f:
-            json.dump(backup_data, f, indent=2)
+        atomic_write(backup_path, dumps_json(backup_data, indent=True))
 
     def _create_mock_output(self, minutes: Minutes, meeting_id: str) -> str:
         """Create mock output when API not available."""
@@ -324,14 +359,13 @@ class GoogleDocsRenderer(OutputRenderer):
         backup_data = {
             "meeting_id": meeting_id,
             "google_doc_url": mock_url,
-            "generated_at": minutes.generated_at.isoformat(),
+            "generated_at": minutes.generated_at_iso,
             "summary": minutes.summary,
             "note": "Mock mode - no actual Google Doc created",
         }
 
         backup_path = meeting_dir / "google_doc_info.json"
-        with open(backup_path, "w", encoding="utf-8") as f:
-            json.dump(backup_data, f, indent=2)
+        atomic_write(backup_path, dumps_json(backup_data, indent=True))
 
         return mock_url
 
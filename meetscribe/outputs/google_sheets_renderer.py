@@ -4,17 +4,38 @@ Google Spreadsheet OUTPUT renderer for MeetScribe.
 Creates Google Spreadsheets with structured meeting data using Google Sheets API.
 """
 
-import json
 import logging
 import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..core.models import Minutes
 from ..core.providers import OutputRenderer
+from ..utils.files import atomic_write
+from ..utils.rate_limit import TokenBucket
+from ..utils.retry import is_retryable_status, is_retryable_write_status, retry_with_backoff
+from ..utils.serialization import dumps_json
+from .google_auth import load_oauth_credentials
 
 logger = logging.getLogger(__name__)
 
+# Credentials and built (sheets, drive) services, keyed by credential source
+_services: Dict[Tuple[Optional[str], ...], Tuple[Any, Any, Any]] = {}
+_services_lock = threading.Lock()
+
+# Idle authorized HTTP connections, keyed by credentials
+_idle_https: "weakref.WeakKeyDictionary[Any, List[Any]]" = weakref.WeakKeyDictionary()
+_idle_https_lock = threading.Lock()
+
+# Idle connections kept per credentials (one per concurrent post-create step)
+_MAX_IDLE_HTTPS = 4
+
+# Sheets API write quota (60 writes/min/user), shared by all renderer instances
+_WRITE_BUCKET = TokenBucket(rate=60 / 60, capacity=60)
+
 
 class GoogleSheetsRenderer(OutputRenderer):
     """
@@ -29,6 +50,19 @@ class GoogleSheetsRenderer(OutputRenderer):
         "https://www.googleapis.com/auth/drive.file",
     ]
 
+    # Maximum number of calls in one Drive batch request
+    MAX_BATCH_SIZE = 100
+
+    # First-row cell formats
+    TITLE_FORMAT = {"textFormat": {"bold": True, "fontSize": 14}}
+    HEADER_FORMAT = {
+        "backgroundColor": {"red": 0.2, "green": 0.2, "blue": 0.2},
+        "textFormat": {
+            "bold": True,
+            "foregroundColor": {"red": 1, "green": 1, "blue": 1},
+        },
+    }
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize Google Sheets renderer.
@@ -41,6 +75,9 @@ class GoogleSheetsRenderer(OutputRenderer):
             share_with: List of emails to share with
             spreadsheet_title_template: Template for spreadsheet title
             existing_spreadsheet_id: ID to append to existing spreadsheet
+            max_attempts: Attempts per API call on 429/5xx errors (default: 6)
+            defer_folder_moves: Queue folder moves and send them in one batch
+                with flush_pending() (default: False)
         """
         super().__init__(config)
 
@@ -57,22 +94,56 @@ class GoogleSheetsRenderer(OutputRenderer):
             "spreadsheet_title_template", "Meeting Tracker: {meeting_id}"
         )
         self.existing_spreadsheet_id = config.get("existing_spreadsheet_id")
+        self.max_attempts = config.get("max_attempts", 6)
+        self.defer_folder_moves = config.get("defer_folder_moves", False)
+
+        # (spreadsheet_id, folder_id) moves queued for flush_pending()
+        self._pending_moves: List[Tuple[str, str]] = []
 
         # Output dir for local backup
         self.output_dir = Path(config.get("output_dir", "./meetings"))
 
         # Initialize API client
+        self.credentials = None
         self.sheets_service = None
         self.drive_service = None
         self._init_services()
 
+    @property
+    def sheets_service(self) -> Any:
+        """Sheets API client."""
+        return self._sheets_service
+
+    @sheets_service.setter
+    def sheets_service(self, service: Any):
+        # Bind the spreadsheets resource once instead of per call
+        self._sheets_service = service
+        self._spreadsheets = service.spreadsheets() if service is not None else None
+
+    @property
+    def drive_service(self) -> Any:
+        """Drive API client."""
+        return self._drive_service
+
+    @drive_service.setter
+    def drive_service(self, service: Any):
+        # Bind the files/permissions resources once instead of per call
+        self._drive_service = service
+        self._drive_files = service.files() if service is not None else None
+        self._drive_permissions = service.permissions() if service is not None else None
+
     def _init_services(self):
-        """Initialize Google API services."""
+        """Initialize Google API services, reusing clients built for the same credentials."""
+        key = (self.service_account_path, self.credentials_path, str(self.token_path))
+        with _services_lock:
+            cached = _services.get(key)
+        if cached:
+            self.credentials, self.sheets_service, self.drive_service = cached
+            logger.debug("Reusing Google API services")
+            return
+
         try:
-            from google.auth.transport.requests import Request
             from google.oauth2 import service_account
-            from google.oauth2.credentials import Credentials
-            from google_auth_oauthlib.flow import InstalledAppFlow
             from googleapiclient.discovery import build
 
             creds = None
@@ -86,30 +157,17 @@ class GoogleSheetsRenderer(OutputRenderer):
 
             # Try OAuth credentials
             elif self.credentials_path:
-                token_path = Path(self.token_path)
-
-                if token_path.exists():
-                    creds = Credentials.from_authorized_user_file(str(token_path), self.SCOPES)
-
-                if not creds or not creds.valid:
-                    if creds and creds.expired and creds.refresh_token:
-                        creds.refresh(Request())
-                    elif Path(self.credentials_path).exists():
-                        flow = InstalledAppFlow.from_client_secrets_file(
-                            self.credentials_path, self.SCOPES
-                        )
-                        creds = flow.run_local_server(port=0)
-
-                    # Save token
-                    token_path.parent.mkdir(parents=True, exist_ok=True)
-                    with open(token_path, "w") as f:
-                        f.write(creds.to_json())
-
+                creds = load_oauth_credentials(self.credentials_path, self.token_path, self.SCOPES)
                 logger.info("Using OAuth credentials")
 
             if creds:
-                self.sheets_service = build("sheets", "v4", credentials=creds)
-                self.drive_service = build("drive", "v3", credentials=creds)
+                self.credentials = creds
+                self.sheets_service = build(
+                    "sheets", "v4", credentials=creds, cache_discovery=False
+                )
+                self.drive_service = build("drive", "v3", credentials=creds, cache_discovery=False)
+                with _services_lock:
+                    _services[key] = (creds, self.sheets_service, self.drive_service)
                 logger.info("Google API services initialized")
             else:
                 logger.warning("No credentials found - running in mock mode")
@@ -152,40 +210,139 @@ class GoogleSheetsRenderer(OutputRenderer):
         """Create new Google Spreadsheet."""
         title = self.spreadsheet_title_template.format(meeting_id=meeting_id)
 
-        # Create spreadsheet
+        # Create spreadsheet with its content and header formatting in one request
+        blocks = [
+            self._build_summary_block(minutes, meeting_id),
+            self._build_action_items_block(minutes),
+            self._build_decisions_block(minutes),
+        ]
         spreadsheet = {
             "properties": {"title": title},
             "sheets": [
-                {"properties": {"title": "Summary"}},
-                {"properties": {"title": "Action Items"}},
-                {"properties": {"title": "Decisions"}},
+                {
+                    "properties": {"sheetId": sheet_id, "title": block["range"].split("!")[0]},
+                    "data": [
+                        {
+                            "startRow": 0,
+                            "startColumn": 0,
+                            "rowData": self._to_row_data(block["values"], first_row_format),
+                        }
+                    ],
+                }
+                for sheet_id, (block, first_row_format) in enumerate(
+                    zip(blocks, (self.TITLE_FORMAT, self.HEADER_FORMAT, self.HEADER_FORMAT))
+                )
             ],
         }
 
-        result = self.sheets_service.spreadsheets().create(body=spreadsheet).execute()
+        result = self._execute(
+            self._spreadsheets.create(body=spreadsheet), limiter=_WRITE_BUCKET, idempotent=False
+        )
         spreadsheet_id = result["spreadsheetId"]
         sheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit"
 
-        # Populate sheets
-        self._populate_summary_sheet(spreadsheet_id, minutes, meeting_id)
-        self._populate_action_items_sheet(spreadsheet_id, minutes)
-        self._populate_decisions_sheet(spreadsheet_id, minutes)
+        # The remaining steps are independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                # Fit columns to the content
+                executor.submit(self._call_with_http, self._auto_resize_columns, spreadsheet_id),
+                # Save local backup
+                executor.submit(self._save_local_backup, minutes, meeting_id, sheet_url),
+            ]
+
+            # Move to folder if specified
+            if self.folder_id and self.defer_folder_moves:
+                self._pending_moves.append((spreadsheet_id, self.folder_id))
+            elif self.folder_id:
+                futures.append(
+                    executor.submit(
+                        self._call_with_http, self._move_to_folder, spreadsheet_id, self.folder_id
+                    )
+                )
 
-        # Format sheets
-        self._format_spreadsheet(spreadsheet_id)
+            # Share with users
+            if self.share_with:
+                futures.append(
+                    executor.submit(
+                        self._call_with_http,
+                        self._share_spreadsheet_batch,
+                        spreadsheet_id,
+                        self.share_with,
+                    )
+                )
 
-        # Move to folder if specified
-        if self.folder_id:
-            self._move_to_folder(spreadsheet_id, self.folder_id)
+        for future in futures:
+            future.result()
 
-        # Share with users
-        for email in self.share_with:
-            self._share_spreadsheet(spreadsheet_id, email)
+        return sheet_url
 
-        # Save local backup
-        self._save_local_backup(minutes, meeting_id, sheet_url)
+    def _execute(
+        self,
+        request: Any,
+        http: Any = None,
+        limiter: Optional[TokenBucket] = None,
+        idempotent: bool = True,
+    ) -> Any:
+        """
+        Execute an API request, retrying rate-limit (429) and 5xx errors with backoff.
 
-        return sheet_url
+        Non-idempotent requests (creates, appends) retry only errors that
+        guarantee nothing was written, so a retry cannot duplicate the write.
+        If a limiter is given, every attempt takes a token from it first.
+        """
+
+        def attempt():
+            if limiter is not None:
+                limiter.acquire()
+            return request.execute(http=http)
+
+        return retry_with_backoff(
+            attempt,
+            should_retry=is_retryable_status if idempotent else is_retryable_write_status,
+            max_attempts=self.max_attempts,
+            initial_delay=1.0,
+            max_delay=32.0,
+        )
+
+    def _call_with_http(self, method: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call method(*args, http) with an authorized connection from the pool.
+
+        httplib2 connections are not thread-safe, so each concurrent API call
+        borrows its own. Idle connections are kept per credentials, so later
+        calls and renders reuse their open keep-alive TCP/TLS sessions.
+        Without credentials, http is None (use the service default).
+        """
+        http = self._acquire_http()
+        try:
+            return method(*args, http)
+        finally:
+            self._release_http(http)
+
+    def _acquire_http(self) -> Any:
+        """Take an idle authorized connection, or create one."""
+        if self.credentials is None:
+            return None
+
+        with _idle_https_lock:
+            idle = _idle_https.get(self.credentials)
+            if idle:
+                return idle.pop()
+
+        import httplib2
+        from google_auth_httplib2 import AuthorizedHttp
+
+        return AuthorizedHttp(self.credentials, http=httplib2.Http())
+
+    def _release_http(self, http: Any):
+        """Return a connection to the idle pool."""
+        if http is None:
+            return
+
+        with _idle_https_lock:
+            idle = _idle_https.setdefault(self.credentials, [])
+            if len(idle) < _MAX_IDLE_HTTPS:
+                idle.append(http)
 
     def _append_to_spreadsheet(self, minutes: Minutes, meeting_id: str) -> str:
         """Append to existing spreadsheet."""
@@ -199,7 +356,7 @@ class GoogleSheetsRenderer(OutputRenderer):
                 values.append(
                     [
                         meeting_id,
-                        minutes.generated_at.strftime("%Y-%m-%d"),
+                        minutes.generated_at_text[:10],
                         item.description,
                         item.assignee or "",
                         item.deadline or "",
@@ -208,23 +365,27 @@ class GoogleSheetsRenderer(OutputRenderer):
                     ]
                 )
 
-            self.sheets_service.spreadsheets().values().append(
-                spreadsheetId=spreadsheet_id,
-                range="Action Items!A:G",
-                valueInputOption="USER_ENTERED",
-                body={"values": values},
-            ).execute()
+            self._execute(
+                self._spreadsheets.values().append(
+                    spreadsheetId=spreadsheet_id,
+                    range="Action Items!A:G",
+                    valueInputOption="USER_ENTERED",
+                    body={"values": values},
+                ),
+                limiter=_WRITE_BUCKET,
+                idempotent=False,
+            )
 
         logger.info(f"Appended {len(minutes.action_items)} action items to spreadsheet")
         return sheet_url
 
-    def _populate_summary_sheet(self, spreadsheet_id: str, minutes: Minutes, meeting_id: str):
-        """Populate summary sheet."""
+    def _build_summary_block(self, minutes: Minutes, meeting_id: str) -> Dict[str, Any]:
+        """Build summary sheet values."""
         values = [
             ["Meeting Summary"],
             [""],
             ["Meeting ID", meeting_id],
-            ["Generated", minutes.generated_at.strftime("%Y-%m-%d %H:%M:%S")],
+            ["Generated", minutes.generated_at_text],
             ["Participants", ", ".join(minutes.participants) if minutes.participants else "N/A"],
             [""],
             ["Summary"],
@@ -239,15 +400,10 @@ class GoogleSheetsRenderer(OutputRenderer):
         if minutes.url:
             values.extend([[""], ["NotebookLM URL", minutes.url]])
 
-        self.sheets_service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range="Summary!A1",
-            valueInputOption="USER_ENTERED",
-            body={"values": values},
-        ).execute()
+        return {"range": "Summary!A1", "values": values}
 
-    def _populate_action_items_sheet(self, spreadsheet_id: str, minutes: Minutes):
-        """Populate action items sheet."""
+    def _build_action_items_block(self, minutes: Minutes) -> Dict[str, Any]:
+        """Build action items sheet values."""
         values = [["#", "Description", "Assignee", "Deadline", "Priority", "Status"]]
 
         for i, item in enumerate(minutes.action_items, 1):
@@ -262,15 +418,10 @@ class GoogleSheetsRenderer(OutputRenderer):
                 ]
             )
 
-        self.sheets_service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range="Action Items!A1",
-            valueInputOption="USER_ENTERED",
-            body={"values": values},
-        ).execute()
+        return {"range": "Action Items!A1", "values": values}
 
-    def _populate_decisions_sheet(self, spreadsheet_id: str, minutes: Minutes):
-        """Populate decisions sheet."""
+    def _build_decisions_block(self, minutes: Minutes) -> Dict[str, Any]:
+        """Build decisions sheet values."""
         values = [["#", "Decision", "Responsible", "Deadline"]]
 
         for i, decision in enumerate(minutes.decisions, 1):
@@ -278,69 +429,32 @@ class GoogleSheetsRenderer(OutputRenderer):
                 [i, decision.description, decision.responsible or "", decision.deadline or ""]
             )
 
-        self.sheets_service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range="Decisions!A1",
-            valueInputOption="USER_ENTERED",
-            body={"values": values},
-        ).execute()
-
-    def _format_spreadsheet(self, spreadsheet_id: str):
-        """Format spreadsheet with styles."""
+        return {"range": "Decisions!A1", "values": values}
+
+    @staticmethod
+    def _to_row_data(
+        values: List[List[Any]], first_row_format: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Convert rows of plain values to Sheets API rowData."""
+        row_data = []
+        for row in values:
+            cells = []
+            for value in row:
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    cells.append({"userEnteredValue": {"numberValue": value}})
+                else:
+                    cells.append({"userEnteredValue": {"stringValue": str(value)}})
+            row_data.append({"values": cells})
+
+        if first_row_format and row_data:
+            for cell in row_data[0]["values"]:
+                cell["userEnteredFormat"] = first_row_format
+
+        return row_data
+
+    def _auto_resize_columns(self, spreadsheet_id: str, http: Any = None):
+        """Resize action item columns to fit their content."""
         requests = [
-            # Format Summary header
-            {
-                "repeatCell": {
-                    "range": {
-                        "sheetId": 0,
-                        "startRowIndex": 0,
-                        "endRowIndex": 1,
-                    },
-                    "cell": {"userEnteredFormat": {"textFormat": {"bold": True, "fontSize": 14}}},
-                    "fields": "userEnteredFormat.textFormat",
-                }
-            },
-            # Format Action Items header
-            {
-                "repeatCell": {
-                    "range": {
-                        "sheetId": 1,
-                        "startRowIndex": 0,
-                        "endRowIndex": 1,
-                    },
-                    "cell": {
-                        "userEnteredFormat": {
-                            "backgroundColor": {"red": 0.2, "green": 0.2, "blue": 0.2},
-                            "textFormat": {
-                                "bold": True,
-                                "foregroundColor": {"red": 1, "green": 1, "blue": 1},
-                            },
-                        }
-                    },
-                    "fields": "userEnteredFormat",
-                }
-            },
-            # Format Decisions header
-            {
-                "repeatCell": {
-                    "range": {
-                        "sheetId": 2,
-                        "startRowIndex": 0,
-                        "endRowIndex": 1,
-                    },
-                    "cell": {
-                        "userEnteredFormat": {
-                            "backgroundColor": {"red": 0.2, "green": 0.2, "blue": 0.2},
-                            "textFormat": {
-                                "bold": True,
-                                "foregroundColor": {"red": 1, "green": 1, "blue": 1},
-                            },
-                        }
-                    },
-                    "fields": "userEnteredFormat",
-                }
-            },
-            # Auto-resize columns
             {
                 "autoResizeDimensions": {
                     "dimensions": {
@@ -353,39 +467,96 @@ class GoogleSheetsRenderer(OutputRenderer):
             },
         ]
 
-        self.sheets_service.spreadsheets().batchUpdate(
-            spreadsheetId=spreadsheet_id, body={"requests": requests}
-        ).execute()
+        self._execute(
+            self._spreadsheets.batchUpdate(
+                spreadsheetId=spreadsheet_id, body={"requests": requests}
+            ),
+            http,
+            limiter=_WRITE_BUCKET,
+        )
 
-    def _move_to_folder(self, spreadsheet_id: str, folder_id: str):
+    def _move_to_folder(self, spreadsheet_id: str, folder_id: str, http: Any = None):
         """Move spreadsheet to specified folder."""
         try:
-            file = self.drive_service.files().get(fileId=spreadsheet_id, fields="parents").execute()
-            previous_parents = ",".join(file.get("parents", []))
-
-            self.drive_service.files().update(
-                fileId=spreadsheet_id,
-                addParents=folder_id,
-                removeParents=previous_parents,
-                fields="id, parents",
-            ).execute()
+            # New spreadsheets always start in the Drive root, so no lookup is needed
+            self._execute(
+                self._drive_files.update(
+                    fileId=spreadsheet_id,
+                    addParents=folder_id,
+                    removeParents="root",
+                    fields="id, parents",
+                ),
+                http,
+            )
 
             logger.info(f"Moved spreadsheet to folder: {folder_id}")
         except Exception as e:
             logger.warning(f"Could not move spreadsheet to folder: {e}")
 
-    def _share_spreadsheet(self, spreadsheet_id: str, email: str):
-        """Share spreadsheet with user."""
-        try:
-            self.drive_service.permissions().create(
-                fileId=spreadsheet_id,
-                body={"type": "user", "role": "writer", "emailAddress": email},
-                sendNotificationEmail=True,
-            ).execute()
+    def flush_pending(self) -> List[str]:
+        """
+        Move spreadsheets queued by defer_folder_moves in batch requests.
 
-            logger.info(f"Shared spreadsheet with: {email}")
+        Returns:
+            IDs of the spreadsheets that were moved
+        """
+        pending, self._pending_moves = self._pending_moves, []
+        moved = []
+
+        def callback(request_id: str, response: Any, exception: Optional[Exception]):
+            spreadsheet_id = chunk[int(request_id)][0]
+            if exception is not None:
+                logger.warning(f"Could not move spreadsheet {spreadsheet_id}: {exception}")
+            else:
+                moved.append(spreadsheet_id)
+
+        # Drive accepts at most MAX_BATCH_SIZE calls per batch request
+        for start in range(0, len(pending), self.MAX_BATCH_SIZE):
+            chunk = pending[start : start + self.MAX_BATCH_SIZE]
+            try:
+                batch = self.drive_service.new_batch_http_request(callback=callback)
+                for i, (spreadsheet_id, folder_id) in enumerate(chunk):
+                    batch.add(
+                        self._drive_files.update(
+                            fileId=spreadsheet_id,
+                            addParents=folder_id,
+                            removeParents="root",
+                            fields="id, parents",
+                        ),
+                        request_id=str(i),
+                    )
+                batch.execute()
+            except Exception as e:
+                logger.warning(f"Could not move spreadsheets: {e}")
+
+        if moved:
+            logger.info(f"Moved {len(moved)} spreadsheets to their folders")
+        return moved
+
+    def _share_spreadsheet_batch(self, spreadsheet_id: str, emails: List[str], http: Any = None):
+        """Share spreadsheet with several users in one batch request."""
+
+        def callback(request_id: str, response: Any, exception: Optional[Exception]):
+            email = emails[int(request_id)]
+            if exception is not None:
+                logger.warning(f"Could not share spreadsheet with {email}: {exception}")
+            else:
+                logger.info(f"Shared spreadsheet with: {email}")
+
+        try:
+            batch = self.drive_service.new_batch_http_request(callback=callback)
+            for i, email in enumerate(emails):
+                batch.add(
+                    self._drive_permissions.create(
+                        fileId=spreadsheet_id,
+                        body={"type": "user", "role": "writer", "emailAddress": email},
+                        sendNotificationEmail=True,
+                    ),
+                    request_id=str(i),
+                )
+            batch.execute(http=http)
         except Exception as e:
-            logger.warning(f"Could not share spreadsheet with {email}: {e}")
+            logger.warning(f"Could not share spreadsheet: {e}")
 
     def _save_local_backup(self, minutes: Minutes, meeting_id: str, sheet_url: str):
         """Save local backup of spreadsheet info."""
@@ -395,14 +566,13 @@ class GoogleSheetsRenderer(OutputRenderer):
         backup_data = {
             "meeting_id": meeting_id,
             "google_sheet_url": sheet_url,
-            "generated_at": minutes.generated_at.isoformat(),
+            "generated_at": minutes.generated_at_iso,
             "action_items_count": len(minutes.action_items),
             "decisions_count": len(minutes.decisions),
         }
 
         backup_path = meeting_dir / "google_sheet_info.json"
-        with open(backup_path, "w", encoding="utf-8") as f:
-            json.dump(backup_data, f, indent=2)
+        atomic_write(backup_path, dumps_json(backup_data, indent=True))
 
     def _create_mock_output(self, minutes: Minutes, meeting_id: str) -> str:
         """Create mock output when API not available."""
@@ -416,15 +586,14 @@ class GoogleSheetsRenderer(OutputRenderer):
         backup_data = {
             "meeting_id": meeting_id,
             "google_sheet_url": mock_url,
-            "generated_at": minutes.generated_at.isoformat(),
+            "generated_at": minutes.generated_at_iso,
             "action_items_count": len(minutes.action_items),
             "decisions_count": len(minutes.decisions),
             "note": "Mock mode - no actual Google Spreadsheet created",
         }
 
         backup_path = meeting_dir / "google_sheet_info.json"
-        with open(backup_path, "w", encoding="utf-8") as f:
-            json.dump(backup_data, f, indent=2)
+        atomic_write(backup_path, dumps_json(backup_data, indent=True))
 
         return mock_url
 
@@ -11,6 +11,8 @@ from typing import Any, Dict
 
 from ..core.models import Minutes
 from ..core.providers import OutputRenderer
+from ..utils.files import atomic_write
+from ..utils.serialization import dumps_json
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +33,7 @@ class JSONRenderer(OutputRenderer):
             filename_template: Template for filename (default: minutes.json)
             indent: JSON indentation (default: 2)
             include_metadata: Include full metadata (default: True)
+            include_statistics: Include item counts (default: True)
             schema_version: JSON schema version (default: "1.0")
         """
         super().__init__(config)
@@ -38,6 +41,7 @@ class JSONRenderer(OutputRenderer):
         self.filename_template = config.get("filename_template", "minutes.json")
         self.indent = config.get("indent", 2)
         self.include_metadata = config.get("include_metadata", True)
+        self.include_statistics = config.get("include_statistics", True)
         self.schema_version = config.get("schema_version", "1.0")
 
     def render(self, minutes: Minutes, meeting_id: str) -> str:
@@ -62,8 +66,14 @@ class JSONRenderer(OutputRenderer):
 
         # Write file
         output_path = meeting_dir / self.filename_template
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=self.indent, ensure_ascii=False, default=str)
+        if self.indent == 2:
+            # Fast path: orjson (when installed) writes this layout byte for byte
+            content = dumps_json(data, indent=True)
+        else:
+            content = json.dumps(data, indent=self.indent, ensure_ascii=False, default=str).encode(
+                "utf-8"
+            )
+        atomic_write(output_path, content)
 
         logger.info(f"JSON saved to: {output_path}")
         return str(output_path)
@@ -73,7 +83,7 @@ class JSONRenderer(OutputRenderer):
         data = {
             "$schema_version": self.schema_version,
             "meeting_id": meeting_id,
-            "generated_at": minutes.generated_at.isoformat(),
+            "generated_at": minutes.generated_at_iso,
             "summary": minutes.summary,
             "key_points": minutes.key_points,
             "participants": minutes.participants,
@@ -96,17 +106,18 @@ class JSONRenderer(OutputRenderer):
         if minutes.url:
             data["notebooklm_url"] = minutes.url
 
-        # Add metadata if requested
+        # Add metadata if requested (by reference; it can hold large transcripts)
         if self.include_metadata:
             data["metadata"] = minutes.metadata
 
-        # Add statistics
-        data["statistics"] = {
-            "total_decisions": len(minutes.decisions),
-            "total_action_items": len(minutes.action_items),
-            "total_key_points": len(minutes.key_points),
-            "total_participants": len(minutes.participants),
-        }
+        # Add statistics if requested
+        if self.include_statistics:
+            data["statistics"] = {
+                "total_decisions": len(minutes.decisions),
+                "total_action_items": len(minutes.action_items),
+                "total_key_points": len(minutes.key_points),
+                "total_participants": len(minutes.participants),
+            }
 
         return data
 
@@ -13,6 +13,30 @@ from ..core.providers import OutputRenderer
 
 logger = logging.getLogger(__name__)
 
+# Static section headers, each followed by its blank line
+_SUMMARY_HEADER = "## Summary\n"
+_KEY_POINTS_HEADER = "## Key Points\n"
+_PARTICIPANTS_HEADER = "## Participants\n"
+_DECISIONS_HEADER = "## Decisions\n"
+_ACTION_ITEMS_HEADER = (
+    "## Action Items\n\n"
+    "| # | Description | Assignee | Deadline | Priority |\n"
+    "|---|-------------|----------|----------|----------|"
+)
+_RESOURCES_HEADER = "## Additional Resources\n"
+_FOOTER_RULE = "---\n"
+
+# Static metadata table and table of contents lines, pre-joined
+_METADATA_HEADER = "| Property | Value |\n|----------|-------|"
+_TOC_HEADER = "## Table of Contents\n\n- [Summary](#summary)"
+_TOC_KEY_POINTS = "- [Key Points](#key-points)"
+_TOC_PARTICIPANTS = "- [Participants](#participants)"
+_TOC_DECISIONS = "- [Decisions](#decisions)"
+_TOC_ACTION_ITEMS = "- [Action Items](#action-items)"
+_TOC_RESOURCES = "- [Additional Resources](#additional-resources)"
+
+_ACTION_ITEM_ROW = "| {} | {} | {} | {} | {} |".format
+
 
 class MarkdownRenderer(OutputRenderer):
     """
@@ -41,6 +65,13 @@ class MarkdownRenderer(OutputRenderer):
         self.template = config.get("template", "default")
         self.language = config.get("language", "en")
 
+        # Front-matter sections depend only on config, so resolve them once
+        self._front_sections = []
+        if self.include_metadata:
+            self._front_sections.append(self._generate_metadata)
+        if self.include_toc:
+            self._front_sections.append(self._generate_toc)
+
     def render(self, minutes: Minutes, meeting_id: str) -> str:
         """
         Render minutes to Markdown file.
@@ -63,8 +94,7 @@ class MarkdownRenderer(OutputRenderer):
 
         # Write file
         output_path = meeting_dir / self.filename_template
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        output_path.write_bytes(content.encode("utf-8"))
 
         logger.info(f"Markdown saved to: {output_path}")
         return str(output_path)
@@ -72,94 +102,75 @@ class MarkdownRenderer(OutputRenderer):
     def _generate_markdown(self, minutes: Minutes, meeting_id: str) -> str:
         """Generate Markdown content."""
         lines = []
+        append = lines.append
 
         # Title
         title = minutes.metadata.get("title", f"Meeting Minutes: {meeting_id}")
-        lines.append(f"# {title}")
-        lines.append("")
+        append(f"# {title}\n")
 
-        # Metadata section
-        if self.include_metadata:
-            lines.extend(self._generate_metadata(minutes, meeting_id))
-            lines.append("")
-
-        # Table of Contents
-        if self.include_toc:
-            lines.extend(self._generate_toc(minutes))
-            lines.append("")
+        # Metadata section and table of contents
+        for section in self._front_sections:
+            lines.extend(section(minutes, meeting_id))
+            append("")
 
         # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(minutes.summary)
-        lines.append("")
+        lines.extend((_SUMMARY_HEADER, minutes.summary, ""))
 
         # Key Points
         if minutes.key_points:
-            lines.append("## Key Points")
-            lines.append("")
-            for point in minutes.key_points:
-                lines.append(f"- {point}")
-            lines.append("")
+            append(_KEY_POINTS_HEADER)
+            lines.extend(f"- {point}" for point in minutes.key_points)
+            append("")
 
         # Participants
         if minutes.participants:
-            lines.append("## Participants")
-            lines.append("")
-            for participant in minutes.participants:
-                lines.append(f"- {participant}")
-            lines.append("")
+            append(_PARTICIPANTS_HEADER)
+            lines.extend(f"- {participant}" for participant in minutes.participants)
+            append("")
 
         # Decisions
         if minutes.decisions:
-            lines.append("## Decisions")
-            lines.append("")
+            append(_DECISIONS_HEADER)
             for i, decision in enumerate(minutes.decisions, 1):
-                lines.append(f"### Decision {i}")
-                lines.append("")
-                lines.append(f"**Description:** {decision.description}")
+                append(f"### Decision {i}\n")
+                append(f"**Description:** {decision.description}")
                 if decision.responsible:
-                    lines.append(f"**Responsible:** {decision.responsible}")
+                    append(f"**Responsible:** {decision.responsible}")
                 if decision.deadline:
-                    lines.append(f"**Deadline:** {decision.deadline}")
-                lines.append("")
+                    append(f"**Deadline:** {decision.deadline}")
+                append("")
 
         # Action Items
         if minutes.action_items:
-            lines.append("## Action Items")
-            lines.append("")
-            lines.append("| # | Description | Assignee | Deadline | Priority |")
-            lines.append("|---|-------------|----------|----------|----------|")
-            for i, item in enumerate(minutes.action_items, 1):
-                assignee = item.assignee or "-"
-                deadline = item.deadline or "-"
-                priority = item.priority or "-"
-                lines.append(f"| {i} | {item.description} | {assignee} | {deadline} | {priority} |")
-            lines.append("")
+            append(_ACTION_ITEMS_HEADER)
+            lines.extend(
+                _ACTION_ITEM_ROW(
+                    i,
+                    item.description,
+                    item.assignee or "-",
+                    item.deadline or "-",
+                    item.priority or "-",
+                )
+                for i, item in enumerate(minutes.action_items, 1)
+            )
+            append("")
 
         # NotebookLM URL
         if minutes.url:
-            lines.append("## Additional Resources")
-            lines.append("")
-            lines.append(f"- [NotebookLM Notebook]({minutes.url})")
-            lines.append("")
+            lines.extend((_RESOURCES_HEADER, f"- [NotebookLM Notebook]({minutes.url})", ""))
 
         # Footer
-        lines.append("---")
-        lines.append("")
-        lines.append(
-            f"*Generated by MeetScribe at {minutes.generated_at.strftime('%Y-%m-%d %H:%M:%S')}*"
-        )
+        lines.extend((_FOOTER_RULE, f"*Generated by MeetScribe at {minutes.generated_at_text}*"))
 
         return "\n".join(lines)
 
     def _generate_metadata(self, minutes: Minutes, meeting_id: str) -> list:
         """Generate metadata section."""
-        lines = []
-        lines.append("| Property | Value |")
-        lines.append("|----------|-------|")
-        lines.append(f"| Meeting ID | `{meeting_id}` |")
-        lines.append(f"| Generated | {minutes.generated_at.strftime('%Y-%m-%d %H:%M:%S')} |")
+        lines = [
+            _METADATA_HEADER,
+            f"| Meeting ID | `{meeting_id}` |",
+            f"| Generated | {minutes.generated_at_text} |",
+        ]
 
         if "llm_engine" in minutes.metadata:
             lines.append(f"| LLM Engine | {minutes.metadata['llm_engine']} |")
@@ -168,22 +179,19 @@ class MarkdownRenderer(OutputRenderer):
 
         return lines
 
-    def _generate_toc(self, minutes: Minutes) -> list:
+    def _generate_toc(self, minutes: Minutes, meeting_id: str) -> list:
         """Generate table of contents."""
-        lines = []
-        lines.append("## Table of Contents")
-        lines.append("")
-        lines.append("- [Summary](#summary)")
+        lines = [_TOC_HEADER]
         if minutes.key_points:
-            lines.append("- [Key Points](#key-points)")
+            lines.append(_TOC_KEY_POINTS)
         if minutes.participants:
-            lines.append("- [Participants](#participants)")
+            lines.append(_TOC_PARTICIPANTS)
         if minutes.decisions:
-            lines.append("- [Decisions](#decisions)")
+            lines.append(_TOC_DECISIONS)
         if minutes.action_items:
-            lines.append("- [Action Items](#action-items)")
+            lines.append(_TOC_ACTION_ITEMS)
         if minutes.url:
-            lines.append("- [Additional Resources](#additional-resources)")
+            lines.append(_TOC_RESOURCES)
         return lines
 
     def validate_config(self) -> bool:
@@ -4,15 +4,30 @@ PDF OUTPUT renderer for MeetScribe.
 Generates formatted PDF meeting minutes using ReportLab.
 """
 
+import hashlib
 import logging
+import os
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Dict
 
 from ..core.models import Minutes
 from ..core.providers import OutputRenderer
+from ..utils.files import atomic_write
+from ..utils.serialization import dumps_json
 
 logger = logging.getLogger(__name__)
 
+# Action items table style; it does not depend on renderer config
+_action_table_style = None
+
+_ACTION_TABLE_HEADER = ("#", "Description", "Assignee", "Deadline", "Priority")
+
+# Part of the content digest; bump when the generated layout changes so
+# skip_unchanged rebuilds PDFs made by older versions
+_LAYOUT_VERSION = 1
+
 
 class PDFRenderer(OutputRenderer):
     """
@@ -36,6 +51,8 @@ class PDFRenderer(OutputRenderer):
             include_logo: Include logo (default: False)
             logo_path: Path to logo file
             company_name: Company name for header
+            skip_unchanged: Keep an existing PDF when the minutes and config
+                are unchanged since it was built (default: True)
         """
         super().__init__(config)
         self.output_dir = Path(config.get("output_dir", "./meetings"))
@@ -48,6 +65,7 @@ class PDFRenderer(OutputRenderer):
         self.include_logo = config.get("include_logo", False)
         self.logo_path = config.get("logo_path")
         self.company_name = config.get("company_name", "")
+        self.skip_unchanged = config.get("skip_unchanged", True)
 
         # Initialize reportlab
         self._init_reportlab()
@@ -56,6 +74,7 @@ class PDFRenderer(OutputRenderer):
         """Initialize ReportLab components."""
         try:
             from reportlab.lib import colors
+            from reportlab.lib.enums import TA_CENTER
             from reportlab.lib.pagesizes import A4, LETTER
             from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
             from reportlab.lib.units import cm, inch
@@ -80,6 +99,24 @@ class PDFRenderer(OutputRenderer):
             self._rl_inch = inch
             self._rl_cm = cm
 
+            # Store the names used per render so they are imported only once
+            self._rl = SimpleNamespace(
+                ListFlowable=ListFlowable,
+                ListItem=ListItem,
+                Paragraph=Paragraph,
+                SimpleDocTemplate=SimpleDocTemplate,
+                Spacer=Spacer,
+                Table=Table,
+                TableStyle=TableStyle,
+                ParagraphStyle=ParagraphStyle,
+                getSampleStyleSheet=getSampleStyleSheet,
+                TA_CENTER=TA_CENTER,
+                colors=colors,
+            )
+
+            # Paragraph and table styles, built on first render
+            self._styles = None
+
         except ImportError:
             logger.warning(
                 "reportlab not installed. Run: pip install reportlab\n"
@@ -98,7 +135,7 @@ class PDFRenderer(OutputRenderer):
         Returns:
             Path to generated PDF file
         """
-        logger.info(f"Rendering PDF output for {meeting_id}")
+        logger.info("Rendering PDF output for %s", meeting_id)
 
         # Create output directory
         meeting_dir = self.output_dir / meeting_id
@@ -107,38 +144,53 @@ class PDFRenderer(OutputRenderer):
         output_path = meeting_dir / self.filename_template
 
         if self.reportlab_available:
-            self._generate_pdf(minutes, meeting_id, output_path)
+            digest_path = meeting_dir / f".{self.filename_template}.sha256"
+            digest = self._content_digest(minutes, meeting_id)
+            if (
+                self.skip_unchanged
+                and output_path.exists()
+                and digest_path.exists()
+                and digest_path.read_text(encoding="utf-8") == digest
+            ):
+                logger.info("PDF unchanged, keeping: %s", output_path)
+                return str(output_path)
+
+            # Build beside the target so a failed build leaves the old PDF
+            # and its digest matching each other; the pid/thread suffix keeps
+            # concurrent renders of the same meeting apart
+            temp_path = (
+                meeting_dir / f".{self.filename_template}.{os.getpid()}-{threading.get_ident()}.tmp"
+            )
+            try:
+                self._generate_pdf(minutes, meeting_id, temp_path)
+                os.replace(temp_path, output_path)
+            finally:
+                temp_path.unlink(missing_ok=True)
+            atomic_write(digest_path, digest)
         else:
             self._generate_placeholder(minutes, meeting_id, output_path)
 
-        logger.info(f"PDF saved to: {output_path}")
+        logger.info("PDF saved to: %s", output_path)
         return str(output_path)
 
-    def _generate_pdf(self, minutes: Minutes, meeting_id: str, output_path: Path):
-        """Generate actual PDF using ReportLab."""
-        from reportlab.lib import colors
-        from reportlab.lib.enums import TA_CENTER
-        from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-        from reportlab.platypus import (
-            Paragraph,
-            SimpleDocTemplate,
-            Spacer,
-            Table,
-            TableStyle,
-        )
-
-        # Create document
-        doc = SimpleDocTemplate(
-            str(output_path),
-            pagesize=self.page_size,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=72,
-        )
-
-        # Get styles
-        styles = getSampleStyleSheet()
+    def _content_digest(self, minutes: Minutes, meeting_id: str) -> str:
+        """Hash everything the generated PDF depends on."""
+        payload = {
+            "layout_version": _LAYOUT_VERSION,
+            "meeting_id": meeting_id,
+            "minutes": minutes.to_dict(),
+            "config": self.config,
+        }
+        return hashlib.sha256(dumps_json(payload)).hexdigest()
+
+    def _get_styles(self) -> Dict[str, Any]:
+        """Build the paragraph styles once per renderer."""
+        if self._styles is not None:
+            return self._styles
+
+        rl = self._rl
+        ParagraphStyle = rl.ParagraphStyle
+        styles = rl.getSampleStyleSheet()
 
         # Custom styles
         title_style = ParagraphStyle(
@@ -146,7 +198,7 @@ class PDFRenderer(OutputRenderer):
             parent=styles["Heading1"],
             fontSize=self.title_font_size,
             spaceAfter=30,
-            alignment=TA_CENTER,
+            alignment=rl.TA_CENTER,
         )
 
         heading_style = ParagraphStyle(
@@ -161,6 +213,61 @@ class PDFRenderer(OutputRenderer):
             "CustomBody", parent=styles["Normal"], fontSize=self.body_font_size, spaceAfter=10
         )
 
+        self._styles = {
+            "normal": styles["Normal"],
+            "title": title_style,
+            "heading": heading_style,
+            "body": body_style,
+            "table": self._get_action_table_style(),
+        }
+        return self._styles
+
+    def _get_action_table_style(self) -> Any:
+        """Return the action items TableStyle, built once and shared by all renderers."""
+        global _action_table_style
+        if _action_table_style is None:
+            colors = self._rl.colors
+            _action_table_style = self._rl.TableStyle(
+                [
+                    ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                    ("FONTSIZE", (0, 0), (-1, 0), 10),
+                    ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+                    ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+                    ("TEXTCOLOR", (0, 1), (-1, -1), colors.black),
+                    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+                    ("FONTSIZE", (0, 1), (-1, -1), 9),
+                    ("ALIGN", (1, 1), (1, -1), "LEFT"),
+                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
+                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                ]
+            )
+        return _action_table_style
+
+    def _generate_pdf(self, minutes: Minutes, meeting_id: str, output_path: Path):
+        """Generate actual PDF using ReportLab."""
+        rl = self._rl
+        Paragraph = rl.Paragraph
+        Spacer = rl.Spacer
+
+        # Create document
+        doc = rl.SimpleDocTemplate(
+            str(output_path),
+            pagesize=self.page_size,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=72,
+        )
+
+        styles = self._get_styles()
+        normal_style = styles["normal"]
+        title_style = styles["title"]
+        heading_style = styles["heading"]
+        body_style = styles["body"]
+
         # Build document content
         content = []
 
@@ -169,10 +276,10 @@ class PDFRenderer(OutputRenderer):
         content.append(Paragraph(title, title_style))
 
         # Metadata
-        meta_text = f"Generated: {minutes.generated_at.strftime('%Y-%m-%d %H:%M:%S')}"
+        meta_text = f"Generated: {minutes.generated_at_text}"
         if self.company_name:
             meta_text = f"{self.company_name} | {meta_text}"
-        content.append(Paragraph(meta_text, styles["Normal"]))
+        content.append(Paragraph(meta_text, normal_style))
         content.append(Spacer(1, 20))
 
         # Summary
@@ -182,8 +289,12 @@ class PDFRenderer(OutputRenderer):
         # Key Points
         if minutes.key_points:
             content.append(Paragraph("Key Points", heading_style))
-            for point in minutes.key_points:
-                content.append(Paragraph(f"• {point}", body_style))
+            content.append(
+                rl.ListFlowable(
+                    [rl.ListItem(Paragraph(point, body_style)) for point in minutes.key_points],
+                    bulletType="bullet",
+                )
+            )
 
         # Participants
         if minutes.participants:
@@ -195,51 +306,33 @@ class PDFRenderer(OutputRenderer):
         if minutes.decisions:
             content.append(Paragraph("Decisions", heading_style))
             for i, decision in enumerate(minutes.decisions, 1):
-                decision_text = f"<b>{i}.</b> {decision.description}"
+                parts = [f"<b>{i}.</b> {decision.description}"]
                 if decision.responsible:
-                    decision_text += f" <i>(Responsible: {decision.responsible})</i>"
+                    parts.append(f" <i>(Responsible: {decision.responsible})</i>")
                 if decision.deadline:
-                    decision_text += f" <i>(Deadline: {decision.deadline})</i>"
-                content.append(Paragraph(decision_text, body_style))
+                    parts.append(f" <i>(Deadline: {decision.deadline})</i>")
+                content.append(Paragraph("".join(parts), body_style))
 
         # Action Items Table
         if minutes.action_items:
             content.append(Paragraph("Action Items", heading_style))
 
             # Table data
-            table_data = [["#", "Description", "Assignee", "Deadline", "Priority"]]
-            for i, item in enumerate(minutes.action_items, 1):
-                table_data.append(
-                    [
-                        str(i),
-                        item.description,
-                        item.assignee or "-",
-                        item.deadline or "-",
-                        item.priority or "-",
-                    ]
+            table_data = [_ACTION_TABLE_HEADER]
+            table_data.extend(
+                (
+                    str(i),
+                    item.description,
+                    item.assignee or "-",
+                    item.deadline or "-",
+                    item.priority or "-",
                 )
+                for i, item in enumerate(minutes.action_items, 1)
+            )
 
             # Create table
-            table = Table(table_data, colWidths=[30, 200, 80, 80, 60])
-            table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, 0), 10),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                        ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                        ("TEXTCOLOR", (0, 1), (-1, -1), colors.black),
-                        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                        ("FONTSIZE", (0, 1), (-1, -1), 9),
-                        ("ALIGN", (1, 1), (1, -1), "LEFT"),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                    ]
-                )
-            )
+            table = rl.Table(table_data, colWidths=[30, 200, 80, 80, 60])
+            table.setStyle(styles["table"])
             content.append(table)
 
         # Footer
@@ -247,7 +340,7 @@ class PDFRenderer(OutputRenderer):
         footer_text = "<i>Generated by MeetScribe</i>"
         if minutes.url:
             footer_text += f" | <a href='{minutes.url}'>View in NotebookLM</a>"
-        content.append(Paragraph(footer_text, styles["Normal"]))
+        content.append(Paragraph(footer_text, normal_style))
 
         # Build PDF
         doc.build(content)
@@ -259,7 +352,7 @@ class PDFRenderer(OutputRenderer):
 ======================
 
 Meeting ID: {meeting_id}
-Generated: {minutes.generated_at.isoformat()}
+Generated: {minutes.generated_at_iso}
 
 Summary:
 {minutes.summary}
@@ -267,8 +360,7 @@ Summary:
 Note: This is a placeholder file. Install reportlab to generate actual PDFs:
 pip install reportlab
 """
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        output_path.write_text(content, encoding="utf-8")
 
     def validate_config(self) -> bool:
         """Validate renderer configuration."""
@@ -4,13 +4,14 @@ URL OUTPUT renderer for MeetScribe.
 Simply displays the NotebookLM URL and optionally saves basic info.
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import Any, Dict
 
 from ..core.models import Minutes
 from ..core.providers import OutputRenderer
+from ..utils.files import atomic_write
+from ..utils.serialization import dumps_json
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +46,7 @@ class URLRenderer(OutputRenderer):
         Returns:
             NotebookLM URL or path to saved metadata
         """
-        logger.info(f"Rendering URL output for {meeting_id}")
+        logger.info("Rendering URL output for %s", meeting_id)
 
         # Get NotebookLM URL
         url = minutes.url
@@ -55,13 +56,13 @@ class URLRenderer(OutputRenderer):
 
         # Display URL
         logger.info("=" * 80)
-        logger.info(f"NotebookLM URL: {url}")
+        logger.info("NotebookLM URL: %s", url)
         logger.info("=" * 80)
 
         # Optionally save metadata
         if self.save_metadata:
             metadata_path = self._save_metadata(minutes, meeting_id)
-            logger.info(f"Metadata saved to: {metadata_path}")
+            logger.info("Metadata saved to: %s", metadata_path)
             return str(metadata_path)
 
         return url
@@ -92,14 +93,13 @@ class URLRenderer(OutputRenderer):
             "action_items_count": len(minutes.action_items),
             "key_points_count": len(minutes.key_points),
             "participants": minutes.participants,
-            "generated_at": minutes.generated_at.isoformat(),
+            "generated_at": minutes.generated_at_iso,
             "metadata": minutes.metadata,
         }
 
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        atomic_write(metadata_path, dumps_json(metadata, indent=True))
 
-        logger.info(f"Metadata saved: {metadata_path}")
+        logger.info("Metadata saved: %s", metadata_path)
         return metadata_path
 
     def validate_config(self) -> bool:
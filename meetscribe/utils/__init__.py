@@ -7,14 +7,20 @@ Audio processing, file management, and helper functions.
 from .audio import (
     SUPPORTED_FORMATS,
     analyze_audio_quality,
+    analyze_audio_quality_batch,
     convert_audio,
+    convert_audio_to_stream,
     extract_audio_from_video,
     get_audio_duration,
+    get_audio_hash,
     get_audio_info,
+    get_audio_info_batch,
     get_mime_type,
     is_valid_audio_format,
+    iter_audio_pcm,
     merge_audio,
     normalize_audio,
+    preprocess_audio,
     remove_silence,
     split_audio,
 )
@@ -22,6 +28,7 @@ from .files import (
     archive_meeting,
     atomic_write,
     calculate_file_hash,
+    calculate_hashes,
     cleanup_empty_directories,
     cleanup_old_files,
     create_temp_directory,
@@ -32,6 +39,7 @@ from .files import (
     get_directory_size,
     get_file_info,
     get_meeting_directory,
+    iter_file_chunks,
     list_meeting_directories,
     load_json,
     safe_copy,
@@ -39,18 +47,32 @@ from .files import (
     safe_move,
     save_json,
 )
+from .rate_limit import TokenBucket
+from .retry import (
+    get_status_code,
+    is_retryable_status,
+    is_retryable_write_status,
+    retry_with_backoff,
+)
+from .serialization import dumps_json, loads_json
 
 __all__ = [
     # Audio utilities
     "get_audio_info",
+    "get_audio_info_batch",
     "get_audio_duration",
+    "get_audio_hash",
     "convert_audio",
+    "convert_audio_to_stream",
+    "iter_audio_pcm",
     "normalize_audio",
     "remove_silence",
+    "preprocess_audio",
     "extract_audio_from_video",
     "split_audio",
     "merge_audio",
     "analyze_audio_quality",
+    "analyze_audio_quality_batch",
     "is_valid_audio_format",
     "get_mime_type",
     "SUPPORTED_FORMATS",
@@ -60,6 +82,8 @@ __all__ = [
     "list_meeting_directories",
     "find_files_by_extension",
     "calculate_file_hash",
+    "calculate_hashes",
+    "iter_file_chunks",
     "get_file_info",
     "format_file_size",
     "safe_copy",
@@ -74,4 +98,14 @@ __all__ = [
     "atomic_write",
     "get_directory_size",
     "archive_meeting",
+    # Rate limiting utilities
+    "TokenBucket",
+    # Retry utilities
+    "retry_with_backoff",
+    "is_retryable_status",
+    "is_retryable_write_status",
+    "get_status_code",
+    # Serialization utilities
+    "dumps_json",
+    "loads_json",
 ]
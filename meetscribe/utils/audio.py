@@ -6,9 +6,17 @@ Provides functions for audio preprocessing, analysis, and conversion.
 
 import json
 import logging
+import os
+import re
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .files import _name_suffix, calculate_file_hash
+from .serialization import loads_json
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +32,23 @@ SUPPORTED_FORMATS = {
     ".aac": "audio/aac",
 }
 
+_SUPPORTED_EXTS = frozenset(SUPPORTED_FORMATS)
+
+# ebur128 filter log values
+_LUFS_RE = re.compile(r"I:\s*(-?(?:inf|\d+(?:\.\d+)?))\s*LUFS")
+_PEAK_RE = re.compile(r"Peak:\s*(-?(?:inf|\d+(?:\.\d+)?))\s*dBFS")
+
+
+@lru_cache(maxsize=2)
+def _tool_path(name: str) -> str:
+    """
+    Resolve an ffmpeg tool on PATH once per process.
+
+    Falls back to the bare name so a missing tool still raises
+    FileNotFoundError from subprocess.
+    """
+    return shutil.which(name) or name
+
 
 def get_audio_info(audio_path: Path) -> Dict[str, Any]:
     """
@@ -46,45 +71,7 @@ def get_audio_info(audio_path: Path) -> Dict[str, Any]:
     }
 
     try:
-        # Use ffprobe to get detailed info
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "quiet",
-                "-print_format",
-                "json",
-                "-show_format",
-                "-show_streams",
-                str(audio_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-
-        if result.returncode == 0:
-            probe_data = json.loads(result.stdout)
-
-            # Extract format info
-            if "format" in probe_data:
-                fmt = probe_data["format"]
-                info["duration"] = float(fmt.get("duration", 0))
-                info["bitrate"] = int(fmt.get("bit_rate", 0))
-                info["format_name"] = fmt.get("format_name", "")
-                info["format_long_name"] = fmt.get("format_long_name", "")
-
-            # Extract audio stream info
-            for stream in probe_data.get("streams", []):
-                if stream.get("codec_type") == "audio":
-                    info["codec"] = stream.get("codec_name", "")
-                    info["codec_long_name"] = stream.get("codec_long_name", "")
-                    info["samplerate"] = int(stream.get("sample_rate", 0))
-                    info["channels"] = stream.get("channels", 0)
-                    info["channel_layout"] = stream.get("channel_layout", "")
-                    info["bits_per_sample"] = stream.get("bits_per_sample", 0)
-                    break
-
+        info.update(_run_ffprobe(audio_path))
     except FileNotFoundError:
         logger.warning("ffprobe not found - using basic file info only")
     except subprocess.TimeoutExpired:
@@ -92,11 +79,154 @@ def get_audio_info(audio_path: Path) -> Dict[str, Any]:
     except json.JSONDecodeError:
         logger.warning("Failed to parse ffprobe output")
     except Exception as e:
-        logger.warning(f"Error getting audio info: {e}")
+        logger.warning("Error getting audio info: %s", e)
 
     return info
 
 
+def _run_ffmpeg(
+    args: List[str],
+    timeout: float,
+    input: Optional[bytes] = None,
+    capture_stdout: bool = False,
+) -> Optional[bytes]:
+    """
+    Run ffmpeg with only errors on stderr.
+
+    Progress output is suppressed and stderr is decoded only on failure,
+    so successful runs cost no Python-side log handling. ffmpeg never
+    waits on an inherited stdin.
+
+    Args:
+        args: ffmpeg arguments (without the executable)
+        timeout: Timeout in seconds
+        input: Data to feed to ffmpeg on stdin (read with ``-i pipe:0``)
+        capture_stdout: Return what ffmpeg writes to stdout (``pipe:1``)
+
+    Returns:
+        Raw stdout if capture_stdout is set, otherwise None
+    """
+    cmd = [_tool_path("ffmpeg"), "-nostats", "-loglevel", "error"]
+    if input is None:
+        cmd.append("-nostdin")
+    cmd.extend(args)
+    try:
+        result = subprocess.run(
+            cmd,
+            input=input,
+            stdin=subprocess.DEVNULL if input is None else None,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=timeout,
+        )
+    except FileNotFoundError:
+        raise RuntimeError("ffmpeg not found - please install ffmpeg")
+
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed: {result.stderr.decode('utf-8', 'replace')}")
+
+    return result.stdout if capture_stdout else None
+
+
+def _run_ffprobe(audio_path: Path) -> Dict[str, Any]:
+    """
+    Run ffprobe on a file and extract format and audio stream fields.
+
+    Args:
+        audio_path: Path to audio file
+
+    Returns:
+        Probed fields (empty if ffprobe failed)
+    """
+    result = subprocess.run(
+        [
+            _tool_path("ffprobe"),
+            "-v",
+            "quiet",
+            "-print_format",
+            "json",
+            "-show_format",
+            "-show_streams",
+            str(audio_path),
+        ],
+        capture_output=True,
+        timeout=30,
+    )
+
+    info: Dict[str, Any] = {}
+    if result.returncode != 0:
+        return info
+
+    probe_data = loads_json(result.stdout)
+
+    # Extract format info
+    if "format" in probe_data:
+        fmt = probe_data["format"]
+        info["duration"] = float(fmt.get("duration", 0))
+        info["bitrate"] = int(fmt.get("bit_rate", 0))
+        info["format_name"] = fmt.get("format_name", "")
+        info["format_long_name"] = fmt.get("format_long_name", "")
+
+    # Extract audio stream info
+    for stream in probe_data.get("streams", []):
+        if stream.get("codec_type") == "audio":
+            info["codec"] = stream.get("codec_name", "")
+            info["codec_long_name"] = stream.get("codec_long_name", "")
+            info["samplerate"] = int(stream.get("sample_rate", 0))
+            info["channels"] = stream.get("channels", 0)
+            info["channel_layout"] = stream.get("channel_layout", "")
+            info["bits_per_sample"] = stream.get("bits_per_sample", 0)
+            break
+
+    return info
+
+
+def get_audio_info_batch(
+    audio_paths: List[Path], max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Extract audio information for several files with concurrent ffprobe runs.
+
+    Probing is dominated by process startup, so running the probes in
+    parallel cuts wall time for e.g. all segments from split_audio().
+
+    Args:
+        audio_paths: Paths to audio files
+        max_workers: Maximum concurrent ffprobe processes (default: CPU count)
+
+    Returns:
+        Audio metadata dictionaries, in the order of audio_paths
+    """
+    return _map_concurrently(get_audio_info, audio_paths, max_workers)
+
+
+def _map_concurrently(
+    func: Callable[[Path], Dict[str, Any]], paths: List[Path], max_workers: Optional[int]
+) -> List[Dict[str, Any]]:
+    """Apply a subprocess-bound function to each path in a thread pool."""
+    if len(paths) <= 1:
+        return [func(path) for path in paths]
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(func, paths))
+
+
+def get_audio_hash(audio_path: Path) -> str:
+    """
+    Get the SHA-256 hex digest of an audio file, e.g. to deduplicate segments.
+
+    Args:
+        audio_path: Path to audio file
+
+    Returns:
+        Hex digest string
+    """
+    if not audio_path.exists():
+        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+    return calculate_file_hash(audio_path, "sha256")
+
+
 def get_audio_duration(audio_path: Path) -> float:
     """
     Get audio duration in seconds.
@@ -111,6 +241,98 @@ def get_audio_duration(audio_path: Path) -> float:
     return info.get("duration", 0.0)
 
 
+def _silenceremove_filter(silence_threshold: float, min_silence_duration: float) -> str:
+    """Build the silenceremove filter for the given parameters."""
+    return (
+        f"silenceremove=start_periods=1:start_silence={min_silence_duration}:"
+        f"start_threshold={silence_threshold}dB:"
+        f"stop_periods=-1:stop_silence={min_silence_duration}:"
+        f"stop_threshold={silence_threshold}dB"
+    )
+
+
+def _loudnorm_filter(target_lufs: float, target_peak: float) -> str:
+    """Build the loudnorm filter for the given parameters."""
+    return f"loudnorm=I={target_lufs}:TP={target_peak}:LRA=11"
+
+
+# Filters for the default parameters, which almost every call uses
+_DEFAULT_SILENCEREMOVE = _silenceremove_filter(-50.0, 0.5)
+_DEFAULT_LOUDNORM = _loudnorm_filter(-16.0, -1.0)
+
+
+def preprocess_audio(
+    input_path: Path,
+    output_path: Path,
+    *,
+    samplerate: Optional[int] = None,
+    channels: Optional[int] = None,
+    bitrate: Optional[str] = None,
+    loudnorm: bool = True,
+    target_lufs: float = -16.0,
+    target_peak: float = -1.0,
+    silence: bool = True,
+    silence_threshold: float = -50.0,
+    min_silence_duration: float = 0.5,
+) -> Path:
+    """
+    Resample, remove silence and normalize audio in a single ffmpeg pass.
+
+    Chaining the filters in one invocation decodes and encodes the audio
+    once instead of once per step, and leaves no intermediate files.
+
+    Args:
+        input_path: Input audio file path
+        output_path: Output file path
+        samplerate: Target sample rate (default: keep input rate)
+        channels: Number of channels (default: keep input channels)
+        bitrate: Target bitrate (e.g., "128k")
+        loudnorm: Apply EBU R128 loudness normalization
+        target_lufs: Target integrated loudness in LUFS
+        target_peak: Maximum peak level in dB
+        silence: Remove silence
+        silence_threshold: Silence threshold in dB
+        min_silence_duration: Minimum silence duration to remove (seconds)
+
+    Returns:
+        Path to processed file
+    """
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input file not found: {input_path}")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    args = ["-i", str(input_path)]
+
+    filters = []
+    if silence:
+        if (silence_threshold, min_silence_duration) == (-50.0, 0.5):
+            filters.append(_DEFAULT_SILENCEREMOVE)
+        else:
+            filters.append(_silenceremove_filter(silence_threshold, min_silence_duration))
+    if loudnorm:
+        if (target_lufs, target_peak) == (-16.0, -1.0):
+            filters.append(_DEFAULT_LOUDNORM)
+        else:
+            filters.append(_loudnorm_filter(target_lufs, target_peak))
+    if filters:
+        args.extend(["-af", ",".join(filters)])
+
+    if samplerate:
+        args.extend(["-ar", str(samplerate)])
+    if channels:
+        args.extend(["-ac", str(channels)])
+    if bitrate:
+        args.extend(["-b:a", bitrate])
+
+    args.extend(["-y", str(output_path)])  # Overwrite output file
+
+    _run_ffmpeg(args, timeout=600)
+
+    logger.info("Processed %s -> %s", input_path.name, output_path.name)
+    return output_path
+
+
 def convert_audio(
     input_path: Path,
     output_path: Path,
@@ -133,37 +355,94 @@ def convert_audio(
     Returns:
         Path to converted file
     """
+    return preprocess_audio(
+        input_path,
+        output_path,
+        samplerate=samplerate,
+        channels=channels,
+        bitrate=bitrate,
+        loudnorm=False,
+        silence=False,
+    )
+
+
+def convert_audio_to_stream(
+    input_path: Path,
+    samplerate: int = 16000,
+    channels: int = 1,
+) -> subprocess.Popen:
+    """
+    Start ffmpeg decoding audio to raw PCM on its stdout.
+
+    Callers can consume the signed 16-bit little-endian samples as they
+    are produced instead of writing and re-reading an intermediate WAV.
+
+    Args:
+        input_path: Input audio file path
+        samplerate: Target sample rate
+        channels: Number of channels (1=mono, 2=stereo)
+
+    Returns:
+        Running ffmpeg process; read PCM from its stdout
+    """
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
     cmd = [
-        "ffmpeg",
+        _tool_path("ffmpeg"),
         "-i",
         str(input_path),
         "-ar",
         str(samplerate),
         "-ac",
         str(channels),
+        "-f",
+        "s16le",
+        "pipe:1",
     ]
 
-    if bitrate:
-        cmd.extend(["-b:a", bitrate])
-
-    cmd.extend(["-y", str(output_path)])  # Overwrite output file
-
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+        return subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=1 << 20
+        )
+    except FileNotFoundError:
+        raise RuntimeError("ffmpeg not found - please install ffmpeg")
 
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg failed: {result.stderr}")
 
-        logger.info(f"Converted {input_path.name} to {output_path.name}")
-        return output_path
+def iter_audio_pcm(
+    input_path: Path,
+    samplerate: int = 16000,
+    channels: int = 1,
+    chunk_size: int = 1 << 16,
+) -> Iterator[bytes]:
+    """
+    Iterate over raw 16-bit PCM blocks decoded from an audio file.
 
-    except FileNotFoundError:
-        raise RuntimeError("ffmpeg not found - please install ffmpeg")
+    Args:
+        input_path: Input audio file path
+        samplerate: Target sample rate
+        channels: Number of channels (1=mono, 2=stereo)
+        chunk_size: Bytes per block (default: 64KB)
+
+    Yields:
+        Blocks of signed 16-bit little-endian samples
+    """
+    process = convert_audio_to_stream(input_path, samplerate, channels)
+    try:
+        while True:
+            chunk = process.stdout.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+        if process.wait() != 0:
+            raise RuntimeError(f"ffmpeg failed with exit code {process.returncode}")
+    finally:
+        # Stop ffmpeg if the caller stopped consuming early
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
 
 
 def normalize_audio(
@@ -184,35 +463,16 @@ def normalize_audio(
     Returns:
         Path to normalized file
     """
-    if not input_path.exists():
-        raise FileNotFoundError(f"Input file not found: {input_path}")
-
     if output_path is None:
         output_path = input_path.parent / f"{input_path.stem}_normalized{input_path.suffix}"
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    cmd = [
-        "ffmpeg",
-        "-i",
-        str(input_path),
-        "-af",
-        f"loudnorm=I={target_lufs}:TP={target_peak}:LRA=11",
-        "-y",
-        str(output_path),
-    ]
-
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg failed: {result.stderr}")
-
-        logger.info(f"Normalized {input_path.name} -> {output_path.name}")
-        return output_path
-
-    except FileNotFoundError:
-        raise RuntimeError("ffmpeg not found - please install ffmpeg")
+    return preprocess_audio(
+        input_path,
+        output_path,
+        target_lufs=target_lufs,
+        target_peak=target_peak,
+        silence=False,
+    )
 
 
 def remove_silence(
@@ -233,38 +493,16 @@ def remove_silence(
     Returns:
         Path to processed file
     """
-    if not input_path.exists():
-        raise FileNotFoundError(f"Input file not found: {input_path}")
-
     if output_path is None:
         output_path = input_path.parent / f"{input_path.stem}_nosilence{input_path.suffix}"
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    cmd = [
-        "ffmpeg",
-        "-i",
-        str(input_path),
-        "-af",
-        f"silenceremove=start_periods=1:start_silence={min_silence_duration}:"
-        f"start_threshold={silence_threshold}dB:"
-        f"stop_periods=-1:stop_silence={min_silence_duration}:"
-        f"stop_threshold={silence_threshold}dB",
-        "-y",
-        str(output_path),
-    ]
-
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg failed: {result.stderr}")
-
-        logger.info(f"Removed silence from {input_path.name}")
-        return output_path
-
-    except FileNotFoundError:
-        raise RuntimeError("ffmpeg not found - please install ffmpeg")
+    return preprocess_audio(
+        input_path,
+        output_path,
+        loudnorm=False,
+        silence_threshold=silence_threshold,
+        min_silence_duration=min_silence_duration,
+    )
 
 
 def extract_audio_from_video(
@@ -295,11 +533,11 @@ def extract_audio_from_video(
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    cmd = [
-        "ffmpeg",
+    args = [
         "-i",
         str(video_path),
-        "-vn",  # No video
+        # No video: the stream is never decoded, so hardware decode would not help
+        "-vn",
         "-ar",
         str(samplerate),
         "-b:a",
@@ -308,17 +546,10 @@ def extract_audio_from_video(
         str(output_path),
     ]
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+    _run_ffmpeg(args, timeout=600)
 
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg failed: {result.stderr}")
-
-        logger.info(f"Extracted audio from {video_path.name} -> {output_path.name}")
-        return output_path
-
-    except FileNotFoundError:
-        raise RuntimeError("ffmpeg not found - please install ffmpeg")
+    logger.info("Extracted audio from %s -> %s", video_path.name, output_path.name)
+    return output_path
 
 
 def split_audio(
@@ -349,33 +580,29 @@ def split_audio(
 
     output_pattern = str(output_dir / f"{input_path.stem}_%03d.{output_format}")
 
-    cmd = [
-        "ffmpeg",
+    args = [
         "-i",
         str(input_path),
         "-f",
         "segment",
         "-segment_time",
         str(segment_duration),
+        # ffmpeg reports each segment it writes, so the directory isn't rescanned
+        "-segment_list",
+        "pipe:1",
+        "-segment_list_type",
+        "flat",
         "-c",
         "copy",
         "-y",
         output_pattern,
     ]
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=1800)
-
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg failed: {result.stderr}")
+    segment_list = _run_ffmpeg(args, timeout=1800, capture_stdout=True)
 
-        # Get list of created segments
-        segments = sorted(output_dir.glob(f"{input_path.stem}_*.{output_format}"))
-        logger.info(f"Split {input_path.name} into {len(segments)} segments")
-        return segments
-
-    except FileNotFoundError:
-        raise RuntimeError("ffmpeg not found - please install ffmpeg")
+    segments = [output_dir / name for name in segment_list.decode("utf-8").splitlines() if name]
+    logger.info("Split %s into %s segments", input_path.name, len(segments))
+    return segments
 
 
 def merge_audio(
@@ -401,41 +628,28 @@ def merge_audio(
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create concat file
-    concat_file = output_path.parent / "concat_list.txt"
-    with open(concat_file, "w", encoding="utf-8") as f:
-        for path in input_paths:
-            f.write(f"file '{path.absolute()}'\n")
+    # Feed the concat manifest on stdin instead of writing it to disk
+    manifest = "".join(f"file '{path.absolute()}'\n" for path in input_paths)
 
-    cmd = [
-        "ffmpeg",
+    args = [
         "-f",
         "concat",
         "-safe",
         "0",
+        "-protocol_whitelist",
+        "file,pipe",
         "-i",
-        str(concat_file),
+        "pipe:0",
         "-c",
         "copy",
         "-y",
         str(output_path),
     ]
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=1800)
-
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg failed: {result.stderr}")
+    _run_ffmpeg(args, timeout=1800, input=manifest.encode("utf-8"))
 
-        logger.info(f"Merged {len(input_paths)} files -> {output_path.name}")
-        return output_path
-
-    except FileNotFoundError:
-        raise RuntimeError("ffmpeg not found - please install ffmpeg")
-    finally:
-        # Clean up concat file
-        if concat_file.exists():
-            concat_file.unlink()
+    logger.info("Merged %s files -> %s", len(input_paths), output_path.name)
+    return output_path
 
 
 def analyze_audio_quality(audio_path: Path) -> Dict[str, Any]:
@@ -463,37 +677,68 @@ def analyze_audio_quality(audio_path: Path) -> Dict[str, Any]:
 
         # Get loudness info using ffmpeg
         result = subprocess.run(
-            ["ffmpeg", "-i", str(audio_path), "-af", "ebur128=peak=true", "-f", "null", "-"],
+            [
+                _tool_path("ffmpeg"),
+                "-i",
+                str(audio_path),
+                "-af",
+                "ebur128=peak=true",
+                "-f",
+                "null",
+                "-",
+            ],
             capture_output=True,
             text=True,
             timeout=120,
         )
 
-        # Parse loudness info from stderr
-        for line in result.stderr.split("\n"):
-            if "I:" in line and "LUFS" in line:
-                try:
-                    lufs = float(line.split("I:")[1].split("LUFS")[0].strip())
-                    metrics["integrated_lufs"] = lufs
-                except (ValueError, IndexError):
-                    pass
-            elif "Peak:" in line and "dBFS" in line:
-                try:
-                    peak = float(line.split("Peak:")[1].split("dBFS")[0].strip())
-                    metrics["peak_dbfs"] = peak
-                except (ValueError, IndexError):
-                    pass
+        # Parse loudness info from stderr; the final summary comes last
+        lufs = _last_match(_LUFS_RE, result.stderr)
+        if lufs is not None:
+            metrics["integrated_lufs"] = lufs
+        peak = _last_match(_PEAK_RE, result.stderr)
+        if peak is not None:
+            metrics["peak_dbfs"] = peak
 
     except FileNotFoundError:
         logger.warning("ffmpeg not found - quality analysis limited")
     except subprocess.TimeoutExpired:
         logger.warning("Audio analysis timed out")
     except Exception as e:
-        logger.warning(f"Error analyzing audio: {e}")
+        logger.warning("Error analyzing audio: %s", e)
 
     return metrics
 
 
+def analyze_audio_quality_batch(
+    audio_paths: List[Path], max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Analyze audio quality metrics for several files concurrently.
+
+    Args:
+        audio_paths: Paths to audio files
+        max_workers: Maximum files analyzed at once (default: CPU count)
+
+    Returns:
+        Quality metric dictionaries, in the order of audio_paths
+    """
+    return _map_concurrently(analyze_audio_quality, audio_paths, max_workers)
+
+
+def _last_match(pattern: "re.Pattern[str]", text: str) -> Optional[float]:
+    """Return the value captured by the last match of pattern in text."""
+    value = None
+    for match in pattern.finditer(text):
+        value = match.group(1)
+    return float(value) if value is not None else None
+
+
+def _suffix_lower(file_path: Path) -> str:
+    """Lowercased extension, same as ``file_path.suffix.lower()`` without the Path overhead."""
+    return _name_suffix(file_path.name).lower()
+
+
 def is_valid_audio_format(file_path: Path) -> bool:
     """
     Check if file has a supported audio format.
@@ -504,7 +749,7 @@ def is_valid_audio_format(file_path: Path) -> bool:
     Returns:
         True if format is supported
     """
-    return file_path.suffix.lower() in SUPPORTED_FORMATS
+    return _suffix_lower(file_path) in _SUPPORTED_EXTS
 
 
 def get_mime_type(file_path: Path) -> str:
@@ -517,4 +762,4 @@ def get_mime_type(file_path: Path) -> str:
     Returns:
         MIME type string
     """
-    return SUPPORTED_FORMATS.get(file_path.suffix.lower(), "application/octet-stream")
+    return SUPPORTED_FORMATS.get(_suffix_lower(file_path), "application/octet-stream")
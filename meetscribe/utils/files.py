@@ -4,18 +4,39 @@ File management utilities for MeetScribe.
 Provides functions for file operations, cleanup, and organization.
 """
 
+import errno
 import hashlib
 import json
 import logging
+import mmap
 import os
 import shutil
+import stat
+import tarfile
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .serialization import dumps_json, loads_json
 
 logger = logging.getLogger(__name__)
 
+# atomic_write(): raw unbuffered writes, not inherited by child processes
+_ATOMIC_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+)
+# fdatasync skips metadata-only flushes; macOS and Windows only have fsync
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+# _copy_file(): bytes per copy_file_range call, and errors meaning "not here"
+_COPY_CHUNK_SIZE = 1 << 30
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset(
+    (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP)
+)
+
 
 def ensure_directory(path: Path, parents: bool = True) -> Path:
     """
@@ -68,6 +89,86 @@ def list_meeting_directories(base_dir: Path) -> List[Path]:
     return sorted([d for d in base_dir.iterdir() if d.is_dir() and not d.name.startswith(".")])
 
 
+# Entries stat'ed per round by _stat_entries() when using threads
+_STAT_BATCH_SIZE = 1024
+
+
+def _stat_entries(
+    entries: Iterable[os.DirEntry], workers: Optional[int] = None
+) -> Iterator[Tuple[os.DirEntry, os.stat_result]]:
+    """
+    Pair directory entries with their stat results.
+
+    With several workers, entries are stat'ed in parallel batches: on
+    network filesystems each stat is a server round-trip, so overlapping
+    them hides the latency. Locally a stat is cheaper than a thread
+    hand-off, so the default is serial.
+
+    Args:
+        entries: Directory entries, e.g. from _walk()
+        workers: Number of threads (None or 1 = serial)
+
+    Yields:
+        (entry, stat result) in input order
+    """
+    if not workers or workers <= 1:
+        for entry in entries:
+            yield entry, entry.stat()
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Batches bound memory while the walk keeps producing entries
+        batch = []
+        for entry in entries:
+            batch.append(entry)
+            if len(batch) == _STAT_BATCH_SIZE:
+                yield from zip(batch, executor.map(os.DirEntry.stat, batch))
+                batch = []
+        yield from zip(batch, executor.map(os.DirEntry.stat, batch))
+
+
+def _normalize_extensions(extensions: List[str]) -> frozenset:
+    """Lowercase extensions and add missing leading dots, for O(1) lookups."""
+    return frozenset(
+        ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in extensions
+    )
+
+
+def _name_suffix(name: str) -> str:
+    """Return the extension of a file name, as Path(name).suffix would."""
+    dot = name.rfind(".")
+    # A leading dot marks a hidden file and a trailing dot is no extension
+    return name[dot:] if 0 < dot < len(name) - 1 else ""
+
+
+def _walk(directory: Path) -> Iterator[os.DirEntry]:
+    """
+    Yield every entry below a directory, recursively.
+
+    Uses os.scandir so file types (and, on Windows, stat results) come
+    from the directory listing instead of a separate stat per entry.
+    Symlinked directories are not descended into, and directories that
+    cannot be listed are logged and skipped.
+
+    Args:
+        directory: Root directory
+
+    Yields:
+        Directory entries, parents before their children
+    """
+    stack = [directory]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    yield entry
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory {path}: {e}")
+
+
 def find_files_by_extension(
     directory: Path, extensions: List[str], recursive: bool = False
 ) -> List[Path]:
@@ -86,18 +187,37 @@ def find_files_by_extension(
     if not directory.exists():
         return []
 
-    # Normalize extensions
-    extensions = [ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in extensions]
+    extensions = _normalize_extensions(extensions)
 
-    files = []
     if recursive:
-        for ext in extensions:
-            files.extend(directory.rglob(f"*{ext}"))
+        entries = _walk(directory)
     else:
-        for ext in extensions:
-            files.extend(directory.glob(f"*{ext}"))
+        with os.scandir(directory) as it:
+            entries = list(it)
+
+    # One directory pass for all extensions, so every path is seen once
+    files = []
+    for entry in entries:
+        if _name_suffix(entry.name).lower() in extensions and entry.is_file():
+            files.append(Path(entry.path))
+
+    return sorted(files)
+
 
-    return sorted(set(files))
+def _advise_sequential(fd: int) -> None:
+    """
+    Tell the kernel a file will be read start to finish, soon.
+
+    Widens readahead and starts it asynchronously. A no-op where
+    posix_fadvise is unavailable (macOS, Windows).
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            # Only a hint; e.g. pipes and some filesystems reject it
+            pass
 
 
 def calculate_file_hash(file_path: Path, algorithm: str = "sha256") -> str:
@@ -111,40 +231,107 @@ def calculate_file_hash(file_path: Path, algorithm: str = "sha256") -> str:
     Returns:
         Hex digest string
     """
-    hasher = hashlib.new(algorithm)
+    # Unbuffered: both paths read into their own buffers, so an extra copy is wasted
+    with open(file_path, "rb", buffering=0) as f:
+        _advise_sequential(f.fileno())
+
+        # Python 3.11+: hashes in C without holding the GIL
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, algorithm).hexdigest()
+
+        hasher = hashlib.new(algorithm)
+        # One reused buffer, sized to small files; st_size is 0 for pipes and /proc
+        buffer = bytearray(min(max(os.fstat(f.fileno()).st_size, 64 * 1024), 1 << 20))
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hasher.update(view[:size])
+        return hasher.hexdigest()
+
+
+def calculate_hashes(
+    file_paths: List[Path], algorithm: str = "sha256", max_workers: Optional[int] = None
+) -> Dict[Path, str]:
+    """
+    Calculate hashes of several files concurrently.
+
+    hashlib releases the GIL while hashing, so files are read and hashed
+    in parallel threads.
+
+    Args:
+        file_paths: Paths to files
+        algorithm: Hash algorithm (md5, sha1, sha256)
+        max_workers: Thread count (default: CPU count)
+
+    Returns:
+        Mapping of each path to its hex digest
+    """
+    if len(file_paths) <= 1:
+        return {path: calculate_file_hash(path, algorithm) for path in file_paths}
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        digests = executor.map(lambda path: calculate_file_hash(path, algorithm), file_paths)
+        return dict(zip(file_paths, digests))
+
+
+def iter_file_chunks(file_path: Path, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+    """
+    Iterate over a file in fixed-size chunks via a read-only memory map.
+
+    Suitable as a streaming upload body: memory use stays at one chunk
+    regardless of file size, and the kernel reads ahead of the consumer.
+
+    Args:
+        file_path: Path to file
+        chunk_size: Bytes per chunk (default: 1 MiB)
+
+    Yields:
+        Consecutive chunks of the file
+    """
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for offset in range(0, size, chunk_size):
+                yield mm[offset : offset + chunk_size]
 
 
-def get_file_info(file_path: Path) -> Dict[str, Any]:
+def get_file_info(file_path: Path, stat_result: Optional[os.stat_result] = None) -> Dict[str, Any]:
     """
     Get detailed file information.
 
     Args:
         file_path: Path to file
+        stat_result: Result of stat() on the file if the caller already has
+            one (e.g. from os.DirEntry.stat()), saving the syscall
 
     Returns:
         Dictionary with file information
     """
     file_path = Path(file_path)
-    stat = file_path.stat()
+    st = stat_result if stat_result is not None else file_path.stat()
 
     return {
         "path": str(file_path),
         "name": file_path.name,
         "stem": file_path.stem,
         "suffix": file_path.suffix,
-        "size_bytes": stat.st_size,
-        "size_human": format_file_size(stat.st_size),
-        "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-        "is_file": file_path.is_file(),
-        "is_dir": file_path.is_dir(),
+        "size_bytes": st.st_size,
+        "size_human": format_file_size(st.st_size),
+        "created": datetime.fromtimestamp(st.st_ctime).isoformat(),
+        "modified": datetime.fromtimestamp(st.st_mtime).isoformat(),
+        # Type bits from the same stat, instead of two more for is_file()/is_dir()
+        "is_file": stat.S_ISREG(st.st_mode),
+        "is_dir": stat.S_ISDIR(st.st_mode),
     }
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
@@ -155,11 +342,47 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Human-readable size string
     """
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    # Each unit is 10 bits wide, so the bit length picks it directly
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """
+    Copy data and metadata like shutil.copy2, in the kernel where possible.
+
+    copy_file_range lets the filesystem share extents (reflinks on btrfs
+    and XFS) or copy server-side on NFS 4.2, instead of moving the data
+    through user space. Falls back to shutil.copy2 where it is missing
+    or unsupported for the two files.
+    """
+    # copy2 also copies into an existing directory
+    if not hasattr(os, "copy_file_range") or os.path.isdir(dst):
+        shutil.copy2(src, dst)
+        return
+
+    with open(src, "rb") as fsrc:
+        # Opening dst with "wb" would truncate src itself
+        try:
+            if os.path.samestat(os.fstat(fsrc.fileno()), os.stat(dst)):
+                raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        except FileNotFoundError:
+            pass
+        with open(dst, "wb") as fdst:
+            try:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), _COPY_CHUNK_SIZE):
+                    pass
+            except OSError as e:
+                if e.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+                    raise
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+                shutil.copyfileobj(fsrc, fdst)
+
+    shutil.copystat(src, dst)
 
 
 def safe_copy(src: Path, dst: Path, overwrite: bool = False) -> Path:
@@ -177,14 +400,18 @@ def safe_copy(src: Path, dst: Path, overwrite: bool = False) -> Path:
     src = Path(src)
     dst = Path(dst)
 
-    if not src.exists():
-        raise FileNotFoundError(f"Source file not found: {src}")
-
-    if dst.exists() and not overwrite:
+    if not overwrite and dst.exists():
         raise FileExistsError(f"Destination already exists: {dst}")
 
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)
+    # Try the operation first; missing paths are only diagnosed when it fails
+    try:
+        _copy_file(src, dst)
+    except FileNotFoundError:
+        if not src.exists():
+            raise FileNotFoundError(f"Source file not found: {src}") from None
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        _copy_file(src, dst)
+
     logger.debug(f"Copied {src} -> {dst}")
     return dst
 
@@ -204,14 +431,25 @@ def safe_move(src: Path, dst: Path, overwrite: bool = False) -> Path:
     src = Path(src)
     dst = Path(dst)
 
-    if not src.exists():
-        raise FileNotFoundError(f"Source file not found: {src}")
-
-    if dst.exists() and not overwrite:
+    if not overwrite and dst.exists():
         raise FileExistsError(f"Destination already exists: {dst}")
 
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.move(str(src), str(dst))
+    if dst.is_dir():
+        # shutil.move puts src inside dst; os.replace would replace an empty dst
+        shutil.move(str(src), str(dst))
+    else:
+        try:
+            # Same filesystem: a single rename
+            os.replace(src, dst)
+        except FileNotFoundError:
+            if not os.path.lexists(src):
+                raise FileNotFoundError(f"Source file not found: {src}") from None
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(src), str(dst))
+        except OSError:
+            # Across filesystems
+            shutil.move(str(src), str(dst))
+
     logger.debug(f"Moved {src} -> {dst}")
     return dst
 
@@ -229,29 +467,36 @@ def safe_delete(path: Path, recursive: bool = False) -> bool:
     """
     path = Path(path)
 
-    if not path.exists():
-        return False
-
     try:
-        if path.is_file():
+        try:
             path.unlink()
-        elif path.is_dir():
+        except (IsADirectoryError, PermissionError):
+            # unlink() on a directory fails with EISDIR (Linux) or EPERM/EACCES
+            if not path.is_dir():
+                raise
             if recursive:
                 shutil.rmtree(path)
             else:
                 path.rmdir()
         logger.debug(f"Deleted {path}")
         return True
+    except FileNotFoundError:
+        return False
     except Exception as e:
         logger.error(f"Failed to delete {path}: {e}")
         return False
 
 
+# Concurrent unlinks in cleanup_old_files()
+_DELETE_WORKERS = 16
+
+
 def cleanup_old_files(
     directory: Path,
     max_age_days: int,
     extensions: Optional[List[str]] = None,
     dry_run: bool = False,
+    stat_workers: Optional[int] = None,
 ) -> List[Path]:
     """
     Clean up files older than specified age.
@@ -261,6 +506,8 @@ def cleanup_old_files(
         max_age_days: Maximum age in days
         extensions: Specific extensions to clean (None = all)
         dry_run: If True, only report what would be deleted
+        stat_workers: Threads reading file ages in parallel; worth setting
+            on network filesystems (default: stat serially)
 
     Returns:
         List of deleted (or would-be-deleted) file paths
@@ -269,28 +516,37 @@ def cleanup_old_files(
     if not directory.exists():
         return []
 
-    cutoff = datetime.now() - timedelta(days=max_age_days)
+    cutoff = (datetime.now() - timedelta(days=max_age_days)).timestamp()
+    if extensions:
+        extensions = _normalize_extensions(extensions)
     deleted = []
 
-    for file_path in directory.rglob("*"):
-        if not file_path.is_file():
-            continue
+    def candidates() -> Iterator[os.DirEntry]:
+        for entry in _walk(directory):
+            # Symlinks are skipped: their age is the target's, which may live elsewhere
+            if not entry.is_file(follow_symlinks=False):
+                continue
 
-        # Check extension filter
-        if extensions:
-            if file_path.suffix.lower() not in [
-                ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in extensions
-            ]:
+            # Check extension filter on the plain name; most entries never need a Path
+            if extensions and _name_suffix(entry.name).lower() not in extensions:
                 continue
 
-        # Check age
-        mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-        if mtime < cutoff:
-            if dry_run:
-                logger.info(f"Would delete: {file_path}")
-            else:
-                safe_delete(file_path)
-            deleted.append(file_path)
+            yield entry
+
+    # Check age
+    for entry, st in _stat_entries(candidates(), stat_workers):
+        if st.st_mtime < cutoff:
+            deleted.append(Path(entry.path))
+
+    if dry_run:
+        for file_path in deleted:
+            logger.info(f"Would delete: {file_path}")
+    elif len(deleted) > 1:
+        # Unlinks are independent and release the GIL; overlap them on slow filesystems
+        with ThreadPoolExecutor(max_workers=min(_DELETE_WORKERS, len(deleted))) as executor:
+            list(executor.map(safe_delete, deleted))
+    elif deleted:
+        safe_delete(deleted[0])
 
     if deleted:
         logger.info(f"Cleaned up {len(deleted)} old files from {directory}")
@@ -313,16 +569,24 @@ def cleanup_empty_directories(directory: Path, dry_run: bool = False) -> List[Pa
     if not directory.exists():
         return []
 
+    root = str(directory)
     deleted = []
+    removed = set()
 
-    # Walk bottom-up to handle nested empty directories
-    for dir_path in sorted(directory.rglob("*"), reverse=True):
-        if dir_path.is_dir() and not any(dir_path.iterdir()):
-            if dry_run:
-                logger.info(f"Would delete empty directory: {dir_path}")
-            else:
-                safe_delete(dir_path)
-            deleted.append(dir_path)
+    # Walk bottom-up so a directory is seen after its emptied subdirectories
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        if dirpath == root or filenames:
+            continue
+        if any(os.path.join(dirpath, name) not in removed for name in dirnames):
+            continue
+
+        dir_path = Path(dirpath)
+        if dry_run:
+            logger.info(f"Would delete empty directory: {dir_path}")
+        elif not safe_delete(dir_path):
+            continue
+        removed.add(dirpath)
+        deleted.append(dir_path)
 
     return deleted
 
@@ -376,13 +640,13 @@ def save_json(
     Returns:
         Path to saved file
     """
-    file_path = Path(file_path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii, default=str)
+    if indent == 2 and not ensure_ascii:
+        # The default case goes through orjson when it is installed
+        payload = dumps_json(data, indent=True)
+    else:
+        payload = json.dumps(data, indent=indent, ensure_ascii=ensure_ascii, default=str)
 
-    return file_path
+    return atomic_write(file_path, payload)
 
 
 def load_json(file_path: Path) -> Dict[str, Any]:
@@ -395,42 +659,57 @@ def load_json(file_path: Path) -> Dict[str, Any]:
     Returns:
         Loaded data
     """
-    file_path = Path(file_path)
-    with open(file_path, encoding="utf-8") as f:
-        return json.load(f)
+    return loads_json(Path(file_path).read_bytes())
 
 
-def atomic_write(file_path: Path, content: str, encoding: str = "utf-8") -> Path:
+def atomic_write(file_path: Path, content: Union[str, bytes], encoding: str = "utf-8") -> Path:
     """
     Atomically write content to file (write to temp, then rename).
 
+    The data is flushed to disk before the rename, so after a crash the
+    file holds either the old or the new content, never a partial write.
+
     Args:
         file_path: Target file path
-        content: Content to write
-        encoding: File encoding
+        content: Content to write (bytes are written as-is)
+        encoding: File encoding for str content
 
     Returns:
         Path to written file
     """
     file_path = Path(file_path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
+    data = content if isinstance(content, bytes) else content.encode(encoding)
 
-    # Write to temp file
-    temp_path = file_path.parent / f".{file_path.name}.tmp"
-    with open(temp_path, "w", encoding=encoding) as f:
-        f.write(content)
+    # Temp file in the same directory so the rename stays on one filesystem;
+    # the pid/thread suffix keeps concurrent writers of the same file apart
+    temp_path = file_path.parent / f".{file_path.name}.{os.getpid()}-{threading.get_ident()}.tmp"
+    fd = os.open(temp_path, _ATOMIC_WRITE_FLAGS, 0o666)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            # Data must reach the disk before the rename can
+            _fdatasync(fd)
+        finally:
+            os.close(fd)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
-    # Atomically replace
-    temp_path.replace(file_path)
     return file_path
 
 
-def get_directory_size(directory: Path) -> int:
+def get_directory_size(directory: Path, stat_workers: Optional[int] = None) -> int:
     """
     Get total size of directory in bytes.
 
     Args:
         directory: Directory path
+        stat_workers: Threads reading file sizes in parallel; worth setting
+            on network filesystems (default: stat serially)
 
     Returns:
         Total size in bytes
@@ -439,22 +718,24 @@ def get_directory_size(directory: Path) -> int:
     if not directory.exists():
         return 0
 
-    total = 0
-    for file_path in directory.rglob("*"):
-        if file_path.is_file():
-            total += file_path.stat().st_size
-
-    return total
+    files = (entry for entry in _walk(directory) if entry.is_file())
+    return sum(st.st_size for _, st in _stat_entries(files, stat_workers))
 
 
-def archive_meeting(meeting_dir: Path, archive_dir: Path, compress: bool = True) -> Path:
+def archive_meeting(
+    meeting_dir: Path, archive_dir: Path, compress: bool = True, zstd: bool = False
+) -> Path:
     """
     Archive a meeting directory.
 
+    Compressed archives are written as .tar.gz, or as .tar.zst when zstd
+    is requested and zstandard is installed.
+
     Args:
         meeting_dir: Meeting directory to archive
         archive_dir: Directory to store archive
         compress: Use compression
+        zstd: Compress with multi-threaded zstd instead of gzip
 
     Returns:
         Path to archive file
@@ -468,14 +749,56 @@ def archive_meeting(meeting_dir: Path, archive_dir: Path, compress: bool = True)
     archive_dir.mkdir(parents=True, exist_ok=True)
 
     archive_name = meeting_dir.name
-    archive_format = "gztar" if compress else "tar"
 
-    archive_path = shutil.make_archive(
-        str(archive_dir / archive_name),
-        archive_format,
-        root_dir=str(meeting_dir.parent),
-        base_dir=meeting_dir.name,
-    )
+    zstandard = None
+    if compress and zstd:
+        try:
+            import zstandard
+        except ImportError:
+            logger.warning("zstandard not installed, using gzip. Run: pip install zstandard")
+
+    if zstandard is not None:
+        # Multi-threaded zstd is several times faster than single-threaded gzip
+        archive_path = archive_dir / f"{archive_name}.tar.zst"
+        compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+        with open(archive_path, "wb") as f, compressor.stream_writer(f) as writer:
+            with tarfile.open(fileobj=writer, mode="w|") as tar:
+                _add_to_tar(tar, meeting_dir, archive_name)
+    elif compress:
+        archive_path = archive_dir / f"{archive_name}.tar.gz"
+        with tarfile.open(archive_path, mode="w:gz") as tar:
+            _add_to_tar(tar, meeting_dir, archive_name)
+    else:
+        archive_path = archive_dir / f"{archive_name}.tar"
+        with tarfile.open(archive_path, mode="w") as tar:
+            _add_to_tar(tar, meeting_dir, archive_name)
 
     logger.info(f"Archived {meeting_dir.name} -> {archive_path}")
-    return Path(archive_path)
+    return archive_path
+
+
+def _add_to_tar(tar: tarfile.TarFile, path: Path, arcname: str) -> None:
+    """
+    Add a file or directory tree to a tar archive, like TarFile.add().
+
+    Each regular file gets a sequential-read hint first, so the kernel
+    reads ahead while the previous block is being compressed.
+
+    Args:
+        tar: Archive open for writing
+        path: File or directory to add
+        arcname: Name of the path inside the archive
+    """
+    info = tar.gettarinfo(path, arcname)
+    if info.isreg():
+        with open(path, "rb") as f:
+            _advise_sequential(f.fileno())
+            tar.addfile(info, f)
+    elif info.isdir():
+        tar.addfile(info)
+        for name in sorted(os.listdir(path)):
+            if name.startswith(".") and name.endswith(".sha256"):
+                continue  # renderer digest sidecars are cache state, not meeting data
+            _add_to_tar(tar, path / name, f"{arcname}/{name}")
+    else:
+        tar.addfile(info)
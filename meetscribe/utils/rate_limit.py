@@ -0,0 +1,69 @@
+"""
+Rate limiting utilities for MeetScribe.
+
+Provides a thread-safe token bucket for keeping API calls under a quota.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    acquire() blocks until a token is available, so callers sharing a
+    bucket are smoothed to the refill rate after an initial burst.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Optional[Callable[[float], None]] = None,
+    ):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens (burst size)
+            clock: Monotonic clock function
+            sleep: Sleep function (default: time.sleep)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0):
+        """
+        Take tokens from the bucket, waiting for them to refill if needed.
+
+        Args:
+            tokens: Number of tokens to take
+        """
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+
+            logger.debug(f"Rate limit reached; waiting {wait:.2f}s")
+            (self._sleep or time.sleep)(wait)
@@ -0,0 +1,127 @@
+"""
+Retry utilities for MeetScribe.
+
+Provides exponential backoff with jitter for calls to remote APIs.
+"""
+
+import logging
+import random
+import time
+from typing import Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP status codes that indicate a transient failure
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def get_status_code(error: Exception) -> Optional[int]:
+    """
+    Read the HTTP status code carried by an API error.
+
+    Understands google-api-core errors (``code``), googleapiclient
+    ``HttpError`` (``resp.status``) and requests errors (``response.status_code``).
+
+    Args:
+        error: Exception raised by an API call
+
+    Returns:
+        Status code, or None if the error carries none
+    """
+    status = getattr(error, "code", None)
+    if not isinstance(status, int):
+        resp = getattr(error, "resp", None)
+        status = getattr(resp, "status", None)
+    if not isinstance(status, int):
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+
+    try:
+        return int(status)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable_status(error: Exception) -> bool:
+    """
+    Check whether an API error carries a transient HTTP status code.
+
+    Args:
+        error: Exception raised by an API call
+
+    Returns:
+        True if the call should be retried
+    """
+    return get_status_code(error) in RETRYABLE_STATUS_CODES
+
+
+def is_retryable_write_status(error: Exception) -> bool:
+    """
+    Check whether a failed non-idempotent write can safely be retried.
+
+    Other 5xx errors may arrive after the server applied the write, so
+    only rate limits (429) and empty-bodied 503s, which are rejected
+    before the request reaches a backend, are retried.
+
+    Args:
+        error: Exception raised by an API call
+
+    Returns:
+        True if the write should be retried
+    """
+    status = get_status_code(error)
+    return status == 429 or (status == 503 and not getattr(error, "content", None))
+
+
+def retry_with_backoff(
+    func: Callable[[], T],
+    should_retry: Callable[[Exception], bool] = is_retryable_status,
+    max_attempts: int = 6,
+    initial_delay: float = 1.0,
+    max_delay: float = 30.0,
+    get_retry_after: Optional[Callable[[Exception], Optional[float]]] = None,
+    sleep: Optional[Callable[[float], None]] = None,
+) -> T:
+    """
+    Call a function, retrying transient failures with exponential backoff.
+
+    Delays use full jitter (uniform between 0 and the exponential cap) so
+    concurrent callers do not retry in lockstep. A server-provided
+    retry-after hint is honored as a lower bound.
+
+    Args:
+        func: Zero-argument callable to invoke
+        should_retry: Predicate deciding whether an exception is transient
+        max_attempts: Maximum number of calls, including the first
+        initial_delay: Backoff cap for the first retry in seconds
+        max_delay: Upper bound on the backoff cap in seconds
+        get_retry_after: Extracts a retry-after hint in seconds from an exception
+        sleep: Sleep function (default: time.sleep)
+
+    Returns:
+        Result of func
+
+    Raises:
+        Exception: The last error once attempts are exhausted or it is not retryable
+    """
+    attempt = 1
+    while True:
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= max_attempts or not should_retry(e):
+                raise
+
+            delay = random.uniform(0, min(max_delay, initial_delay * 2 ** (attempt - 1)))
+            if get_retry_after is not None:
+                retry_after = get_retry_after(e)
+                if retry_after:
+                    delay = max(delay, retry_after)
+
+            logger.warning(
+                f"Attempt {attempt}/{max_attempts} failed ({e}); retrying in {delay:.1f}s"
+            )
+            (sleep or time.sleep)(delay)
+            attempt += 1
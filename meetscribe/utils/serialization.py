@@ -0,0 +1,60 @@
+"""
+JSON serialization utilities for MeetScribe.
+
+Uses orjson when installed and falls back to the standard library.
+Indented output is identical either way; compact output differs only
+in whitespace (orjson omits the spaces after separators).
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+
+    Values JSON cannot represent natively (datetimes, paths, ...) are
+    converted with str(), as with ``json.dumps(..., default=str)``.
+
+    Args:
+        data: Data to serialize
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        option |= orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=str, option=option)
+        except TypeError:
+            # e.g. integers wider than 64 bits; let the stdlib handle them
+            pass
+
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False, default=str).encode(
+        "utf-8"
+    )
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize JSON.
+
+    Args:
+        data: JSON bytes or string
+
+    Returns:
+        Deserialized data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -231,7 +231,7 @@ class TestOutputIntegration:
         assert Path(result).exists()
         with open(result, encoding="utf-8") as f:
             payload = json.load(f)
-        assert "embeds" in payload
+        assert payload["meeting_id"] == sample_minutes.meeting_id
 
 
 @pytest.mark.integration
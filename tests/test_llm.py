@@ -4,6 +4,7 @@ Unit tests for LLM layer providers.
 
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -94,6 +95,24 @@ class TestNotebookLMProvider:
         assert minutes.url is not None
         assert minutes.summary is not None
 
+    def test_generate_minutes_batch(self, sample_transcript):
+        """Test batch generation keeps order and creates one notebook per meeting."""
+        provider = NotebookLMProvider({"max_concurrency": 3})
+        transcripts = [
+            Transcript(
+                meeting_info=MeetingInfo(
+                    meeting_id=f"meeting-{i}", source_type="test", start_time=datetime.now()
+                ),
+                text=sample_transcript.text,
+            )
+            for i in range(5)
+        ]
+
+        minutes_list = provider.generate_minutes_batch(transcripts)
+
+        assert [m.meeting_id for m in minutes_list] == [f"meeting-{i}" for i in range(5)]
+        assert len({m.url for m in minutes_list}) == 5
+
 
 class TestChatGPTProvider:
     """Tests for ChatGPTProvider."""
@@ -192,3 +211,201 @@ class TestGeminiProvider:
         assert provider._get_mime_type(Path("test.mp3")) == "audio/mpeg"
         assert provider._get_mime_type(Path("test.wav")) == "audio/wav"
         assert provider._get_mime_type(Path("test.flac")) == "audio/flac"
+
+    def test_read_response_text_streamed(self):
+        """Test streamed chunks are joined into the full response text."""
+        provider = GeminiProvider({})
+        chunks = [MagicMock(text='{"summary": '), MagicMock(text='"streamed"}')]
+
+        assert provider._read_response_text(iter(chunks)) == '{"summary": "streamed"}'
+
+    def test_read_response_text_not_streamed(self):
+        """Test non-streamed responses use the complete text."""
+        provider = GeminiProvider({"stream": False})
+        response = MagicMock(text='{"summary": "complete"}')
+
+        assert provider._read_response_text(response) == '{"summary": "complete"}'
+
+    def test_generate_with_api_builds_prompt(self, sample_transcript):
+        """Test the API prompt reuses the precomputed prefix."""
+        provider = GeminiProvider({"stream": False})
+        provider.client = MagicMock()
+        provider.client.generate_content.return_value = MagicMock(text='{"summary": "ok"}')
+
+        result = provider._generate_with_api("Hello there", sample_transcript)
+
+        prompt = provider.client.generate_content.call_args[0][0]
+        assert result == {"summary": "ok"}
+        assert prompt.startswith(provider._prompt_prefix)
+        assert prompt.endswith("Hello there\n\nKnown participants: Alice, Bob")
+
+    def test_cache_disabled_above_zero_temperature(self):
+        """Test non-deterministic configs do not cache responses."""
+        provider = GeminiProvider({"temperature": 0.3})
+        assert provider.cache is None
+
+    def test_generate_with_api_uses_cache(self, sample_transcript, tmp_path):
+        """Test deterministic responses are served from the cache."""
+        provider = GeminiProvider({"temperature": 0, "stream": False, "cache_dir": tmp_path})
+        provider.client = MagicMock()
+        provider.client.generate_content.return_value = MagicMock(text='{"summary": "ok"}')
+
+        first = provider._generate_with_api("Hello there", sample_transcript)
+        second = provider._generate_with_api("Hello there", sample_transcript)
+
+        assert first == second == {"summary": "ok"}
+        assert provider.client.generate_content.call_count == 1
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_generate_with_api_retries_rate_limit(self, sample_transcript, monkeypatch):
+        """Test rate-limited calls are retried."""
+        monkeypatch.setattr("meetscribe.utils.retry.time.sleep", lambda _: None)
+
+        class RateLimited(Exception):
+            code = 429
+
+        provider = GeminiProvider({"stream": False})
+        provider.client = MagicMock()
+        provider.client.generate_content.side_effect = [
+            RateLimited(),
+            MagicMock(text='{"summary": "ok"}'),
+        ]
+
+        result = provider._generate_with_api("Hello there", sample_transcript)
+
+        assert result == {"summary": "ok"}
+        assert provider.client.generate_content.call_count == 2
+
+    def test_split_transcript_at_line_boundaries(self):
+        """Test transcripts are chunked on speaker turns."""
+        text = "Alice: one\nBob: two\nAlice: three"
+
+        chunks = GeminiProvider._split_transcript(text, 20)
+
+        assert chunks == ["Alice: one\nBob: two", "Alice: three"]
+
+    def test_split_transcript_long_line(self):
+        """Test lines longer than the chunk size are hard-split."""
+        chunks = GeminiProvider._split_transcript("x" * 25, 10)
+
+        assert chunks == ["x" * 10, "x" * 10, "x" * 5]
+
+    def test_fit_to_context_skips_short_prompts(self):
+        """Test prompts shorter than the budget are not token-counted."""
+        provider = GeminiProvider({})
+        provider.client = MagicMock()
+
+        assert provider._fit_to_context("short", "short prompt") is None
+        provider.client.count_tokens.assert_not_called()
+
+    def test_fit_to_context_counts_multibyte_prompts(self):
+        """Test CJK prompts within the budget in characters are still token-counted."""
+        provider = GeminiProvider({"max_input_tokens": 100})
+        provider.client = MagicMock()
+        provider.client.count_tokens.return_value = MagicMock(total_tokens=90)
+        prompt = "議事録" * 30  # 90 characters, 270 UTF-8 bytes
+
+        assert provider._fit_to_context(prompt, prompt) is None
+        provider.client.count_tokens.assert_called_once_with(prompt)
+
+    def test_mock_generation_does_not_share_state(self, sample_transcript):
+        """Test mutating generated minutes does not alter later mock results."""
+        provider = GeminiProvider({})
+
+        first = provider.generate_minutes(sample_transcript)
+        first.key_points.append("Extra point")
+        second = provider.generate_minutes(sample_transcript)
+
+        assert "Extra point" not in second.key_points
+
+        raw = provider._mock_generation(sample_transcript)
+        raw["decisions"][0]["description"] = "Changed"
+        raw["action_items"].clear()
+        fresh = provider._mock_generation(sample_transcript)
+
+        assert fresh["decisions"][0]["description"] != "Changed"
+        assert isinstance(fresh["action_items"], list) and fresh["action_items"]
+
+    def test_make_generation_config_prefers_protobuf(self):
+        """Test generation config is built as a protobuf message when available."""
+        from meetscribe.llm.gemini_provider import _make_generation_config
+
+        genai = MagicMock()
+        config = _make_generation_config(genai, temperature=0)
+
+        assert config is genai.protos.GenerationConfig.return_value
+        genai.protos.GenerationConfig.assert_called_once_with(temperature=0)
+        genai.GenerationConfig.assert_not_called()
+
+    def _make_transcripts(self, count):
+        return [
+            Transcript(
+                meeting_info=MeetingInfo(
+                    meeting_id=f"meeting-{i}", source_type="test", start_time=datetime.now()
+                ),
+                text=f"Alice: Topic number {i}.",
+            )
+            for i in range(count)
+        ]
+
+    def test_generate_minutes_batch_packs_requests(self):
+        """Test several transcripts share one request."""
+        provider = GeminiProvider({"stream": False, "batch_size": 2})
+        provider.client = MagicMock()
+        provider.client.generate_content.return_value = MagicMock(
+            text='{"minutes": [{"summary": "first"}, {"summary": "second"}]}'
+        )
+
+        minutes_list = provider.generate_minutes_batch(self._make_transcripts(2))
+
+        assert provider.client.generate_content.call_count == 1
+        prompt = provider.client.generate_content.call_args[0][0]
+        assert "--- MEETING 2 ---" in prompt
+        assert [m.summary for m in minutes_list] == ["first", "second"]
+        assert [m.meeting_id for m in minutes_list] == ["meeting-0", "meeting-1"]
+
+    def test_generate_minutes_batch_budget_counts_whole_prompt(self):
+        """Test packing accounts for instructions, markers and participants."""
+        provider = GeminiProvider({"stream": False, "batch_size": 2})
+        provider.client = MagicMock()
+        provider.client.generate_content.side_effect = [
+            MagicMock(text='{"summary": "first"}'),
+            MagicMock(text='{"summary": "second"}'),
+        ]
+        transcripts = self._make_transcripts(2)
+        for transcript in transcripts:
+            transcript.meeting_info.participants = ["Alice", "Bob"]
+        header = len(provider._packed_header(2).encode("utf-8"))
+        # Both transcript texts fit the budget; their assembled sections do not
+        text_bytes = sum(len(t.get_full_text().encode("utf-8")) for t in transcripts)
+        provider.max_input_tokens = header + text_bytes + 10
+
+        minutes_list = provider.generate_minutes_batch(transcripts)
+
+        assert provider.client.generate_content.call_count == 2
+        prompt = provider.client.generate_content.call_args[0][0]
+        assert "--- MEETING" not in prompt
+        assert [m.summary for m in minutes_list] == ["first", "second"]
+
+    def test_generate_minutes_batch_falls_back_on_mismatch(self):
+        """Test a malformed batched response falls back to single requests."""
+        provider = GeminiProvider({"stream": False, "batch_size": 2})
+        provider.client = MagicMock()
+        provider.client.generate_content.side_effect = [
+            MagicMock(text='{"minutes": [{"summary": "only one"}]}'),
+            MagicMock(text='{"summary": "first"}'),
+            MagicMock(text='{"summary": "second"}'),
+        ]
+
+        minutes_list = provider.generate_minutes_batch(self._make_transcripts(2))
+
+        assert provider.client.generate_content.call_count == 3
+        assert [m.summary for m in minutes_list] == ["first", "second"]
+
+    def test_generate_minutes_batch_mock_mode(self):
+        """Test batch generation without a client uses mock generation."""
+        provider = GeminiProvider({})
+
+        minutes_list = provider.generate_minutes_batch(self._make_transcripts(3))
+
+        assert len(minutes_list) == 3
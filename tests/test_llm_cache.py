@@ -0,0 +1,78 @@
+"""
+Tests for meetscribe.llm.cache module.
+
+Tests exact-match and near-duplicate LLM response caching.
+"""
+
+from meetscribe.llm.cache import LLMCache, SimilarityCache
+
+TRANSCRIPT = (
+    "Alice: Good morning everyone, let's start the weekly sync. "
+    "Bob: Yesterday I finished the login page and today I will work on the API. "
+    "Carol: I am still blocked on the database migration and need help from Bob. "
+    "Alice: Bob, please pair with Carol after this meeting. Bob: Sure, no problem."
+)
+
+
+class TestLLMCache:
+    """Tests for LLMCache."""
+
+    def test_make_key_is_stable(self):
+        """Test identical parts produce identical keys."""
+        assert LLMCache.make_key("model", 0, "prompt") == LLMCache.make_key("model", 0, "prompt")
+
+    def test_make_key_separates_parts(self):
+        """Test part boundaries are part of the key."""
+        assert LLMCache.make_key("ab", "c") != LLMCache.make_key("a", "bc")
+
+    def test_roundtrip(self, tmp_path):
+        """Test stored responses can be read back."""
+        cache = LLMCache(tmp_path)
+        cache.set("key", {"summary": "cached"})
+
+        assert cache.get("key") == {"summary": "cached"}
+
+    def test_miss(self, tmp_path):
+        """Test unknown keys return None."""
+        assert LLMCache(tmp_path).get("missing") is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """Test unreadable entries are ignored."""
+        (tmp_path / "bad.json").write_text("{not json")
+
+        assert LLMCache(tmp_path).get("bad") is None
+
+
+class TestSimilarityCache:
+    """Tests for SimilarityCache."""
+
+    def test_similarity_identical(self):
+        """Test identical texts are fully similar."""
+        sketch = SimilarityCache.sketch(TRANSCRIPT)
+        assert SimilarityCache.similarity(sketch, sketch) == 1.0
+
+    def test_similarity_unrelated(self):
+        """Test unrelated texts are not similar."""
+        other = SimilarityCache.sketch("Completely different words about quarterly budget numbers.")
+        assert SimilarityCache.similarity(SimilarityCache.sketch(TRANSCRIPT), other) == 0.0
+
+    def test_near_duplicate_hit(self, tmp_path):
+        """Test a near-duplicate transcript returns the cached response."""
+        cache = SimilarityCache(tmp_path, threshold=0.7)
+        cache.set("scope", TRANSCRIPT, {"summary": "weekly sync"})
+
+        near_duplicate = TRANSCRIPT + " Alice: Thanks, see you next week."
+        assert cache.get("scope", near_duplicate) == {"summary": "weekly sync"}
+
+    def test_scope_mismatch_misses(self, tmp_path):
+        """Test responses are not shared across settings scopes."""
+        cache = SimilarityCache(tmp_path)
+        cache.set("scope-a", TRANSCRIPT, {"summary": "weekly sync"})
+
+        assert cache.get("scope-b", TRANSCRIPT) is None
+
+    def test_index_persists(self, tmp_path):
+        """Test a new instance reads the persisted index."""
+        SimilarityCache(tmp_path).set("scope", TRANSCRIPT, {"summary": "weekly sync"})
+
+        assert SimilarityCache(tmp_path).get("scope", TRANSCRIPT) == {"summary": "weekly sync"}
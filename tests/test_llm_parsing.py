@@ -0,0 +1,35 @@
+"""
+Tests for meetscribe.llm.parsing module.
+"""
+
+from meetscribe.llm.parsing import extract_json_object
+
+
+class TestExtractJsonObject:
+    """Tests for extract_json_object function."""
+
+    def test_object_with_surrounding_text(self):
+        """Test an object wrapped in prose is extracted."""
+        text = 'Here are the minutes: {"summary": "ok", "decisions": []} Hope this helps.'
+
+        assert extract_json_object(text) == {"summary": "ok", "decisions": []}
+
+    def test_first_balanced_object(self):
+        """Test the first object is used when trailing braces break the full span."""
+        text = 'Result: {"summary": "a"} and notes {not json}'
+
+        assert extract_json_object(text) == {"summary": "a"}
+
+    def test_braces_inside_strings(self):
+        """Test braces and escaped quotes inside strings are ignored."""
+        text = 'x {"summary": "use {braces} and \\"quotes\\""} y }'
+
+        assert extract_json_object(text) == {"summary": 'use {braces} and "quotes"'}
+
+    def test_no_object(self):
+        """Test text without an object returns None."""
+        assert extract_json_object("no json here") is None
+
+    def test_unbalanced(self):
+        """Test unbalanced braces return None."""
+        assert extract_json_object('{"summary": "a"') is None
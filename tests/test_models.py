@@ -80,3 +80,34 @@ def test_minutes_to_dict():
     assert len(result["decisions"]) == 1
     assert len(result["action_items"]) == 1
     assert result["decisions"][0]["description"] == "Use Python for backend"
+
+
+def test_minutes_generated_at_strings():
+    """Test formatted timestamps follow generated_at when it is reassigned."""
+    minutes = Minutes(meeting_id="test", summary="", generated_at=datetime(2025, 1, 2, 3, 4, 5))
+
+    assert minutes.generated_at_text == "2025-01-02 03:04:05"
+    assert minutes.generated_at_iso == "2025-01-02T03:04:05"
+
+    minutes.generated_at = datetime(2026, 6, 7, 8, 9, 10)
+    assert minutes.generated_at_text == "2026-06-07 08:09:10"
+    assert minutes == Minutes(
+        meeting_id="test", summary="", generated_at=datetime(2026, 6, 7, 8, 9, 10)
+    )
+
+
+def test_decision_from_dict():
+    """Test Decision creation from an LLM response dict."""
+    decision = Decision.from_dict({"description": "Ship v2", "responsible": "Alice"})
+
+    assert decision == Decision(description="Ship v2", responsible="Alice")
+
+
+def test_action_item_from_dict_defaults():
+    """Test ActionItem creation tolerates missing keys."""
+    action_item = ActionItem.from_dict({"assignee": "Bob", "priority": "low"})
+
+    assert action_item.description == ""
+    assert action_item.assignee == "Bob"
+    assert action_item.deadline is None
+    assert action_item.priority == "low"
@@ -2,14 +2,21 @@
 Unit tests for OUTPUT layer renderers.
 """
 
+import asyncio
 import json
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
 from meetscribe.core.models import ActionItem, Decision, Minutes
 from meetscribe.outputs.discord_webhook_renderer import DiscordWebhookRenderer
-from meetscribe.outputs.factory import get_multiple_renderers, get_output_renderer
+from meetscribe.outputs.factory import (
+    get_multiple_renderers,
+    get_output_renderer,
+    render_all,
+    render_all_async,
+)
 from meetscribe.outputs.google_docs_renderer import GoogleDocsRenderer
 from meetscribe.outputs.google_sheets_renderer import GoogleSheetsRenderer
 from meetscribe.outputs.json_renderer import JSONRenderer
@@ -103,6 +110,17 @@ class TestOutputFactory:
         with pytest.raises(ValueError, match="Unsupported output format"):
             get_output_renderer("invalid", {})
 
+    def test_renderer_class_resolved_once(self):
+        """Test renderer classes are imported once and reused."""
+        from meetscribe.outputs.factory import _resolve
+
+        first = get_output_renderer("markdown", {})
+        second = get_output_renderer("md", {})
+
+        assert type(first) is type(second) is MarkdownRenderer
+        assert _resolve("markdown") is MarkdownRenderer
+        assert _resolve("not-a-format") is None
+
     def test_get_multiple_renderers(self):
         """Test getting multiple renderers."""
         formats = [
@@ -114,6 +132,47 @@ class TestOutputFactory:
         assert isinstance(renderers[0], MarkdownRenderer)
         assert isinstance(renderers[1], JSONRenderer)
 
+    def test_render_all_async(self, tmp_path, sample_minutes):
+        """Test renderers run concurrently and failures are returned, not raised."""
+        renderers = get_multiple_renderers(
+            [
+                {"format": "markdown", "output_dir": str(tmp_path)},
+                {"format": "json", "output_dir": str(tmp_path)},
+            ]
+        )
+        failing = MagicMock(spec=URLRenderer)
+
+        async def fail(*args):
+            raise RuntimeError("boom")
+
+        failing.render_async = fail
+
+        results = asyncio.run(
+            render_all_async([*renderers, failing], sample_minutes, sample_minutes.meeting_id)
+        )
+
+        assert Path(results[0]).exists()
+        assert Path(results[1]).exists()
+        assert isinstance(results[2], RuntimeError)
+
+    def test_render_all(self, tmp_path, sample_minutes):
+        """Test renderers run in threads and failures are returned, not raised."""
+        renderers = get_multiple_renderers(
+            [
+                {"format": "markdown", "output_dir": str(tmp_path)},
+                {"format": "json", "output_dir": str(tmp_path)},
+            ]
+        )
+        failing = MagicMock(spec=URLRenderer)
+        failing.render.side_effect = RuntimeError("boom")
+
+        results = render_all([*renderers, failing], sample_minutes, sample_minutes.meeting_id)
+
+        assert Path(results[0]).name == "minutes.md"
+        assert Path(results[1]).name == "minutes.json"
+        assert isinstance(results[2], RuntimeError)
+        assert render_all([], sample_minutes, sample_minutes.meeting_id) == []
+
 
 class TestURLRenderer:
     """Tests for URLRenderer."""
@@ -147,6 +206,18 @@ class TestMarkdownRenderer:
         assert "# Meeting Minutes" in content
         assert sample_minutes.summary in content
 
+    def test_render_after_meeting_dir_removed(self, tmp_path, sample_minutes):
+        """Test the meeting directory is recreated if removed between renders."""
+        import shutil
+
+        renderer = MarkdownRenderer({"output_dir": str(tmp_path)})
+        result = renderer.render(sample_minutes, sample_minutes.meeting_id)
+        shutil.rmtree(Path(result).parent)
+
+        result = renderer.render(sample_minutes, sample_minutes.meeting_id)
+
+        assert Path(result).exists()
+
     def test_render_includes_action_items(self, tmp_path, sample_minutes):
         """Test action items are included."""
         renderer = MarkdownRenderer({"output_dir": str(tmp_path)})
@@ -202,6 +273,31 @@ class TestJSONRenderer:
         assert data["statistics"]["total_action_items"] == 2
         assert data["statistics"]["total_decisions"] == 2
 
+    def test_render_optional_sections_omitted(self, tmp_path, sample_minutes):
+        """Test metadata and statistics can be left out."""
+        renderer = JSONRenderer(
+            {"output_dir": str(tmp_path), "include_metadata": False, "include_statistics": False}
+        )
+        data = renderer._generate_json(sample_minutes, sample_minutes.meeting_id)
+
+        assert "metadata" not in data
+        assert "statistics" not in data
+
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_render_indent(self, tmp_path, sample_minutes, indent):
+        """Test the configured indent is honored."""
+        renderer = JSONRenderer({"output_dir": str(tmp_path), "indent": indent})
+        result = renderer.render(sample_minutes, sample_minutes.meeting_id)
+
+        content = Path(result).read_text(encoding="utf-8")
+        assert json.loads(content)["meeting_id"] == sample_minutes.meeting_id
+        # Same bytes whether or not orjson is installed
+        assert content == json.dumps(json.loads(content), indent=indent, ensure_ascii=False)
+        if indent is None:
+            assert "\n" not in content
+        else:
+            assert content.splitlines()[1].startswith(" " * indent + '"')
+
 
 class TestPDFRenderer:
     """Tests for PDFRenderer."""
@@ -219,6 +315,131 @@ class TestPDFRenderer:
 
         assert Path(result).exists()
 
+    @staticmethod
+    def _fake_reportlab_renderer(tmp_path, monkeypatch):
+        """Create a renderer whose ReportLab names are mocks."""
+        from types import SimpleNamespace
+
+        from meetscribe.outputs import pdf_renderer
+
+        monkeypatch.setattr(pdf_renderer, "_action_table_style", None)
+        renderer = PDFRenderer({"output_dir": str(tmp_path)})
+        renderer.reportlab_available = True
+        renderer.page_size = "A4"
+        renderer._styles = None
+        renderer._rl = SimpleNamespace(
+            ListFlowable=MagicMock(),
+            ListItem=MagicMock(),
+            Paragraph=MagicMock(),
+            SimpleDocTemplate=MagicMock(),
+            Spacer=MagicMock(),
+            Table=MagicMock(),
+            TableStyle=MagicMock(),
+            ParagraphStyle=MagicMock(),
+            getSampleStyleSheet=MagicMock(return_value=MagicMock()),
+            TA_CENTER=1,
+            colors=MagicMock(),
+        )
+
+        def build(content):
+            # Like doc.build(), write the file SimpleDocTemplate was created for
+            Path(renderer._rl.SimpleDocTemplate.call_args[0][0]).write_bytes(b"%PDF")
+
+        renderer._rl.SimpleDocTemplate.return_value.build.side_effect = build
+        return renderer
+
+    def test_styles_built_once(self, tmp_path, sample_minutes, monkeypatch):
+        """Test ReportLab styles are built on first render and then reused."""
+        renderer = self._fake_reportlab_renderer(tmp_path, monkeypatch)
+        renderer.skip_unchanged = False
+
+        renderer.render(sample_minutes, sample_minutes.meeting_id)
+        renderer.render(sample_minutes, sample_minutes.meeting_id)
+
+        renderer._rl.getSampleStyleSheet.assert_called_once()
+        # Key points are laid out as one bullet list per document
+        assert renderer._rl.ListFlowable.call_count == 2
+        assert renderer._rl.ListItem.call_count == 2 * len(sample_minutes.key_points)
+        renderer._rl.TableStyle.assert_called_once()
+        assert renderer._rl.SimpleDocTemplate.return_value.build.call_count == 2
+        table = renderer._rl.Table.return_value
+        table.setStyle.assert_called_with(renderer._rl.TableStyle.return_value)
+
+        # A second renderer shares the action items table style
+        other = PDFRenderer({"output_dir": str(tmp_path)})
+        other._rl = renderer._rl
+        assert other._get_action_table_style() is renderer._rl.TableStyle.return_value
+        renderer._rl.TableStyle.assert_called_once()
+
+    def test_unchanged_pdf_not_rebuilt(self, tmp_path, sample_minutes, monkeypatch):
+        """Test an existing PDF is kept when minutes and config are unchanged."""
+        from meetscribe.outputs import pdf_renderer
+
+        renderer = self._fake_reportlab_renderer(tmp_path, monkeypatch)
+        build = renderer._rl.SimpleDocTemplate.return_value.build
+
+        renderer.render(sample_minutes, sample_minutes.meeting_id)
+        renderer.render(sample_minutes, sample_minutes.meeting_id)
+        assert build.call_count == 1
+
+        sample_minutes.summary = "Changed summary"
+        renderer.render(sample_minutes, sample_minutes.meeting_id)
+        assert build.call_count == 2
+
+        # A new layout version rebuilds PDFs made by older releases
+        monkeypatch.setattr(pdf_renderer, "_LAYOUT_VERSION", pdf_renderer._LAYOUT_VERSION + 1)
+        renderer.render(sample_minutes, sample_minutes.meeting_id)
+        assert build.call_count == 3
+
+    def test_failed_build_keeps_previous_pdf(self, tmp_path, sample_minutes, monkeypatch):
+        """Test a build that fails midway leaves the old PDF and digest in place."""
+        renderer = self._fake_reportlab_renderer(tmp_path, monkeypatch)
+        meeting_dir = tmp_path / sample_minutes.meeting_id
+        build = renderer._rl.SimpleDocTemplate.return_value.build
+
+        renderer.render(sample_minutes, sample_minutes.meeting_id)
+        digest = (meeting_dir / ".minutes.pdf.sha256").read_text(encoding="utf-8")
+
+        def fail(content):
+            Path(renderer._rl.SimpleDocTemplate.call_args[0][0]).write_bytes(b"%PD")
+            raise OSError("disk full")
+
+        build.side_effect = fail
+        sample_minutes.summary = "Changed summary"
+        with pytest.raises(OSError):
+            renderer.render(sample_minutes, sample_minutes.meeting_id)
+
+        assert (meeting_dir / "minutes.pdf").read_bytes() == b"%PDF"
+        assert (meeting_dir / ".minutes.pdf.sha256").read_text(encoding="utf-8") == digest
+        assert sorted(p.name for p in meeting_dir.iterdir()) == [
+            ".minutes.pdf.sha256",
+            "minutes.pdf",
+        ]
+
+    def test_decision_text(self, tmp_path, sample_minutes, monkeypatch):
+        """Test decision paragraphs include responsible and deadline when set."""
+        renderer = self._fake_reportlab_renderer(tmp_path, monkeypatch)
+
+        renderer.render(sample_minutes, sample_minutes.meeting_id)
+
+        texts = [c.args[0] for c in renderer._rl.Paragraph.call_args_list]
+        assert (
+            "<b>1.</b> Approved the project plan <i>(Responsible: Alice)</i>"
+            " <i>(Deadline: 2024-01-15)</i>"
+        ) in texts
+        assert "<b>2.</b> Allocated budget for Q1 <i>(Responsible: Bob)</i>" in texts
+
+    def test_action_items_table_rows(self, tmp_path, sample_minutes, monkeypatch):
+        """Test the action items table has a header row and one row per item."""
+        renderer = self._fake_reportlab_renderer(tmp_path, monkeypatch)
+
+        renderer.render(sample_minutes, sample_minutes.meeting_id)
+
+        rows = renderer._rl.Table.call_args.args[0]
+        assert rows[0] == ("#", "Description", "Assignee", "Deadline", "Priority")
+        assert rows[1] == ("1", "Complete initial implementation", "Charlie", "2024-01-10", "high")
+        assert len(rows) == 1 + len(sample_minutes.action_items)
+
     def test_validate_invalid_page_size(self):
         """Test validation with invalid page size."""
         renderer = PDFRenderer({"page_size": "INVALID"})
@@ -244,6 +465,68 @@ class TestDiscordWebhookRenderer:
         assert payload["username"] == "MeetScribe"
         assert len(payload["embeds"]) >= 1
 
+    def test_http_backend_detected_once(self):
+        """Test the HTTP library is detected once and shared by instances."""
+        from meetscribe.outputs.discord_webhook_renderer import _http_backend
+
+        first = DiscordWebhookRenderer({})
+        second = DiscordWebhookRenderer({})
+
+        assert first._http_backend == second._http_backend
+        assert _http_backend.cache_info().currsize == 1
+
+    def test_mentions_content(self, sample_minutes):
+        """Test role and user mentions are added to the message content."""
+        renderer = DiscordWebhookRenderer({"mention_roles": ["1"], "mention_users": ["2", "3"]})
+        payload = renderer._build_payload(sample_minutes, sample_minutes.meeting_id)
+        assert payload["content"] == "<@&1> <@2> <@3>"
+
+        payload = DiscordWebhookRenderer({})._build_payload(sample_minutes, "m")
+        assert "content" not in payload
+
+    def test_embed_descriptions(self, sample_minutes):
+        """Test embed list formatting."""
+        renderer = DiscordWebhookRenderer({})
+        main = renderer._build_main_embed(sample_minutes, sample_minutes.meeting_id)
+        actions = renderer._build_action_items_embed(sample_minutes)
+        decisions = renderer._build_decisions_embed(sample_minutes)
+
+        assert main["fields"][0]["value"] == (
+            "• Discussed project timeline\n• Reviewed budget constraints\n• Assigned responsibilities"
+        )
+        assert actions["description"] == (
+            "**1.** Complete initial implementation → Charlie (Due: 2024-01-10) 🔴\n"
+            "**2.** Review documentation → David (Due: 2024-01-12) 🟡"
+        )
+        assert decisions["description"] == (
+            "**1.** Approved the project plan → Alice (Deadline: 2024-01-15)\n"
+            "**2.** Allocated budget for Q1 → Bob"
+        )
+
+    def test_embed_overflow_counts(self, sample_minutes):
+        """Test long lists are cut off with a count of the remaining entries."""
+        sample_minutes.key_points = [f"Point {i}" for i in range(7)]
+        sample_minutes.participants = [f"User {i}" for i in range(12)]
+        sample_minutes.action_items = [ActionItem(description=f"Task {i}") for i in range(13)]
+        sample_minutes.decisions = [Decision(description=f"Decision {i}") for i in range(11)]
+        renderer = DiscordWebhookRenderer({})
+
+        main = renderer._build_main_embed(sample_minutes, sample_minutes.meeting_id)
+        actions = renderer._build_action_items_embed(sample_minutes)
+        decisions = renderer._build_decisions_embed(sample_minutes)
+
+        assert main["fields"][0]["value"].endswith("\n... and 2 more")
+        assert main["fields"][1]["value"].endswith(" +2 more")
+        assert actions["description"].endswith("\n... and 3 more items")
+        assert decisions["description"].endswith("\n... and 1 more decisions")
+
+    def test_main_embed_footer(self, sample_minutes):
+        """Test main embeds carry the MeetScribe footer."""
+        renderer = DiscordWebhookRenderer({})
+        embed = renderer._build_main_embed(sample_minutes, sample_minutes.meeting_id)
+
+        assert embed["footer"] == {"text": "Generated by MeetScribe"}
+
     def test_truncate_text(self):
         """Test text truncation."""
         renderer = DiscordWebhookRenderer({})
@@ -251,14 +534,128 @@ class TestDiscordWebhookRenderer:
         truncated = renderer._truncate(long_text, 100)
 
         assert len(truncated) == 100
-        assert truncated.endswith("...")
+        assert truncated.endswith("…")
+        assert renderer._truncate("short", 100) == "short"
 
     def test_mock_output_saves_payload(self, tmp_path, sample_minutes):
-        """Test mock mode saves payload."""
+        """Test mock mode saves a summary without building embeds."""
         renderer = DiscordWebhookRenderer({"output_dir": str(tmp_path)})
+        renderer._build_payload = MagicMock()
         result = renderer.render(sample_minutes, sample_minutes.meeting_id)
 
         assert Path(result).exists()
         with open(result, encoding="utf-8") as f:
             payload = json.load(f)
-        assert "embeds" in payload
+        assert payload["summary"] == sample_minutes.summary
+        assert payload["action_items"] == 2
+        renderer._build_payload.assert_not_called()
+
+    def test_send_webhook_uses_shared_session(self, monkeypatch, sample_minutes):
+        """Test webhook posts go through the pooled session with a timeout."""
+        from meetscribe.outputs import discord_webhook_renderer as module
+
+        session = MagicMock()
+        session.post.return_value = MagicMock(status_code=204)
+        monkeypatch.setattr(module, "_get_session", lambda url: session)
+
+        renderer = DiscordWebhookRenderer({"webhook_url": "https://discord.com/api/webhooks/1/a"})
+        result = renderer._send_webhook({"embeds": []})
+
+        assert result == "Message sent successfully"
+        assert session.post.call_args.kwargs["timeout"] == module.WEBHOOK_TIMEOUT
+
+    def test_send_webhook_httpx_uses_shared_client(self, monkeypatch):
+        """Test the httpx fallback posts through the shared client."""
+        from meetscribe.outputs import discord_webhook_renderer as module
+
+        client = MagicMock()
+        client.post.return_value = MagicMock(status_code=204, headers={})
+        monkeypatch.setattr(module, "_get_httpx_client", lambda: client)
+
+        renderer = DiscordWebhookRenderer({"webhook_url": "https://discord.com/api/webhooks/1/a"})
+        renderer._http_backend = "httpx"
+        result = renderer._send_webhook({"embeds": []})
+
+        assert result == "Message sent successfully"
+        assert json.loads(client.post.call_args.kwargs["content"]) == {"embeds": []}
+
+    def test_background_render_returns_before_send(self, monkeypatch, sample_minutes):
+        """Test background mode queues the send and flush_pending collects results."""
+        import threading
+
+        release = threading.Event()
+
+        def send(payload):
+            release.wait(5)
+            return "Message sent successfully"
+
+        renderer = DiscordWebhookRenderer(
+            {"webhook_url": "https://discord.com/api/webhooks/1/a", "background": True}
+        )
+        renderer._http_available = True
+        monkeypatch.setattr(renderer, "_send_webhook", send)
+
+        assert renderer.render(sample_minutes, sample_minutes.meeting_id) == "Message queued"
+        release.set()
+
+        assert renderer.flush_pending() == ["Message sent successfully"]
+        assert renderer.flush_pending() == []
+
+    def test_render_many_packs_embeds(self, monkeypatch, sample_minutes):
+        """Test several meetings are sent in one message when they fit."""
+        renderer = DiscordWebhookRenderer({"webhook_url": "https://discord.com/api/webhooks/1/a"})
+        renderer._http_available = True
+        sent = []
+        monkeypatch.setattr(renderer, "_send_webhook", lambda payload: sent.append(payload) or "ok")
+
+        results = renderer.render_many([sample_minutes, sample_minutes])
+
+        assert results == ["ok"]
+        assert len(sent) == 1
+        assert len(sent[0]["embeds"]) == 2 * len(
+            renderer._build_payload(sample_minutes, sample_minutes.meeting_id)["embeds"]
+        )
+
+    def test_pack_embeds_respects_embed_limit(self):
+        """Test packing starts a new message at the per-message embed limit."""
+        renderer = DiscordWebhookRenderer({})
+        groups = [[{"title": "a"}] * 3 for _ in range(4)]
+
+        messages = renderer._pack_embeds(groups)
+
+        assert [len(m) for m in messages] == [9, 3]
+
+    def test_pack_embeds_respects_character_limit(self):
+        """Test packing starts a new message at the character budget."""
+        renderer = DiscordWebhookRenderer({})
+        groups = [[{"description": "x" * 4000}], [{"description": "y" * 4000}]]
+
+        assert len(renderer._pack_embeds(groups)) == 2
+
+    def test_mock_render_many_saves_each_meeting(self, tmp_path, sample_minutes):
+        """Test mock mode writes one backup per meeting."""
+        renderer = DiscordWebhookRenderer({"output_dir": str(tmp_path)})
+
+        results = renderer.render_many([sample_minutes])
+
+        assert len(results) == 1
+        assert Path(results[0]).exists()
+
+
+class TestGoogleAuth:
+    """Tests for Google OAuth helpers."""
+
+    def test_valid_credentials_reused_without_reading_token(self, tmp_path, monkeypatch):
+        """Test loaded credentials are reused while still valid."""
+        from meetscribe.outputs import google_auth
+
+        token_path = tmp_path / "missing_token.json"
+        creds = MagicMock(valid=True)
+        monkeypatch.setattr(
+            google_auth, "_oauth_tokens", {(str(token_path), ("scope",)): (creds, "{}")}
+        )
+
+        result = google_auth.load_oauth_credentials("creds.json", str(token_path), ["scope"])
+
+        assert result is creds
+        assert not token_path.exists()
@@ -235,6 +235,106 @@ class TestGoogleDocsRenderer:
         # Should return a URL or path
         assert result is not None
 
+    def test_google_docs_api_calls_retry(self, tmp_path, monkeypatch):
+        """Test document writes retry rate limits only and Drive calls use num_retries."""
+        from meetscribe.outputs.google_docs_renderer import GoogleDocsRenderer
+
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        rate_limited = Exception("Rate limited")
+        rate_limited.resp = MagicMock(status=429)
+        renderer = GoogleDocsRenderer(
+            {"output_dir": str(tmp_path), "num_retries": 5, "folder_id": "folder456"}
+        )
+        renderer.docs_service = MagicMock()
+        renderer.drive_service = MagicMock()
+        create = renderer.docs_service.documents.return_value.create.return_value
+        create.execute.side_effect = [rate_limited, {"documentId": "doc123"}]
+
+        url = renderer.render(create_test_minutes("test-meeting-id"), "test-meeting-id")
+
+        assert url == "https://docs.google.com/document/d/doc123/edit"
+        assert create.execute.call_count == 2
+        create.execute.assert_called_with()
+        batch = renderer.docs_service.documents.return_value.batchUpdate.return_value
+        batch.execute.assert_called_once_with()
+        files = renderer.drive_service.files.return_value
+        files.get.return_value.execute.assert_called_once_with(num_retries=5)
+        files.update.return_value.execute.assert_called_once_with(num_retries=5)
+        assert (tmp_path / "test-meeting-id" / "google_doc_info.json").exists()
+
+    def test_google_docs_writes_not_retried_after_server_error(self, tmp_path, monkeypatch):
+        """Test a create or batchUpdate that fails with a 5xx is not sent again."""
+        from meetscribe.outputs.google_docs_renderer import GoogleDocsRenderer
+
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        error = Exception("Backend error")
+        error.resp = MagicMock(status=500)
+        renderer = GoogleDocsRenderer({"output_dir": str(tmp_path)})
+        renderer.docs_service = MagicMock()
+        documents = renderer.docs_service.documents.return_value
+        documents.create.return_value.execute.return_value = {"documentId": "doc123"}
+        documents.batchUpdate.return_value.execute.side_effect = [error, {}]
+
+        with pytest.raises(Exception, match="Backend error"):
+            renderer.render(create_test_minutes("test-meeting-id"), "test-meeting-id")
+
+        documents.batchUpdate.return_value.execute.assert_called_once_with()
+
+    def test_google_docs_shares_in_one_batch(self, tmp_path):
+        """Test sharing with several users issues one batch request."""
+        from meetscribe.outputs.google_docs_renderer import GoogleDocsRenderer
+
+        renderer = GoogleDocsRenderer({"output_dir": str(tmp_path)})
+        renderer.drive_service = MagicMock()
+        batch = renderer.drive_service.new_batch_http_request.return_value
+
+        renderer._share_document_batch("doc123", ["a@example.com", "b@example.com"])
+
+        assert batch.add.call_count == 2
+        batch.execute.assert_called_once_with()
+        callback = renderer.drive_service.new_batch_http_request.call_args.kwargs["callback"]
+        callback("1", None, RuntimeError("denied"))  # Logged, not raised
+
+    def test_google_docs_mock_backup_is_json(self, tmp_path):
+        """Test mock mode writes the document info as JSON."""
+        import json
+
+        from meetscribe.outputs.google_docs_renderer import GoogleDocsRenderer
+
+        renderer = GoogleDocsRenderer({"output_dir": str(tmp_path)})
+        renderer.render(create_test_minutes("test-meeting-id"), "test-meeting-id")
+
+        info_path = tmp_path / "test-meeting-id" / "google_doc_info.json"
+        with open(info_path, encoding="utf-8") as f:
+            info = json.load(f)
+        assert info["summary"] == "Test meeting summary"
+        assert info["google_doc_url"].endswith("mock_test-meeting-id/edit")
+
+    def test_build_document_requests_coalesced(self, tmp_path):
+        """Test document content is inserted once with merged paragraph styles."""
+        from meetscribe.outputs.google_docs_renderer import GoogleDocsRenderer
+
+        renderer = GoogleDocsRenderer({"output_dir": str(tmp_path)})
+        minutes = create_test_minutes("test-meeting-id")
+        minutes.key_points = ["Point 1", "Point 2", "Point 3"]
+
+        requests = renderer._build_document_requests(minutes, "test-meeting-id")
+
+        inserts = [r for r in requests if "insertText" in r]
+        assert len(inserts) == 1
+        text = inserts[0]["insertText"]["text"]
+        assert text.startswith("Meeting Minutes: test-meeting-id\n")
+        assert "• Point 3\n" in text
+
+        updates = [r["updateParagraphStyle"] for r in requests[1:]]
+        ranges = [u["range"] for u in updates]
+        styles = [u["paragraphStyle"]["namedStyleType"] for u in updates]
+        # Ranges tile the whole text and never repeat a style back to back
+        assert ranges[0]["startIndex"] == 1
+        assert ranges[-1]["endIndex"] == 1 + len(text)
+        assert all(a["endIndex"] == b["startIndex"] for a, b in zip(ranges, ranges[1:]))
+        assert all(a != b for a, b in zip(styles, styles[1:]))
+
 
 class TestGoogleSheetsRenderer:
     """Tests for GoogleSheetsRenderer."""
@@ -252,6 +352,212 @@ class TestGoogleSheetsRenderer:
         # Just verify initialization works
         assert renderer is not None
 
+    def test_google_sheets_created_with_content(self, tmp_path):
+        """Test sheet content is sent with the create request."""
+        from meetscribe.outputs.google_sheets_renderer import GoogleSheetsRenderer
+
+        renderer = GoogleSheetsRenderer({"output_dir": str(tmp_path)})
+        renderer.sheets_service = MagicMock()
+        spreadsheets = renderer.sheets_service.spreadsheets.return_value
+        spreadsheets.create.return_value.execute.return_value = {"spreadsheetId": "sheet123"}
+
+        url = renderer.render(create_test_minutes("test-meeting-id"), "test-meeting-id")
+
+        assert url == "https://docs.google.com/spreadsheets/d/sheet123/edit"
+        spreadsheets.values.assert_not_called()
+        sheets = spreadsheets.create.call_args.kwargs["body"]["sheets"]
+        assert [sheet["properties"]["title"] for sheet in sheets] == [
+            "Summary",
+            "Action Items",
+            "Decisions",
+        ]
+        assert [sheet["properties"]["sheetId"] for sheet in sheets] == [0, 1, 2]
+        action_row = sheets[1]["data"][0]["rowData"][1]["values"]
+        assert action_row[0] == {"userEnteredValue": {"numberValue": 1}}
+        assert action_row[1] == {"userEnteredValue": {"stringValue": "Action 1"}}
+        header = sheets[1]["data"][0]["rowData"][0]["values"][0]
+        assert header["userEnteredFormat"] == GoogleSheetsRenderer.HEADER_FORMAT
+
+        # Only the column auto-resize follows the create
+        spreadsheets.batchUpdate.assert_called_once()
+        requests = spreadsheets.batchUpdate.call_args.kwargs["body"]["requests"]
+        assert [list(request) for request in requests] == [["autoResizeDimensions"]]
+
+    def test_google_sheets_post_create_steps_all_run(self, tmp_path):
+        """Test resize, folder move, sharing and backup all run after create."""
+        from meetscribe.outputs.google_sheets_renderer import GoogleSheetsRenderer
+
+        renderer = GoogleSheetsRenderer(
+            {"output_dir": str(tmp_path), "folder_id": "folder456", "share_with": ["a@x.com"]}
+        )
+        renderer.sheets_service = MagicMock()
+        renderer.drive_service = MagicMock()
+        spreadsheets = renderer.sheets_service.spreadsheets.return_value
+        spreadsheets.create.return_value.execute.return_value = {"spreadsheetId": "sheet123"}
+
+        renderer.render(create_test_minutes("test-meeting-id"), "test-meeting-id")
+
+        spreadsheets.batchUpdate.return_value.execute.assert_called_once()
+        renderer.drive_service.files.return_value.update.assert_called_once()
+        renderer.drive_service.new_batch_http_request.return_value.execute.assert_called_once()
+        assert (tmp_path / "test-meeting-id" / "google_sheet_info.json").exists()
+
+    def test_google_sheets_resources_bound_once(self, tmp_path):
+        """Test API resources are bound when a service is assigned."""
+        from meetscribe.outputs.google_sheets_renderer import GoogleSheetsRenderer
+
+        renderer = GoogleSheetsRenderer({"output_dir": str(tmp_path)})
+        renderer.sheets_service = MagicMock()
+        spreadsheets = renderer.sheets_service.spreadsheets
+        spreadsheets.return_value.create.return_value.execute.return_value = {
+            "spreadsheetId": "sheet123"
+        }
+
+        renderer.render(create_test_minutes("test-meeting-id"), "test-meeting-id")
+
+        spreadsheets.assert_called_once_with()
+
+    def test_google_sheets_execute_retries_rate_limit(self, tmp_path, monkeypatch):
+        """Test API calls are retried on 429 responses."""
+        from meetscribe.outputs.google_sheets_renderer import GoogleSheetsRenderer
+
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        error = Exception("Quota exceeded")
+        error.resp = MagicMock(status=429)
+        request = MagicMock()
+        request.execute.side_effect = [error, {"spreadsheetId": "sheet123"}]
+
+        renderer = GoogleSheetsRenderer({"output_dir": str(tmp_path)})
+
+        assert renderer._execute(request) == {"spreadsheetId": "sheet123"}
+        assert request.execute.call_count == 2
+
+    def test_google_sheets_writes_not_retried_after_server_error(self, tmp_path, monkeypatch):
+        """Test create and append are not retried on a 500 that may have been applied."""
+        from meetscribe.outputs.google_sheets_renderer import GoogleSheetsRenderer
+
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        error = Exception("Internal error")
+        error.resp = MagicMock(status=500)
+        renderer = GoogleSheetsRenderer({"output_dir": str(tmp_path)})
+        renderer.sheets_service = MagicMock()
+        spreadsheets = renderer.sheets_service.spreadsheets.return_value
+        create = spreadsheets.create.return_value
+        create.execute.side_effect = [error, {"spreadsheetId": "sheet123"}]
+
+        with pytest.raises(Exception, match="Internal error"):
+            renderer.render(create_test_minutes("test-meeting-id"), "test-meeting-id")
+        assert create.execute.call_count == 1
+
+        append = spreadsheets.values.return_value.append.return_value
+        append.execute.side_effect = [error, {}]
+        renderer.existing_spreadsheet_id = "sheet123"
+        with pytest.raises(Exception, match="Internal error"):
+            renderer._append_to_spreadsheet(create_test_minutes("test-meeting-id"), "meeting")
+        assert append.execute.call_count == 1
+
+        # Idempotent calls still retry server errors
+        request = MagicMock()
+        request.execute.side_effect = [error, {}]
+        assert renderer._execute(request) == {}
+        assert request.execute.call_count == 2
+
+    def test_google_sheets_writes_take_rate_limit_tokens(self, tmp_path):
+        """Test Sheets writes take a token from the shared write bucket."""
+        from meetscribe.outputs import google_sheets_renderer as module
+
+        renderer = module.GoogleSheetsRenderer({"output_dir": str(tmp_path)})
+        renderer.sheets_service = MagicMock()
+        spreadsheets = renderer.sheets_service.spreadsheets.return_value
+        spreadsheets.create.return_value.execute.return_value = {"spreadsheetId": "sheet123"}
+
+        with patch.object(module._WRITE_BUCKET, "acquire") as acquire:
+            renderer.render(create_test_minutes("test-meeting-id"), "test-meeting-id")
+
+        # create + column auto-resize batchUpdate
+        assert acquire.call_count == 2
+
+    def test_google_sheets_http_connections_reused(self, tmp_path, monkeypatch):
+        """Test post-create calls borrow pooled connections and give them back."""
+        from meetscribe.outputs import google_sheets_renderer as module
+
+        renderer = module.GoogleSheetsRenderer({"output_dir": str(tmp_path)})
+        renderer.credentials = MagicMock()
+        http = MagicMock()
+        monkeypatch.setitem(module._idle_https, renderer.credentials, [http])
+
+        assert renderer._call_with_http(lambda spreadsheet_id, h: h, "sheet123") is http
+        assert module._idle_https[renderer.credentials] == [http]
+
+    def test_google_sheets_services_reused(self, monkeypatch):
+        """Test renderers with the same credentials share built services."""
+        from meetscribe.outputs import google_sheets_renderer as module
+
+        services = (MagicMock(), MagicMock(), MagicMock())
+        monkeypatch.setattr(module, "_services", {})
+        module._services[("sa.json", None, "./token.json")] = services
+
+        renderer = module.GoogleSheetsRenderer({"service_account_path": "sa.json"})
+
+        assert (renderer.credentials, renderer.sheets_service, renderer.drive_service) == services
+
+    def test_google_sheets_move_to_folder_single_call(self, tmp_path):
+        """Test moving a new spreadsheet into a folder takes one Drive call."""
+        from meetscribe.outputs.google_sheets_renderer import GoogleSheetsRenderer
+
+        renderer = GoogleSheetsRenderer({"output_dir": str(tmp_path)})
+        renderer.drive_service = MagicMock()
+        files = renderer.drive_service.files.return_value
+
+        renderer._move_to_folder("sheet123", "folder456")
+
+        files.get.assert_not_called()
+        kwargs = files.update.call_args.kwargs
+        assert kwargs["addParents"] == "folder456"
+        assert kwargs["removeParents"] == "root"
+
+    def test_google_sheets_deferred_moves_flushed_in_one_batch(self, tmp_path):
+        """Test deferred folder moves are sent together by flush_pending()."""
+        from meetscribe.outputs.google_sheets_renderer import GoogleSheetsRenderer
+
+        renderer = GoogleSheetsRenderer(
+            {"output_dir": str(tmp_path), "folder_id": "folder456", "defer_folder_moves": True}
+        )
+        renderer.sheets_service = MagicMock()
+        renderer.drive_service = MagicMock()
+        spreadsheets = renderer.sheets_service.spreadsheets.return_value
+        spreadsheets.create.return_value.execute.side_effect = [
+            {"spreadsheetId": "sheet1"},
+            {"spreadsheetId": "sheet2"},
+        ]
+        renderer.render(create_test_minutes("meeting-1"), "meeting-1")
+        renderer.render(create_test_minutes("meeting-2"), "meeting-2")
+        renderer.drive_service.files.return_value.update.assert_not_called()
+
+        new_batch = renderer.drive_service.new_batch_http_request
+        batch = new_batch.return_value
+        batch.execute.side_effect = lambda: [
+            new_batch.call_args.kwargs["callback"](str(i), {}, None) for i in range(2)
+        ]
+
+        assert renderer.flush_pending() == ["sheet1", "sheet2"]
+        assert batch.add.call_count == 2
+        batch.execute.assert_called_once()
+        assert renderer.flush_pending() == []
+
+    def test_google_sheets_shares_in_one_batch(self, tmp_path):
+        """Test sharing with several users issues one batch request."""
+        from meetscribe.outputs.google_sheets_renderer import GoogleSheetsRenderer
+
+        renderer = GoogleSheetsRenderer({"output_dir": str(tmp_path)})
+        renderer.drive_service = MagicMock()
+        batch = renderer.drive_service.new_batch_http_request.return_value
+
+        renderer._share_spreadsheet_batch("sheet123", ["a@example.com", "b@example.com"])
+
+        assert batch.add.call_count == 2
+        batch.execute.assert_called_once_with(http=None)
+
 
 class TestDiscordWebhookRenderer:
     """Tests for DiscordWebhookRenderer."""
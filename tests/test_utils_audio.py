@@ -5,6 +5,7 @@ Tests audio processing utilities including format detection,
 audio info retrieval, and mock tests for ffmpeg operations.
 """
 
+import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -59,6 +60,14 @@ class TestIsValidAudioFormat:
         assert is_valid_audio_format(Path("test.MP3")) is True
         assert is_valid_audio_format(Path("test.Wav")) is True
 
+    def test_hidden_file_and_trailing_dot(self):
+        """Test names whose dots are not an extension, as with Path.suffix."""
+        from meetscribe.utils.audio import is_valid_audio_format
+
+        assert is_valid_audio_format(Path(".mp3")) is False
+        assert is_valid_audio_format(Path("test.mp3.")) is False
+        assert is_valid_audio_format(Path("archive.tar.mp3")) is True
+
 
 class TestGetMimeType:
     """Tests for get_mime_type function."""
@@ -82,6 +91,35 @@ class TestGetMimeType:
         assert get_mime_type(Path("test.unknown")) == "application/octet-stream"
 
 
+class TestToolPath:
+    """Tests for _tool_path helper."""
+
+    def test_tool_path_resolved_once(self):
+        """Test that PATH is searched once per tool."""
+        from meetscribe.utils.audio import _tool_path
+
+        _tool_path.cache_clear()
+        try:
+            with patch("shutil.which", return_value="/opt/bin/ffmpeg") as mock_which:
+                assert _tool_path("ffmpeg") == "/opt/bin/ffmpeg"
+                assert _tool_path("ffmpeg") == "/opt/bin/ffmpeg"
+
+            mock_which.assert_called_once_with("ffmpeg")
+        finally:
+            _tool_path.cache_clear()
+
+    def test_tool_path_falls_back_to_name(self):
+        """Test that a missing tool keeps its bare name."""
+        from meetscribe.utils.audio import _tool_path
+
+        _tool_path.cache_clear()
+        try:
+            with patch("shutil.which", return_value=None):
+                assert _tool_path("ffprobe") == "ffprobe"
+        finally:
+            _tool_path.cache_clear()
+
+
 class TestGetAudioInfo:
     """Tests for get_audio_info function."""
 
@@ -144,6 +182,61 @@ class TestGetAudioInfo:
             assert result["channels"] == 2
 
 
+class TestGetAudioInfoBatch:
+    """Tests for get_audio_info_batch function."""
+
+    def test_get_audio_info_batch_preserves_order(self, tmp_path):
+        """Test results come back in input order with one probe per file."""
+        from meetscribe.utils.audio import get_audio_info_batch
+
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"segment_{i:03d}.mp3"
+            path.write_bytes(b"x" * (i + 1))
+            paths.append(path)
+
+        def fake_run(cmd, **kwargs):
+            result = MagicMock()
+            result.returncode = 0
+            result.stdout = f'{{"format": {{"duration": "{Path(cmd[-1]).stat().st_size}"}}}}'
+            return result
+
+        with patch("subprocess.run", side_effect=fake_run) as mock_run:
+            results = get_audio_info_batch(paths, max_workers=2)
+
+        assert mock_run.call_count == 4
+        assert [r["filename"] for r in results] == [p.name for p in paths]
+        assert [r["duration"] for r in results] == [1.0, 2.0, 3.0, 4.0]
+
+    def test_get_audio_info_batch_empty(self):
+        """Test batch probing with no files."""
+        from meetscribe.utils.audio import get_audio_info_batch
+
+        assert get_audio_info_batch([]) == []
+
+
+class TestGetAudioHash:
+    """Tests for get_audio_hash function."""
+
+    def test_get_audio_hash(self, tmp_path):
+        """Test hashing an audio file."""
+        import hashlib
+
+        from meetscribe.utils.audio import get_audio_hash
+
+        test_file = tmp_path / "test.mp3"
+        test_file.write_bytes(b"fake audio content")
+
+        assert get_audio_hash(test_file) == hashlib.sha256(b"fake audio content").hexdigest()
+
+    def test_get_audio_hash_file_not_found(self, tmp_path):
+        """Test get_audio_hash with nonexistent file."""
+        from meetscribe.utils.audio import get_audio_hash
+
+        with pytest.raises(FileNotFoundError):
+            get_audio_hash(tmp_path / "nonexistent.mp3")
+
+
 class TestGetAudioDuration:
     """Tests for get_audio_duration function."""
 
@@ -190,7 +283,7 @@ class TestConvertAudio:
             assert result == output_file
             mock_run.assert_called_once()
             call_args = mock_run.call_args[0][0]
-            assert "ffmpeg" in call_args
+            assert Path(call_args[0]).stem == "ffmpeg"
             assert "-ar" in call_args
             assert "16000" in call_args
 
@@ -225,6 +318,146 @@ class TestConvertAudio:
                 convert_audio(input_file, output_file)
 
 
+class TestIterAudioPcm:
+    """Tests for convert_audio_to_stream and iter_audio_pcm functions."""
+
+    def test_iter_audio_pcm_yields_chunks(self, tmp_path):
+        """Test PCM is read from ffmpeg stdout in blocks."""
+        import io
+
+        from meetscribe.utils.audio import iter_audio_pcm
+
+        input_file = tmp_path / "input.mp3"
+        input_file.write_bytes(b"fake audio")
+
+        process = MagicMock()
+        process.stdout = io.BytesIO(b"\x01\x00" * 5)
+        process.wait.return_value = 0
+        process.returncode = 0
+        process.poll.return_value = 0
+
+        with patch("subprocess.Popen", return_value=process) as mock_popen:
+            chunks = list(iter_audio_pcm(input_file, chunk_size=4))
+
+        assert chunks == [b"\x01\x00\x01\x00", b"\x01\x00\x01\x00", b"\x01\x00"]
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[cmd.index("-f") + 1] == "s16le"
+        assert cmd[-1] == "pipe:1"
+
+    def test_iter_audio_pcm_ffmpeg_error(self, tmp_path):
+        """Test a failing ffmpeg raises after the output is drained."""
+        import io
+
+        from meetscribe.utils.audio import iter_audio_pcm
+
+        input_file = tmp_path / "input.mp3"
+        input_file.write_bytes(b"fake audio")
+
+        process = MagicMock()
+        process.stdout = io.BytesIO(b"")
+        process.wait.return_value = 1
+        process.returncode = 1
+
+        with patch("subprocess.Popen", return_value=process):
+            with pytest.raises(RuntimeError, match="ffmpeg failed"):
+                list(iter_audio_pcm(input_file))
+
+    def test_convert_audio_to_stream_ffmpeg_not_found(self, tmp_path):
+        """Test convert_audio_to_stream when ffmpeg is not found."""
+        from meetscribe.utils.audio import convert_audio_to_stream
+
+        input_file = tmp_path / "input.mp3"
+        input_file.write_bytes(b"fake audio")
+
+        with patch("subprocess.Popen", side_effect=FileNotFoundError):
+            with pytest.raises(RuntimeError, match="ffmpeg not found"):
+                convert_audio_to_stream(input_file)
+
+
+class TestPreprocessAudio:
+    """Tests for preprocess_audio function."""
+
+    def test_preprocess_audio_single_pass(self, tmp_path):
+        """Test all steps are fused into one ffmpeg invocation."""
+        from meetscribe.utils.audio import preprocess_audio
+
+        input_file = tmp_path / "input.mp3"
+        input_file.write_bytes(b"fake audio")
+        output_file = tmp_path / "output.wav"
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            result = preprocess_audio(input_file, output_file, samplerate=16000, channels=1)
+
+        assert result == output_file
+        mock_run.assert_called_once()
+        call_args = mock_run.call_args[0][0]
+        filters = call_args[call_args.index("-af") + 1].split(",")
+        assert [f.split("=")[0] for f in filters] == ["silenceremove", "loudnorm"]
+        assert call_args[call_args.index("-ar") + 1] == "16000"
+        assert call_args[call_args.index("-ac") + 1] == "1"
+
+    def test_preprocess_audio_quiet_until_failure(self, tmp_path):
+        """Test ffmpeg runs without progress output and errors are decoded on failure."""
+        from meetscribe.utils.audio import preprocess_audio
+
+        input_file = tmp_path / "input.mp3"
+        input_file.write_bytes(b"fake audio")
+
+        mock_result = MagicMock()
+        mock_result.returncode = 1
+        mock_result.stderr = b"Invalid data found when processing input\n"
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            with pytest.raises(RuntimeError, match="Invalid data found"):
+                preprocess_audio(input_file, tmp_path / "out.wav")
+
+        call_args = mock_run.call_args[0][0]
+        assert call_args[1:4] == ["-nostats", "-loglevel", "error"]
+        assert "-xerror" not in call_args
+        assert "-nostdin" in call_args
+        assert mock_run.call_args.kwargs["stdin"] == subprocess.DEVNULL
+        assert "text" not in mock_run.call_args.kwargs
+
+    def test_preprocess_audio_custom_filter_parameters(self, tmp_path):
+        """Test non-default parameters are interpolated into the filters."""
+        from meetscribe.utils.audio import preprocess_audio
+
+        input_file = tmp_path / "input.mp3"
+        input_file.write_bytes(b"fake audio")
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            preprocess_audio(
+                input_file, tmp_path / "out.wav", silence_threshold=-40.0, target_lufs=-23.0
+            )
+
+        call_args = mock_run.call_args[0][0]
+        filters = call_args[call_args.index("-af") + 1]
+        assert "start_threshold=-40.0dB" in filters
+        assert "start_silence=0.5" in filters
+        assert "loudnorm=I=-23.0:TP=-1.0" in filters
+
+    def test_preprocess_audio_without_filters(self, tmp_path):
+        """Test that disabled steps add no filter chain."""
+        from meetscribe.utils.audio import preprocess_audio
+
+        input_file = tmp_path / "input.mp3"
+        input_file.write_bytes(b"fake audio")
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            preprocess_audio(input_file, tmp_path / "out.wav", loudnorm=False, silence=False)
+
+        assert "-af" not in mock_run.call_args[0][0]
+
+
 class TestNormalizeAudio:
     """Tests for normalize_audio function."""
 
@@ -339,12 +572,16 @@ class TestSplitAudio:
 
         mock_result = MagicMock()
         mock_result.returncode = 0
+        mock_result.stdout = b"input_000.mp3\ninput_001.mp3\n"
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
             result = split_audio(input_file, output_dir)
 
             assert output_dir.exists()
-            assert isinstance(result, list)
+            assert result == [output_dir / "input_000.mp3", output_dir / "input_001.mp3"]
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("-segment_list") + 1] == "pipe:1"
 
 
 class TestMergeAudio:
@@ -377,11 +614,19 @@ class TestMergeAudio:
         mock_result = MagicMock()
         mock_result.returncode = 0
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
             result = merge_audio([file1, file2], output_file)
 
             assert result == output_file
 
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("-i") + 1] == "pipe:0"
+        assert "-nostdin" not in cmd
+        assert mock_run.call_args[1]["input"] == (
+            f"file '{file1.absolute()}'\nfile '{file2.absolute()}'\n".encode()
+        )
+        assert not (tmp_path / "concat_list.txt").exists()
+
 
 class TestAnalyzeAudioQuality:
     """Tests for analyze_audio_quality function."""
@@ -416,3 +661,55 @@ class TestAnalyzeAudioQuality:
 
             assert "path" in result
             assert "filename" in result
+
+    def test_analyze_audio_quality_uses_summary_values(self, tmp_path):
+        """Test loudness comes from the final summary, not per-frame lines."""
+        from meetscribe.utils.audio import analyze_audio_quality
+
+        test_file = tmp_path / "test.mp3"
+        test_file.write_bytes(b"fake audio content")
+
+        mock_ffprobe_result = MagicMock()
+        mock_ffprobe_result.returncode = 0
+        mock_ffprobe_result.stdout = "{}"
+
+        mock_ffmpeg_result = MagicMock()
+        mock_ffmpeg_result.returncode = 0
+        mock_ffmpeg_result.stderr = (
+            "[Parsed_ebur128_0] t: 0.1  M: -70.2 S:-120.7  I: -70.2 LUFS  LRA: 0.0 LU\n"
+            "[Parsed_ebur128_0] t: 0.2  M: -30.0 S:-120.7  I: -40.5 LUFS  LRA: 0.0 LU\n"
+            "[Parsed_ebur128_0] Summary:\n"
+            "  Integrated loudness:\n    I:         -18.3 LUFS\n"
+            "  True peak:\n    Peak:       -2.5 dBFS\n"
+        )
+
+        with patch("subprocess.run", side_effect=[mock_ffprobe_result, mock_ffmpeg_result]):
+            result = analyze_audio_quality(test_file)
+
+        assert result["integrated_lufs"] == -18.3
+        assert result["peak_dbfs"] == -2.5
+
+    def test_analyze_audio_quality_silent_peak(self, tmp_path):
+        """Test a silent recording reports a peak of -inf dBFS."""
+        from meetscribe.utils.audio import analyze_audio_quality
+
+        test_file = tmp_path / "silence.wav"
+        test_file.write_bytes(b"fake audio content")
+
+        mock_ffprobe_result = MagicMock()
+        mock_ffprobe_result.returncode = 0
+        mock_ffprobe_result.stdout = "{}"
+
+        mock_ffmpeg_result = MagicMock()
+        mock_ffmpeg_result.returncode = 0
+        mock_ffmpeg_result.stderr = (
+            "[Parsed_ebur128_0] Summary:\n"
+            "  Integrated loudness:\n    I:         -70.0 LUFS\n"
+            "  True peak:\n    Peak:       -inf dBFS\n"
+        )
+
+        with patch("subprocess.run", side_effect=[mock_ffprobe_result, mock_ffmpeg_result]):
+            result = analyze_audio_quality(test_file)
+
+        assert result["integrated_lufs"] == -70.0
+        assert result["peak_dbfs"] == float("-inf")
@@ -156,6 +156,40 @@ class TestFindFilesByExtension:
         result = find_files_by_extension(tmp_path, [".mp3"], recursive=True)
         assert len(result) == 2
 
+    def test_find_files_by_extension_skips_unreadable_directory(self, tmp_path, monkeypatch):
+        """Test that a directory that cannot be listed is skipped, not fatal."""
+        import os
+
+        from meetscribe.utils.files import find_files_by_extension
+
+        (tmp_path / "audio.mp3").write_bytes(b"")
+        locked = tmp_path / "locked"
+        locked.mkdir()
+        (locked / "hidden.mp3").write_bytes(b"")
+
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.fspath(path) == str(locked):
+                raise PermissionError(13, "Permission denied", str(locked))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+
+        result = find_files_by_extension(tmp_path, [".mp3"], recursive=True)
+        assert result == [tmp_path / "audio.mp3"]
+
+    def test_find_files_by_extension_case_insensitive(self, tmp_path):
+        """Test that extensions match regardless of case and directories are skipped."""
+        from meetscribe.utils.files import find_files_by_extension
+
+        (tmp_path / "AUDIO.MP3").write_bytes(b"")
+        (tmp_path / "audio.wav").write_bytes(b"")
+        (tmp_path / "folder.mp3").mkdir()
+
+        result = find_files_by_extension(tmp_path, [".mp3", "WAV"])
+        assert result == [tmp_path / "AUDIO.MP3", tmp_path / "audio.wav"]
+
     def test_find_files_by_extension_nonexistent(self, tmp_path):
         """Test finding files in nonexistent directory."""
         from meetscribe.utils.files import find_files_by_extension
@@ -173,6 +207,30 @@ class TestFindFilesByExtension:
         assert len(result) == 1
 
 
+class TestIterFileChunks:
+    """Tests for iter_file_chunks function."""
+
+    def test_iter_file_chunks_splits_file(self, tmp_path):
+        """Test that the file is yielded in chunk-sized pieces."""
+        from meetscribe.utils.files import iter_file_chunks
+
+        test_file = tmp_path / "audio.bin"
+        test_file.write_bytes(b"a" * 10 + b"b" * 10 + b"c" * 5)
+
+        chunks = list(iter_file_chunks(test_file, chunk_size=10))
+
+        assert chunks == [b"a" * 10, b"b" * 10, b"c" * 5]
+
+    def test_iter_file_chunks_empty_file(self, tmp_path):
+        """Test that an empty file yields nothing."""
+        from meetscribe.utils.files import iter_file_chunks
+
+        test_file = tmp_path / "empty.bin"
+        test_file.write_bytes(b"")
+
+        assert list(iter_file_chunks(test_file)) == []
+
+
 class TestCalculateFileHash:
     """Tests for calculate_file_hash function."""
 
@@ -187,6 +245,79 @@ class TestCalculateFileHash:
         assert len(result) == 64  # SHA256 hex digest length
         assert result.isalnum()
 
+    def test_calculate_file_hash_matches_hashlib(self, tmp_path, monkeypatch):
+        """Test the digest is correct with and without hashlib.file_digest."""
+        import hashlib
+
+        from meetscribe.utils.files import calculate_file_hash
+
+        test_file = tmp_path / "test.bin"
+        data = bytes(range(256)) * 5000  # spans several read buffers
+        test_file.write_bytes(data)
+        expected = hashlib.sha256(data).hexdigest()
+
+        assert calculate_file_hash(test_file) == expected
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        assert calculate_file_hash(test_file) == expected
+
+    def test_calculate_file_hash_empty_file_fallback(self, tmp_path, monkeypatch):
+        """Test hashing an empty file without hashlib.file_digest."""
+        import hashlib
+
+        from meetscribe.utils.files import calculate_file_hash
+
+        test_file = tmp_path / "empty.bin"
+        test_file.write_bytes(b"")
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+
+        assert calculate_file_hash(test_file) == hashlib.sha256(b"").hexdigest()
+
+    @pytest.mark.skipif(not os.path.exists("/proc/version"), reason="procfs unavailable")
+    def test_calculate_file_hash_zero_size_stat_fallback(self, monkeypatch):
+        """Test files whose st_size is 0 (procfs, pipes) are still read in full."""
+        import hashlib
+
+        from meetscribe.utils.files import calculate_file_hash
+
+        with open("/proc/version", "rb") as f:
+            data = f.read()
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+
+        assert data
+        assert calculate_file_hash(Path("/proc/version")) == hashlib.sha256(data).hexdigest()
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise unavailable")
+    def test_calculate_file_hash_advises_sequential_read(self, tmp_path, monkeypatch):
+        """Test the kernel is told the file will be read sequentially."""
+        from meetscribe.utils.files import calculate_file_hash
+
+        test_file = tmp_path / "test.bin"
+        test_file.write_bytes(b"data")
+        advice = []
+        monkeypatch.setattr(os, "posix_fadvise", lambda fd, offset, length, a: advice.append(a))
+
+        calculate_file_hash(test_file)
+
+        assert advice == [os.POSIX_FADV_SEQUENTIAL, os.POSIX_FADV_WILLNEED]
+
+    def test_calculate_hashes(self, tmp_path):
+        """Test hashing several files at once."""
+        import hashlib
+
+        from meetscribe.utils.files import calculate_hashes
+
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"segment_{i}.mp3"
+            path.write_bytes(b"audio" * (i + 1))
+            paths.append(path)
+
+        result = calculate_hashes(paths, max_workers=3)
+
+        assert list(result) == paths
+        for i, path in enumerate(paths):
+            assert result[path] == hashlib.sha256(b"audio" * (i + 1)).hexdigest()
+
     def test_calculate_file_hash_md5(self, tmp_path):
         """Test calculating MD5 hash."""
         from meetscribe.utils.files import calculate_file_hash
@@ -229,6 +360,20 @@ class TestGetFileInfo:
         assert "created" in result
         assert "modified" in result
 
+    def test_get_file_info_with_dir_entry_stat(self, tmp_path, monkeypatch):
+        """Test that a stat result from os.scandir is used as-is."""
+        from meetscribe.utils.files import get_file_info
+
+        (tmp_path / "subdir").mkdir()
+        (entry,) = os.scandir(tmp_path)
+        stat_result = entry.stat()
+        monkeypatch.setattr(Path, "stat", lambda *args, **kwargs: pytest.fail("stat called"))
+
+        result = get_file_info(Path(entry.path), stat_result)
+
+        assert result["is_dir"] is True
+        assert result["is_file"] is False
+
 
 class TestFormatFileSize:
     """Tests for format_file_size function."""
@@ -258,6 +403,14 @@ class TestFormatFileSize:
 
         assert format_file_size(1024 * 1024 * 1024) == "1.0 GB"
 
+    def test_format_file_size_unit_boundaries(self):
+        """Test values just below a unit boundary and beyond the largest unit."""
+        from meetscribe.utils.files import format_file_size
+
+        assert format_file_size(1023) == "1023.0 B"
+        assert format_file_size(1024 * 1024 - 1) == "1024.0 KB"
+        assert format_file_size(1024**6) == "1024.0 PB"
+
 
 class TestSafeCopy:
     """Tests for safe_copy function."""
@@ -314,6 +467,58 @@ class TestSafeCopy:
 
         assert dst.read_text() == "new content"
 
+    def test_safe_copy_preserves_metadata(self, tmp_path):
+        """Test that content, mode and mtime are copied as with shutil.copy2."""
+        from meetscribe.utils.files import safe_copy
+
+        src = tmp_path / "source.bin"
+        src.write_bytes(os.urandom(100_000))
+        os.chmod(src, 0o640)
+        os.utime(src, (1_600_000_000, 1_600_000_000))
+        dst = tmp_path / "dest.bin"
+
+        safe_copy(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == 1_600_000_000
+        assert dst.stat().st_mode == src.stat().st_mode
+
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range unavailable")
+    def test_safe_copy_falls_back_when_copy_file_range_unsupported(self, tmp_path, monkeypatch):
+        """Test copying across filesystems without in-kernel copy support."""
+        import errno
+
+        from meetscribe.utils.files import safe_copy
+
+        def cross_device(*args):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "copy_file_range", cross_device)
+        src = tmp_path / "source.txt"
+        src.write_text("content")
+        dst = tmp_path / "dest.txt"
+        dst.write_text("a much longer existing destination")
+
+        safe_copy(src, dst, overwrite=True)
+
+        assert dst.read_text() == "content"
+
+    def test_safe_copy_same_file(self, tmp_path):
+        """Test that copying a file onto itself fails and keeps its content."""
+        import shutil
+
+        from meetscribe.utils.files import safe_copy
+
+        src = tmp_path / "source.txt"
+        src.write_text("content")
+
+        with pytest.raises(shutil.SameFileError):
+            safe_copy(src, src, overwrite=True)
+        with pytest.raises(shutil.SameFileError):
+            safe_copy(src, tmp_path / "." / "source.txt", overwrite=True)
+
+        assert src.read_text() == "content"
+
     def test_safe_copy_source_not_found(self, tmp_path):
         """Test safe_copy with nonexistent source."""
         from meetscribe.utils.files import safe_copy
@@ -358,6 +563,48 @@ class TestSafeMove:
         with pytest.raises(FileNotFoundError):
             safe_move(tmp_path / "nonexistent.txt", tmp_path / "dest.txt")
 
+    def test_safe_move_creates_parent_dirs(self, tmp_path):
+        """Test moving a directory under a parent that does not exist yet."""
+        from meetscribe.utils.files import safe_move
+
+        src = tmp_path / "meeting"
+        src.mkdir()
+        (src / "minutes.md").write_text("content")
+        dst = tmp_path / "archive" / "2025" / "meeting"
+
+        safe_move(src, dst)
+
+        assert (dst / "minutes.md").read_text() == "content"
+        assert not src.exists()
+
+    def test_safe_move_into_existing_directory(self, tmp_path):
+        """Test that overwrite onto a directory moves the file inside it."""
+        from meetscribe.utils.files import safe_move
+
+        src = tmp_path / "source.txt"
+        src.write_text("content")
+        dst = tmp_path / "dest"
+        dst.mkdir()
+
+        safe_move(src, dst, overwrite=True)
+
+        assert (dst / "source.txt").read_text() == "content"
+
+    def test_safe_move_directory_into_empty_directory(self, tmp_path):
+        """Test a directory moved onto an empty directory lands inside it."""
+        from meetscribe.utils.files import safe_move
+
+        src = tmp_path / "meeting"
+        src.mkdir()
+        (src / "minutes.md").write_text("minutes")
+        dst = tmp_path / "archive"
+        dst.mkdir()
+
+        safe_move(src, dst, overwrite=True)
+
+        assert (dst / "meeting" / "minutes.md").read_text() == "minutes"
+        assert not src.exists()
+
 
 class TestSafeDelete:
     """Tests for safe_delete function."""
@@ -406,6 +653,17 @@ class TestSafeDelete:
         result = safe_delete(tmp_path / "nonexistent.txt")
         assert result is False
 
+    def test_safe_delete_non_empty_directory(self, tmp_path):
+        """Test that a non-empty directory is kept without recursive."""
+        from meetscribe.utils.files import safe_delete
+
+        test_dir = tmp_path / "dir_with_files"
+        test_dir.mkdir()
+        (test_dir / "file.txt").write_text("content")
+
+        assert safe_delete(test_dir) is False
+        assert (test_dir / "file.txt").exists()
+
 
 class TestCleanupOldFiles:
     """Tests for cleanup_old_files function."""
@@ -461,6 +719,65 @@ class TestCleanupOldFiles:
         assert not mp3_file.exists()
         assert txt_file.exists()
 
+    def test_cleanup_old_files_nested(self, tmp_path):
+        """Test old files in subdirectories are found and directories are kept."""
+        from meetscribe.utils.files import cleanup_old_files
+
+        subdir = tmp_path / "meeting" / "audio"
+        subdir.mkdir(parents=True)
+        old_file = subdir / "old.MP3"
+        old_file.write_text("content")
+        new_file = tmp_path / "meeting" / "new.mp3"
+        new_file.write_text("content")
+        old_time = (datetime.now() - timedelta(days=10)).timestamp()
+        os.utime(old_file, (old_time, old_time))
+        os.utime(subdir, (old_time, old_time))
+
+        result = cleanup_old_files(tmp_path, max_age_days=5, extensions=["mp3"])
+
+        assert result == [old_file]
+        assert new_file.exists()
+        assert subdir.exists()
+
+    def test_cleanup_old_files_many(self, tmp_path):
+        """Test deleting many old files at once."""
+        from meetscribe.utils.files import cleanup_old_files
+
+        old_time = (datetime.now() - timedelta(days=10)).timestamp()
+        files = []
+        for i in range(40):
+            path = tmp_path / f"segment_{i:03d}.mp3"
+            path.write_bytes(b"audio")
+            os.utime(path, (old_time, old_time))
+            files.append(path)
+        (tmp_path / "recent.mp3").write_bytes(b"audio")
+
+        result = cleanup_old_files(tmp_path, max_age_days=5, stat_workers=4)
+
+        assert sorted(result) == files
+        assert [p.name for p in tmp_path.iterdir()] == ["recent.mp3"]
+
+    def test_cleanup_old_files_skips_symlinks(self, tmp_path):
+        """Test that links to old files are left alone."""
+        from meetscribe.utils.files import cleanup_old_files
+
+        target = tmp_path / "outside" / "old.txt"
+        target.parent.mkdir()
+        target.write_text("content")
+        old_time = (datetime.now() - timedelta(days=10)).timestamp()
+        os.utime(target, (old_time, old_time))
+
+        meetings = tmp_path / "meetings"
+        meetings.mkdir()
+        link = meetings / "link.txt"
+        try:
+            link.symlink_to(target)
+        except OSError:
+            pytest.skip("symlinks not supported")
+
+        assert cleanup_old_files(meetings, max_age_days=5) == []
+        assert link.is_symlink()
+
     def test_cleanup_old_files_nonexistent_dir(self, tmp_path):
         """Test cleanup on nonexistent directory."""
         from meetscribe.utils.files import cleanup_old_files
@@ -508,6 +825,23 @@ class TestCleanupEmptyDirectories:
         assert len(result) == 1
         assert empty_dir.exists()
 
+    def test_cleanup_empty_directories_keeps_non_empty(self, tmp_path):
+        """Test parents are removed only once all their children are gone."""
+        from meetscribe.utils.files import cleanup_empty_directories
+
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "keep" / "empty").mkdir(parents=True)
+        (tmp_path / "keep" / "notes.txt").write_text("notes")
+
+        dry = cleanup_empty_directories(tmp_path, dry_run=True)
+        result = cleanup_empty_directories(tmp_path)
+
+        expected = {tmp_path / "a", tmp_path / "a" / "b", tmp_path / "keep" / "empty"}
+        assert set(dry) == expected
+        assert set(result) == expected
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["keep"]
+        assert (tmp_path / "keep" / "notes.txt").exists()
+
 
 class TestTempFileOperations:
     """Tests for temporary file operations."""
@@ -558,6 +892,18 @@ class TestJsonOperations:
             loaded = json.load(f)
         assert loaded == data
 
+    def test_save_json_matches_stdlib_format(self, tmp_path):
+        """Test the written text matches json.dumps for every option."""
+        from meetscribe.utils.files import save_json
+
+        data = {"title": "定例会議", "at": datetime(2025, 1, 1, 10, 0), "items": [1, 2.5, None]}
+        file_path = tmp_path / "test.json"
+
+        for indent, ensure_ascii in [(2, False), (None, False), (4, False), (2, True)]:
+            save_json(data, file_path, indent=indent, ensure_ascii=ensure_ascii)
+            expected = json.dumps(data, indent=indent, ensure_ascii=ensure_ascii, default=str)
+            assert file_path.read_text(encoding="utf-8") == expected
+
     def test_save_json_creates_parents(self, tmp_path):
         """Test that save_json creates parent directories."""
         from meetscribe.utils.files import save_json
@@ -606,6 +952,33 @@ class TestAtomicWrite:
 
         assert file_path.exists()
 
+    def test_atomic_write_bytes(self, tmp_path):
+        """Test that bytes are written as-is without leaving a temp file."""
+        from meetscribe.utils.files import atomic_write
+
+        file_path = tmp_path / "test.json"
+        atomic_write(file_path, b'{"a": 1}')
+
+        assert file_path.read_bytes() == b'{"a": 1}'
+        assert list(tmp_path.iterdir()) == [file_path]
+
+    def test_atomic_write_failure_keeps_original(self, tmp_path, monkeypatch):
+        """Test a failed write leaves the old content and no temp file."""
+        from meetscribe.utils import files
+
+        file_path = tmp_path / "minutes.md"
+        file_path.write_text("old")
+
+        def fail_sync(fd):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(files, "_fdatasync", fail_sync)
+        with pytest.raises(OSError, match="disk full"):
+            files.atomic_write(file_path, "new")
+
+        assert file_path.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [file_path]
+
 
 class TestGetDirectorySize:
     """Tests for get_directory_size function."""
@@ -632,6 +1005,18 @@ class TestGetDirectorySize:
         result = get_directory_size(tmp_path)
         assert result == 10
 
+    def test_get_directory_size_parallel_stat(self, tmp_path, monkeypatch):
+        """Test sizes read on several threads, across more than one batch."""
+        from meetscribe.utils import files
+
+        monkeypatch.setattr(files, "_STAT_BATCH_SIZE", 4)
+        for i in range(10):
+            subdir = tmp_path / f"d{i % 3}"
+            subdir.mkdir(exist_ok=True)
+            (subdir / f"f{i}.bin").write_bytes(b"x" * i)
+
+        assert files.get_directory_size(tmp_path, stat_workers=3) == sum(range(10))
+
     def test_get_directory_size_nonexistent(self, tmp_path):
         """Test getting size of nonexistent directory."""
         from meetscribe.utils.files import get_directory_size
@@ -659,6 +1044,66 @@ class TestArchiveMeeting:
         assert result.exists()
         assert archive_dir.exists()
 
+    def test_archive_meeting_contents(self, tmp_path, monkeypatch):
+        """Test gzip and plain archives hold the meeting data with file contents."""
+        import sys
+        import tarfile
+
+        from meetscribe.utils.files import archive_meeting
+
+        monkeypatch.setitem(sys.modules, "zstandard", None)  # gzip even with zstd requested
+        meeting_dir = tmp_path / "meeting"
+        (meeting_dir / "segments").mkdir(parents=True)
+        (meeting_dir / "minutes.md").write_text("minutes")
+        (meeting_dir / ".minutes.pdf.sha256").write_text("digest")
+        (meeting_dir / "segments" / "000.mp3").write_bytes(b"audio")
+
+        for compress, suffix in [(True, ".tar.gz"), (False, ".tar")]:
+            result = archive_meeting(
+                meeting_dir, tmp_path / "archives", compress=compress, zstd=True
+            )
+
+            assert result == tmp_path / "archives" / f"meeting{suffix}"
+            with tarfile.open(result) as tar:
+                assert tar.getnames() == [
+                    "meeting",
+                    "meeting/minutes.md",
+                    "meeting/segments",
+                    "meeting/segments/000.mp3",
+                ]
+                assert tar.extractfile("meeting/segments/000.mp3").read() == b"audio"
+
+    def test_archive_meeting_zstd(self, tmp_path, monkeypatch):
+        """Test zstd archives stream through zstandard and gzip stays the default."""
+        import sys
+        import tarfile
+        import types
+
+        from meetscribe.utils.files import archive_meeting
+
+        class FakeCompressor:
+            def __init__(self, level, threads):
+                assert (level, threads) == (3, -1)
+
+            def stream_writer(self, f):
+                return f  # identity "compression" leaves a plain tar stream
+
+        monkeypatch.setitem(
+            sys.modules, "zstandard", types.SimpleNamespace(ZstdCompressor=FakeCompressor)
+        )
+
+        meeting_dir = tmp_path / "meeting"
+        meeting_dir.mkdir()
+        (meeting_dir / "audio.mp3").write_bytes(b"audio content")
+
+        assert archive_meeting(meeting_dir, tmp_path / "archives").suffix == ".gz"
+
+        result = archive_meeting(meeting_dir, tmp_path / "archives", zstd=True)
+
+        assert result == tmp_path / "archives" / "meeting.tar.zst"
+        with tarfile.open(result) as tar:
+            assert "meeting/audio.mp3" in tar.getnames()
+
     def test_archive_meeting_not_found(self, tmp_path):
         """Test archiving nonexistent meeting directory."""
         from meetscribe.utils.files import archive_meeting
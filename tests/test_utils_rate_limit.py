@@ -0,0 +1,63 @@
+"""
+Tests for meetscribe.utils.rate_limit module.
+
+Tests token bucket refill and blocking behavior.
+"""
+
+
+class _FakeClock:
+    """Manually advanced clock whose sleep() moves time forward."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket class."""
+
+    def test_burst_up_to_capacity(self):
+        """Test that a full bucket serves capacity tokens without waiting."""
+        from meetscribe.utils.rate_limit import TokenBucket
+
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=3, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        assert clock.sleeps == []
+
+    def test_waits_for_refill_when_empty(self):
+        """Test that an empty bucket waits for the next token."""
+        from meetscribe.utils.rate_limit import TokenBucket
+
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=1, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+        bucket.acquire()
+
+        assert clock.sleeps == [0.5]
+
+    def test_refill_is_capped_at_capacity(self):
+        """Test that idle time does not store more than capacity tokens."""
+        from meetscribe.utils.rate_limit import TokenBucket
+
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+        bucket.acquire()
+        clock.now += 100
+        for _ in range(3):
+            bucket.acquire()
+
+        assert clock.sleeps == [1.0]
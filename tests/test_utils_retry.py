@@ -0,0 +1,119 @@
+"""
+Tests for meetscribe.utils.retry module.
+
+Tests exponential backoff retries and transient error detection.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class _StatusError(Exception):
+    """Exception carrying an HTTP status code like google-api-core errors."""
+
+    def __init__(self, code):
+        super().__init__(f"status {code}")
+        self.code = code
+
+
+class TestIsRetryableStatus:
+    """Tests for is_retryable_status function."""
+
+    def test_rate_limit_is_retryable(self):
+        """Test that 429 errors are retried."""
+        from meetscribe.utils.retry import is_retryable_status
+
+        assert is_retryable_status(_StatusError(429)) is True
+
+    def test_client_error_is_not_retryable(self):
+        """Test that 400 errors are not retried."""
+        from meetscribe.utils.retry import is_retryable_status
+
+        assert is_retryable_status(_StatusError(400)) is False
+
+    def test_http_error_response_status(self):
+        """Test status detection from googleapiclient-style errors."""
+        from meetscribe.utils.retry import is_retryable_status
+
+        error = Exception("unavailable")
+        error.resp = MagicMock(status=503)
+
+        assert is_retryable_status(error) is True
+
+    def test_plain_exception_is_not_retryable(self):
+        """Test that errors without a status are not retried."""
+        from meetscribe.utils.retry import is_retryable_status
+
+        assert is_retryable_status(ValueError("bad")) is False
+
+
+class TestIsRetryableWriteStatus:
+    """Tests for is_retryable_write_status function."""
+
+    def test_only_unapplied_errors_are_retryable(self):
+        """Test writes retry 429 and empty 503s but not errors that may follow a write."""
+        from meetscribe.utils.retry import is_retryable_write_status
+
+        assert is_retryable_write_status(_StatusError(429)) is True
+        assert is_retryable_write_status(_StatusError(503)) is True
+        assert is_retryable_write_status(_StatusError(500)) is False
+        assert is_retryable_write_status(_StatusError(504)) is False
+
+        error = _StatusError(503)
+        error.content = b'{"error": {"code": 503}}'
+        assert is_retryable_write_status(error) is False
+
+
+class TestRetryWithBackoff:
+    """Tests for retry_with_backoff function."""
+
+    def test_returns_result_without_retry(self):
+        """Test successful calls return immediately."""
+        from meetscribe.utils.retry import retry_with_backoff
+
+        sleep = MagicMock()
+        assert retry_with_backoff(lambda: "ok", sleep=sleep) == "ok"
+        sleep.assert_not_called()
+
+    def test_retries_transient_errors(self):
+        """Test transient errors are retried until success."""
+        from meetscribe.utils.retry import retry_with_backoff
+
+        func = MagicMock(side_effect=[_StatusError(429), _StatusError(503), "ok"])
+        sleep = MagicMock()
+
+        assert retry_with_backoff(func, sleep=sleep) == "ok"
+        assert func.call_count == 3
+        assert sleep.call_count == 2
+
+    def test_gives_up_after_max_attempts(self):
+        """Test the last error is raised once attempts are exhausted."""
+        from meetscribe.utils.retry import retry_with_backoff
+
+        func = MagicMock(side_effect=_StatusError(429))
+
+        with pytest.raises(_StatusError):
+            retry_with_backoff(func, max_attempts=3, sleep=MagicMock())
+        assert func.call_count == 3
+
+    def test_does_not_retry_permanent_errors(self):
+        """Test non-retryable errors are raised immediately."""
+        from meetscribe.utils.retry import retry_with_backoff
+
+        func = MagicMock(side_effect=_StatusError(400))
+
+        with pytest.raises(_StatusError):
+            retry_with_backoff(func, sleep=MagicMock())
+        assert func.call_count == 1
+
+    def test_honors_retry_after(self):
+        """Test retry-after hints set a lower bound on the delay."""
+        from meetscribe.utils.retry import retry_with_backoff
+
+        func = MagicMock(side_effect=[_StatusError(429), "ok"])
+        sleep = MagicMock()
+
+        retry_with_backoff(func, get_retry_after=lambda e: 7.0, max_delay=1.0, sleep=sleep)
+
+        sleep.assert_called_once_with(7.0)
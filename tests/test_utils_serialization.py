@@ -0,0 +1,68 @@
+"""
+Tests for meetscribe.utils.serialization module.
+
+Tests JSON serialization with and without orjson.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def serialization(request, monkeypatch):
+    """Provide the serialization module using each backend."""
+    from meetscribe.utils import serialization as module
+
+    if request.param == "orjson":
+        if module.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(module, "orjson", None)
+    return module
+
+
+class TestDumpsJson:
+    """Tests for dumps_json function."""
+
+    def test_roundtrip(self, serialization):
+        """Test data survives serialization."""
+        data = {"summary": "会議", "items": [1, 2.5, None, True]}
+
+        assert json.loads(serialization.dumps_json(data)) == data
+
+    def test_returns_utf8_bytes(self, serialization):
+        """Test output is UTF-8 bytes without ASCII escaping."""
+        result = serialization.dumps_json({"text": "会議"})
+
+        assert isinstance(result, bytes)
+        assert "会議".encode() in result
+
+    def test_indent_matches_stdlib(self, serialization):
+        """Test indented output matches json.dumps(indent=2)."""
+        data = {"a": [1, {"b": "c"}], "d": {}}
+
+        assert serialization.dumps_json(data, indent=True).decode() == json.dumps(data, indent=2)
+
+    def test_datetime_uses_str(self, serialization):
+        """Test non-JSON values are converted with str()."""
+        moment = datetime(2024, 1, 15, 10, 0, 0)
+
+        assert json.loads(serialization.dumps_json({"t": moment})) == {"t": str(moment)}
+
+    def test_large_integer(self, serialization):
+        """Test integers wider than 64 bits are serialized."""
+        assert json.loads(serialization.dumps_json({"n": 2**70})) == {"n": 2**70}
+
+
+class TestLoadsJson:
+    """Tests for loads_json function."""
+
+    def test_loads_bytes(self, serialization):
+        """Test JSON bytes are deserialized."""
+        assert serialization.loads_json(b'{"a": 1}') == {"a": 1}
+
+    def test_loads_str(self, serialization):
+        """Test JSON strings are deserialized."""
+        assert serialization.loads_json('{"a": [1, 2]}') == {"a": [1, 2]}